@@ -0,0 +1,29 @@
+#!/bin/bash
+# Measures the startup time of cpd-trident-protect.py for invocations that do not need a cluster (version, --help,
+# argument errors) and the import time of the cluster modules that the other subcommands load on demand.
+#
+# Usage: ./bench-startup.sh [runs]   (run inside the venv created by venv.sh)
+
+SCRIPT="$(dirname "$0")/cpd-trident-protect.py"
+RUNS=${1:-20}
+
+bench() {
+    local start end
+    start=$(date +%s%N)
+    for _ in $(seq "$RUNS"); do
+        python "$@" > /dev/null 2>&1
+    done
+    end=$(date +%s%N)
+    printf "%-50s %6d ms\n" "$*" $(( (end - start) / RUNS / 1000000 ))
+}
+
+echo "** Average wall time over ${RUNS} runs"
+bench -c "pass"
+bench "$SCRIPT" version
+bench "$SCRIPT" --help
+bench "$SCRIPT" backup create --unknown_flag
+bench -c "import kubernetes.client, kubernetes.dynamic, kubernetes.stream, urllib3, yaml"
+
+echo
+echo "** Slowest imports of the cluster modules (python -X importtime, cumulative microseconds)"
+python -X importtime -c "import kubernetes.client, kubernetes.dynamic, kubernetes.stream, urllib3, yaml" 2>&1 | sort -t "|" -k 2 -n -r | head -n 15
@@ -7,19 +7,44 @@ Use, duplication or disclosure restricted by GSA ADP Schedule
 Contract with IBM Corp.
 """
 
-import argparse, subprocess, shutil, sys, textwrap, uuid, base64, os
-from kubernetes import client, config as k8s_config
-from kubernetes.client import ApiException, ApiClient
-from kubernetes.dynamic import DynamicClient
-from kubernetes.dynamic.exceptions import ResourceNotFoundError
-from kubernetes.stream import stream
+from __future__ import annotations
+
+import argparse, subprocess, shutil, sys, textwrap, uuid, base64, os, socket, socketserver, threading, hashlib, json, re, random, contextlib, io, atexit, collections, shlex
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
+from datetime import datetime, timezone
 import time
 import logging
-import urllib3
-import yaml
 
-urllib3.disable_warnings()
+# the kubernetes client, urllib3 and yaml make up most of the startup time, so they are only imported by
+# _load_cluster_modules() once a subcommand needs a cluster; `version`, `--help` and argument errors do not pay for them
+client = k8s_config = k8s_watch = ApiException = ApiClient = DynamicClient = ResourceNotFoundError = None
+ResourceInstance = ResourceField = stream = EXEC_ERROR_CHANNEL = urllib3 = HTTPConnection = yaml = None
+
+
+def _load_cluster_modules():
+    """Imports the kubernetes client, urllib3 and yaml into the module namespace (no-op once loaded)"""
+    global client, k8s_config, k8s_watch, ApiException, ApiClient, DynamicClient, ResourceNotFoundError
+    global ResourceInstance, ResourceField, stream, EXEC_ERROR_CHANNEL, urllib3, HTTPConnection, yaml
+    if yaml is not None:
+        return
+    from kubernetes import client, config as k8s_config
+    from kubernetes import watch as k8s_watch
+    from kubernetes.client import ApiException, ApiClient
+    from kubernetes.dynamic import DynamicClient
+    from kubernetes.dynamic.exceptions import ResourceNotFoundError
+    from kubernetes.dynamic.resource import ResourceInstance, ResourceField
+    from kubernetes.stream import stream
+    from kubernetes.stream.ws_client import ERROR_CHANNEL as EXEC_ERROR_CHANNEL
+    import urllib3
+    from urllib3.connection import HTTPConnection
+    urllib3.disable_warnings()
+    import yaml
+
+
+def _setup_logging():
+    """Sends the log to cpd-tp.log in the working directory (no-op once set up)"""
+    logging.basicConfig(format="%(asctime)s %(levelname)s:%(message)s", filename="cpd-tp.log", encoding="utf-8", level=logging.DEBUG)
 
 # constants
 CLI_VERSION = "5.4.0"
@@ -34,11 +59,25 @@ CMD_BACKUP_CREATE = "create"
 CMD_BACKUP_STATUS = "status"
 CMD_BACKUP_POSTHOOKS = "posthooks"
 CMD_BACKUP_DELETE = "delete"
+CMD_BACKUP_LIST = "list"
+CMD_BACKUP_CREATE_MANY = "create-many"
+CMD_BACKUP_REPORT = "report"
+CMD_BACKUP_PRUNE = "prune"
+CMD_BACKUP_RECONCILE = "reconcile"
 
 CMD_RESTORE = "restore"
 CMD_RESTORE_CREATE = "create"
 CMD_RESTORE_STATUS = "status"
 
+CMD_DRIFT = "drift"
+
+CMD_EXPORTER = "exporter"
+
+CMD_SERVE = "serve"
+
+CMD_CATALOG = "catalog"
+CMD_CATALOG_SYNC = "sync"
+
 CMD_VERSION = "version"
 
 DEFAULT_TRIDENT_PROTECT_NS = "trident-protect"
@@ -54,11 +93,45 @@ DEFAULT_CPDBR_TENANT_SERVICE_IMG_PREFIX = f"{DEFAULT_PRIVATE_REGISTRY_LOCATION}/
 
 DEFAULT_NAMESPACE_MAPPING_CM_NAME = "cpdbr-trident-protect-namespace-mapping-cm"
 
+# max number of pooled (keep-alive) connections to the Kubernetes API server, overridable via env var
+DEFAULT_K8S_CONNECTION_POOL_MAXSIZE = 16
+ENV_K8S_CONNECTION_POOL_MAXSIZE = "CPD_TP_K8S_CONNECTION_POOL_MAXSIZE"
+
+# API discovery results are cached on disk per cluster and refreshed after the TTL, overridable via env var
+DEFAULT_DISCOVERY_CACHE_TTL_SEC = 6 * 60 * 60
+ENV_DISCOVERY_CACHE_TTL_SEC = "CPD_TP_DISCOVERY_CACHE_TTL_SEC"
+# client-side rate limit (token bucket) of all API requests of the process, 0 QPS disables it; overridable via env vars
+DEFAULT_API_QPS = 20
+DEFAULT_API_BURST = 40
+ENV_API_QPS = "CPD_TP_API_QPS"
+ENV_API_BURST = "CPD_TP_API_BURST"
+# retries of requests rejected with 429 (any verb) or failed with 5xx (safe verbs only), honouring Retry-After
+DEFAULT_API_MAX_RETRIES = 5
+DEFAULT_API_MAX_RETRY_DELAY_SEC = 30
+ENV_API_MAX_RETRIES = "CPD_TP_API_MAX_RETRIES"
+HTTP_TOO_MANY_REQUESTS = 429
+API_RETRIABLE_SERVER_ERRORS = (500, 502, 503, 504)
+# verbs without side effects, the only ones retried after a server error since the first attempt may have been applied
+API_SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+# informer stores only serve reads in long-lived processes (`serve`, `backup create-many`, see
+# KubeClientContext.enable_stores); set to false to serve every read from the API server there too
+ENV_INFORMER_CACHE = "CPD_TP_INFORMER_CACHE"
+# max time a read waits for the first list of an informer store before falling back to the API server
+DEFAULT_INFORMER_SYNC_TIMEOUT_SEC = 10
+
 TRIDENT_PROTECT_STATUS_COMPLETED = "Completed"
 TRIDENT_PROTECT_STATUS_FAILED = "Failed"
 TRIDENT_PROTECT_STATUS_REMOVED = "Removed"
 TRIDENT_PROTECT_STATUS_ERROR = "Error"
 TRIDENT_PROTECT_STATUS_RUNNING = "Running"
+# pseudo state reported by the batched status commands for tracked CRs that do not exist (or no longer exist)
+STATUS_NOT_FOUND = "NotFound"
+
+# possible final state values: Ready, Completed, Available, Failed, Removed, Error
+TRIDENT_PROTECT_TERMINAL_STATES = (TRIDENT_PROTECT_STATUS_COMPLETED, TRIDENT_PROTECT_STATUS_FAILED, TRIDENT_PROTECT_STATUS_REMOVED, TRIDENT_PROTECT_STATUS_ERROR)
+TRIDENT_PROTECT_EHR_TERMINAL_STATES = (TRIDENT_PROTECT_STATUS_COMPLETED, TRIDENT_PROTECT_STATUS_FAILED, TRIDENT_PROTECT_STATUS_REMOVED)
+
+BACKUP_HOOK_RESULTS_FIELDS = ("preSnapshotExecHooksRunResults", "postSnapshotExecHooksRunResults", "postBackupExecHooksRunResults")
 
 TRIDENT_PROTECT_EHR_ACTION_RESTORE = "Restore"
 
@@ -66,9 +139,184 @@ TRIDENT_PROTECT_EHR_STAGE_POST = "Post"
 
 CPD_NAMESPACESCOPE_NAME = "common-service"
 
+TRIDENT_PROTECT_API_VERSION = "protect.trident.netapp.io/v1"
+
+# (api_version, kind) of the API resources used by this tool, resolved once per process by KubeClientContext.resource
+RESOURCE_TP_APPLICATION = (TRIDENT_PROTECT_API_VERSION, "Application")
+RESOURCE_TP_BACKUP = (TRIDENT_PROTECT_API_VERSION, "Backup")
+RESOURCE_TP_BACKUPRESTORE = (TRIDENT_PROTECT_API_VERSION, "BackupRestore")
+RESOURCE_TP_EXECHOOK = (TRIDENT_PROTECT_API_VERSION, "ExecHook")
+RESOURCE_TP_EXECHOOKSRUN = (TRIDENT_PROTECT_API_VERSION, "ExecHooksRun")
+RESOURCE_TP_RESOURCEBACKUP = (TRIDENT_PROTECT_API_VERSION, "ResourceBackup")
+RESOURCE_NAMESPACESCOPE = ("operator.ibm.com/v1", "NamespaceScope")
+RESOURCE_VELERO_BACKUP = ("velero.io/v1", "Backup")
+RESOURCE_CRD = ("apiextensions.k8s.io/v1", "CustomResourceDefinition")
+RESOURCE_LEASE = ("coordination.k8s.io/v1", "Lease")
+
+HTTP_FORBIDDEN = 403
 HTTP_NOT_FOUND = 404
+HTTP_CONFLICT = 409
+HTTP_GONE = 410
+
+# field manager owning the fields of the objects applied by this tool (server-side apply)
+FIELD_MANAGER = "cpd-trident-protect"
+# field managers recorded by `oc apply` / `kubectl apply` in earlier releases of this tool; their fields are taken over on apply
+LEGACY_APPLY_FIELD_MANAGERS = ("oc", "kubectl", "kubectl-client-side-apply")
+# max number of independent objects applied in parallel
+DEFAULT_APPLY_MAX_WORKERS = 4
+
+# number of objects requested per page by paginated list calls
+DEFAULT_LIST_PAGE_SIZE = 250
+# Accept header requesting list responses with metadata only (PartialObjectMetadataList)
+ACCEPT_PARTIAL_OBJECT_METADATA_LIST = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+# Accept header requesting list responses as server-side printed tables (the CRD printer columns, metadata only per row)
+ACCEPT_TABLE = "application/json;as=Table;g=meta.k8s.io;v=v1,application/json"
+
+# output formats of the list subcommands
+LIST_OUTPUT_TABLE = "table"
+LIST_OUTPUT_WIDE = "wide"
+LIST_OUTPUT_NAME = "name"
+LIST_OUTPUT_JSON = "json"
+
+# phases reported by `backup report` as (phase, start events, end events): the first event present in the timeline of a
+# Backup (see TridentProtectManager.get_backup_timeline) is used on each side, "condition:<type>" being the
+# lastTransitionTime of a True status condition
+BACKUP_REPORT_PHASES = (
+    ("pre_snapshot_hooks", ("pre_snapshot_hooks_start",), ("pre_snapshot_hooks_end",)),
+    ("quiesce_window", ("pre_snapshot_hooks_start",), ("post_snapshot_hooks_end",)),
+    ("snapshot", ("pre_snapshot_hooks_end", "condition:SourceSnapshotExists"), ("post_snapshot_hooks_start", "condition:SourceSnapshotCompleted")),
+    ("data_mover", ("post_snapshot_hooks_end", "condition:SourceSnapshotCompleted"), ("condition:VolumeBackupsCompleted", "post_backup_hooks_start")),
+    ("post_backup_hooks", ("post_backup_hooks_start",), ("post_backup_hooks_end",)),
+    ("total", ("created",), ("completed",)),
+)
+BACKUP_REPORT_PERCENTILES = (50, 90, 95)
+# Backup fields read by `backup report` (the only ones transferred when listing from the API server)
+BACKUP_REPORT_FIELDS = ["metadata.name", "metadata.namespace", "metadata.creationTimestamp", "status.state", "status.completionTimestamp", "status.conditions"]
+BACKUP_REPORT_FIELDS += [f"status.{field}" for field in BACKUP_HOOK_RESULTS_FIELDS]
+
+# columns (NAME=JSONPath) of `backup list` when the server does not provide a table or custom columns are requested
+DEFAULT_BACKUP_LIST_COLUMNS = "NAME=.metadata.name,STATE=.status.state,CREATED=.metadata.creationTimestamp,COMPLETED=.status.completionTimestamp,ERROR=.status.error"
+
+# max duration of a single watch request before it is transparently re-established from the last seen resourceVersion
+DEFAULT_WATCH_TIMEOUT_SEC = 300
+
+# default PollingPolicy: first interval, growth factor while nothing changes, interval cap and +/- jitter ratio
+DEFAULT_POLL_INITIAL_INTERVAL_SEC = 1
+DEFAULT_POLL_MULTIPLIER = 2.0
+DEFAULT_POLL_MAX_INTERVAL_SEC = 30
+DEFAULT_POLL_JITTER = 0.2
+# max time status commands keep re-reading a finished CR whose status is not (yet) complete
+DEFAULT_STATUS_SETTLE_TIMEOUT_SEC = 15
+
+# Lease (per CPD operator namespace) held by the backup being created so that only one CPD backup runs at a time;
+# it is renewed while the tool waits for the backup and can be reclaimed once expired and its backup is no longer Running
+BACKUP_LEASE_NAME = "cpdbr-trident-protect-backup"
+DEFAULT_BACKUP_LEASE_DURATION_SEC = 60
+
+# number of tenants processed in parallel by `backup create-many` (preflight, creation, wait)
+DEFAULT_CREATE_MANY_MAX_WORKERS = 8
+# max number of Backups in flight at once across all tenants of `backup create-many`, to protect the storage backend
+DEFAULT_CREATE_MANY_MAX_CONCURRENT_BACKUPS = 4
+# keys accepted per tenant (and under `defaults`) in a `backup create-many` inventory; they mirror the `backup create` arguments
+BACKUP_INVENTORY_REQUIRED_KEYS = ("namespace", "application_name", "appvault_name")
+BACKUP_INVENTORY_OPTIONAL_KEYS = (
+    "backup_name",
+    "data_mover",
+    "pvc_bind_timeout_sec",
+    "reclaim_policy",
+    "snapshot",
+    "data_mover_timeout_sec",
+    "full_backup",
+    "snapshot_completion_timeout",
+    "volume_snapshots_created_timeout",
+    "volume_snapshots_ready_to_use_timeout",
+)
+
+# `backup prune`: number of Trident Protect Backup CRs deleted in parallel, and the units of --older_than (e.g. 30d)
+DEFAULT_PRUNE_MAX_WORKERS = 8
+PRUNE_AGE_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+# `backup reconcile`: categories of Trident Protect Backups / Velero tenant backups that are out of sync, and the
+# phases after which a Velero Backup no longer changes. velero-unknown-tenant tenant backups (orphans whose included
+# namespaces match none of the listed tenants) are only reported, never cleaned up.
+RECONCILE_TP_ONLY = "tp-only"
+RECONCILE_VELERO_ONLY = "velero-only"
+RECONCILE_VELERO_UNKNOWN_TENANT = "velero-unknown-tenant"
+RECONCILE_MATCHED_FAILED = "matched-failed"
+VELERO_BACKUP_PHASE_COMPLETED = "Completed"
+VELERO_BACKUP_TERMINAL_PHASES = (VELERO_BACKUP_PHASE_COMPLETED, "PartiallyFailed", "Failed", "FailedValidation")
+
+# `exporter`: metrics served over HTTP (/metrics) or written as a node-exporter textfile every interval
+DEFAULT_EXPORTER_PORT = 9877
+DEFAULT_EXPORTER_TEXTFILE_INTERVAL_SEC = 60
+# max time the exporter waits for the initial list of its watched collections before serving metrics
+DEFAULT_EXPORTER_SYNC_TIMEOUT_SEC = 60
+EXPORTER_METRIC_PREFIX = "cpd_tp"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# `catalog`: local SQLite catalog (one file per cluster in the user cache directory) of the kinds below; a delta sync
+# replays the watch events since the stored resourceVersion and ends once the server has been idle for IDLE seconds
+CATALOG_FILE_PREFIX = "catalog"
+CATALOG_SCHEMA_VERSION = 2
+CATALOG_KIND_VELERO_BACKUP = "VeleroBackup"
+CATALOG_TP_KINDS = {
+    RESOURCE_TP_BACKUP[1]: RESOURCE_TP_BACKUP,
+}
+# `backup list --catalog`: columns added when the Velero tenant backups are catalogued
+CATALOG_TENANT_BACKUP_COLUMNS = ("TENANT BACKUP", "TENANT PHASE")
+CATALOG_WATCH_IDLE_SEC = 1
+CATALOG_WATCH_TIMEOUT_SEC = 60
+DEFAULT_CATALOG_SYNC_MAX_WORKERS = 8
+
+# `serve`: socket file of the daemon in the user cache directory, and the (command, subcommand) pairs it executes
+DAEMON_SOCKET_NAME = "daemon.sock"
+DAEMON_COMMANDS = (
+    (CMD_BACKUP, CMD_BACKUP_CREATE),
+    (CMD_BACKUP, CMD_BACKUP_STATUS),
+    (CMD_BACKUP, CMD_BACKUP_DELETE),
+    (CMD_BACKUP, CMD_BACKUP_LIST),
+    (CMD_BACKUP, CMD_BACKUP_REPORT),
+    (CMD_RESTORE, CMD_RESTORE_CREATE),
+    (CMD_RESTORE, CMD_RESTORE_STATUS),
+    (CMD_CATALOG, CMD_CATALOG_SYNC),
+)
+
+# pod exec (PodExecRunner): max time `cpdbr-oadp tenant-backup delete` may run in the cpdbr-tenant-service pod, the number
+# of trailing output lines kept for error messages, the longest unterminated line buffered before it is flushed as is,
+# and how often a running exec checks its deadline and cancellation while the command is silent
+DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC = 3600
+DEFAULT_EXEC_OUTPUT_TAIL_LINES = 50
+EXEC_OUTPUT_MAX_LINE_CHARS = 64 * 1024
+EXEC_POLL_INTERVAL_SEC = 1
 
 LABEL_GENERATED_BY_CPDBR="icpdsupport/generated-by-cpdbr=true"
+LABEL_CPDBR = "icpdsupport/cpdbr"
+
+# CRDs of Cloud Pak for Data labeled with icpdsupport/cpdbr=true to be backed up together with the trident protect volume backup
+CPD_MAIN_CRDS = (
+    "catalogsources.operators.coreos.com",
+    "namespacescopes.operator.ibm.com",
+    "commonservices.operator.ibm.com",
+    "operatorgroups.operators.coreos.com",
+)
+
+ANNOTATION_DATA_MOVER_TIMEOUT_SEC = "protect.trident.netapp.io/data-mover-timeout-sec"
+ANNOTATION_SNAPSHOT_COMPLETION_TIMEOUT = "protect.trident.netapp.io/snapshot-completion-timeout"
+ANNOTATION_VOLUME_SNAPSHOTS_CREATED_TIMEOUT = "protect.trident.netapp.io/volume-snapshots-created-timeout"
+ANNOTATION_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT = "protect.trident.netapp.io/volume-snapshots-ready-to-use-timeout"
+ANNOTATION_PVC_BIND_TIMEOUT_SEC = "protect.trident.netapp.io/pvc-bind-timeout-sec"
+ANNOTATION_FULL_BACKUP = "protect.trident.netapp.io/full-backup"
+# sha256 of the rendered manifest stamped on the ExecHooks applied by this tool, used to detect out-of-date hooks
+ANNOTATION_CONTENT_HASH = "cpdbr.cpd.ibm.com/content-hash"
+
+# ExecHook drift states reported by upgrade and drift
+DRIFT_STATE_UP_TO_DATE = "UpToDate"
+DRIFT_STATE_OUT_OF_DATE = "OutOfDate"
+DRIFT_STATE_MISSING = "Missing"
+
+# backends creating and deleting Trident Protect Backup/BackupRestore CRs
+CR_BACKEND_TRIDENTCTL = "tridentctl"
+CR_BACKEND_NATIVE = "native"
 
 
 LABEL_TENANT_BACKUP_VENDOR = "cpdbr.cpd.ibm.com/vendor-backup"
@@ -76,7 +324,6 @@ LABEL_TENANT_BACKUP_VENDOR_BACKUP_NAME = "cpdbr.cpd.ibm.com/vendor-backup-name"
 
 
 log = logging.getLogger(__name__)
-logging.basicConfig(format="%(asctime)s %(levelname)s:%(message)s", filename="cpd-tp.log", encoding="utf-8", level=logging.DEBUG)
 
 
 class ExecHookScripts:
@@ -333,24 +580,20 @@ class YamlTemplates:
     )
 
     @staticmethod
-    def oc_apply_yaml_from_string(yaml: str):
-        """Applies a YAML manifest from the provided string via oc apply
-
-        Args:
-            yaml (str): YAML manifest to apply
-
-        Raises:
-            Exception: If OpenShift CLI (oc) fails to apply the provided YAML manifest
+    def get_content_hash(body: dict) -> str:
+        """Returns the sha256 hash of a manifest body, ignoring the ANNOTATION_CONTENT_HASH annotation itself"""
+        annotations = dict((body.get("metadata") or {}).get("annotations") or {})
+        annotations.pop(ANNOTATION_CONTENT_HASH, None)
+        metadata = dict(body.get("metadata") or {}, annotations=annotations)
+        canonical = json.dumps(dict(body, metadata=metadata), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
-        Returns:
-            str: stdout of the executed oc apply command
-        """
-        command = ["oc", "apply", "-f", "-"]
-        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate(input=yaml.encode())
-        if process.returncode != 0:
-            raise Exception(f"Error applying yaml: {stderr.decode()}")
-        return stdout.decode()
+    @staticmethod
+    def stamp_content_hash(manifest: str) -> str:
+        """Returns the YAML manifest with its content hash stored in the ANNOTATION_CONTENT_HASH annotation"""
+        body = yaml.safe_load(manifest)
+        body["metadata"].setdefault("annotations", {})[ANNOTATION_CONTENT_HASH] = YamlTemplates.get_content_hash(body)
+        return yaml.safe_dump(body, sort_keys=False)
 
     @staticmethod
     def get_template_yaml_trident_protect_application(
@@ -418,7 +661,7 @@ class YamlTemplates:
 
         encoded_str = ExecHookScripts.get_encoded_script_for_pre_backup()
 
-        return YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_PRE_SNAPSHOT.format(
+        manifest = YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_PRE_SNAPSHOT.format(
             TRIDENT_PROTECT_OPERATOR_NAMESPACE=trident_protect_operator_ns,
             TRIDENT_PROTECT_APPLICATION_NAME=application_name,
             PROJECT_CPD_INST_OPERATORS=cpd_operator_ns,
@@ -426,6 +669,7 @@ class YamlTemplates:
             CPDBR_HOOK_SOURCE=encoded_str,
             TRIDENT_PROTECT_EXEC_HOOK_TIMEOUT=exec_hook_timeout,
         )
+        return YamlTemplates.stamp_content_hash(manifest)
 
     @staticmethod
     def get_template_yaml_trident_protect_exechook_post_snapshot(
@@ -439,7 +683,7 @@ class YamlTemplates:
 
         encoded_str = ExecHookScripts.get_encoded_script_for_post_backup()
 
-        return YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_POST_SNAPSHOT.format(
+        manifest = YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_POST_SNAPSHOT.format(
             TRIDENT_PROTECT_OPERATOR_NAMESPACE=trident_protect_operator_ns,
             TRIDENT_PROTECT_APPLICATION_NAME=application_name,
             PROJECT_CPD_INST_OPERATORS=cpd_operator_ns,
@@ -447,6 +691,7 @@ class YamlTemplates:
             CPDBR_HOOK_SOURCE=encoded_str,
             TRIDENT_PROTECT_EXEC_HOOK_TIMEOUT=exec_hook_timeout,
         )
+        return YamlTemplates.stamp_content_hash(manifest)
 
     @staticmethod
     def get_template_yaml_trident_protect_exechook_post_backup(
@@ -460,7 +705,7 @@ class YamlTemplates:
 
         encoded_str = ExecHookScripts.get_encoded_script_for_post_backup_validations()
 
-        return YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_POST_BACKUP.format(
+        manifest = YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_POST_BACKUP.format(
             TRIDENT_PROTECT_OPERATOR_NAMESPACE=trident_protect_operator_ns,
             TRIDENT_PROTECT_APPLICATION_NAME=application_name,
             PROJECT_CPD_INST_OPERATORS=cpd_operator_ns,
@@ -468,6 +713,7 @@ class YamlTemplates:
             CPDBR_HOOK_SOURCE=encoded_str,
             TRIDENT_PROTECT_EXEC_HOOK_TIMEOUT=exec_hook_timeout,
         )
+        return YamlTemplates.stamp_content_hash(manifest)
 
     @staticmethod
     def get_template_yaml_trident_protect_exechook_post_restore(
@@ -481,7 +727,7 @@ class YamlTemplates:
 
         encoded_str = ExecHookScripts.get_encoded_script_for_post_restore()
 
-        return YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_POST_RESTORE.format(
+        manifest = YamlTemplates.TEMPLATE_YAML_TRIDENT_PROTECT_EXECHOOK_POST_RESTORE.format(
             TRIDENT_PROTECT_OPERATOR_NAMESPACE=trident_protect_operator_ns,
             TRIDENT_PROTECT_APPLICATION_NAME=application_name,
             PROJECT_CPD_INST_OPERATORS=cpd_operator_ns,
@@ -489,6 +735,7 @@ class YamlTemplates:
             CPDBR_HOOK_SOURCE=encoded_str,
             TRIDENT_PROTECT_EXEC_HOOK_TIMEOUT=exec_hook_timeout,
         )
+        return YamlTemplates.stamp_content_hash(manifest)
 
 
 class TextColor:
@@ -517,8 +764,331 @@ class TextColor:
         return f"{TextColor.YELLOW_TEXT}{text}{TextColor.RESET_TEXT}"
 
 
+class ThreadOutputRouter:
+    """sys.stdout replacement that lets worker threads capture what they print
+
+    Threads inside `capture()` write to their own buffer so the output of concurrent tasks does not interleave;
+    all other threads write through to the original stream.
+    """
+
+    _local = threading.local()
+    _lock = threading.Lock()
+
+    def __init__(self, stream) -> None:
+        self.stream = stream
+
+    def write(self, data: str):
+        buffer = getattr(ThreadOutputRouter._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(data)
+        with ThreadOutputRouter._lock:
+            return self.stream.write(data)
+
+    def flush(self):
+        if getattr(ThreadOutputRouter._local, "buffer", None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    @staticmethod
+    def install(stream_name: str = "stdout") -> "ThreadOutputRouter":
+        """Replaces sys.stdout (or sys.stderr) with a router, once"""
+        if not isinstance(getattr(sys, stream_name), ThreadOutputRouter):
+            setattr(sys, stream_name, ThreadOutputRouter(getattr(sys, stream_name)))
+        return getattr(sys, stream_name)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def capture(buffer: io.StringIO):
+        """Routes everything the calling thread prints to `buffer` until the context exits"""
+        ThreadOutputRouter.install()
+        previous = getattr(ThreadOutputRouter._local, "buffer", None)
+        ThreadOutputRouter._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            ThreadOutputRouter._local.buffer = previous
+
+    @staticmethod
+    def emit(text: str):
+        """Writes text to the original stream in one piece, also from a capturing thread"""
+        router = ThreadOutputRouter.install()
+        with ThreadOutputRouter._lock:
+            router.stream.write(text if text.endswith("\n") else text + "\n")
+            router.stream.flush()
+
+
+class Profiler:
+    """Process-wide, opt-in timing of phases, Kubernetes API calls and subprocesses (`--profile`)
+
+    Spans are only recorded once `enable()` was called, so instrumented code costs a flag check otherwise. API calls
+    are captured by wrapping the REST client of the shared ApiClient and also count request and response bytes.
+    """
+
+    _enabled = False
+    _lock = threading.Lock()
+    _spans = []
+    _t0 = time.perf_counter()
+    _wall_t0 = time.time()
+
+    @staticmethod
+    def enable():
+        Profiler._enabled = True
+        Profiler._t0 = time.perf_counter()
+        Profiler._wall_t0 = time.time()
+
+    @staticmethod
+    def enabled() -> bool:
+        return Profiler._enabled
+
+    @staticmethod
+    def record(name: str, cat: str, start: float, end: float, args: dict = None):
+        """Records a finished span (start/end from time.perf_counter())"""
+        span = {"name": name, "cat": cat, "start": start - Profiler._t0, "dur": end - start, "tid": threading.get_ident(), "args": args or {}}
+        with Profiler._lock:
+            Profiler._spans.append(span)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def span(name: str, cat: str = "phase", **args):
+        """Times the enclosed block as one span"""
+        if not Profiler._enabled:
+            yield args
+            return
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            Profiler.record(name, cat, start, time.perf_counter(), args)
+
+    @staticmethod
+    def traced(name: str = None, cat: str = "phase"):
+        """Decorator timing every call of a function as one span (named after the function by default)"""
+        def decorator(fn):
+            span_name = name or fn.__qualname__
+
+            def wrapper(*args, **kwargs):
+                if not Profiler._enabled:
+                    return fn(*args, **kwargs)
+                with Profiler.span(span_name, cat):
+                    return fn(*args, **kwargs)
+
+            wrapper.__name__ = fn.__name__
+            wrapper.__qualname__ = fn.__qualname__
+            wrapper.__doc__ = fn.__doc__
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def instrument_api_client(api_client: ApiClient):
+        """Wraps the REST client of api_client so that every API request is recorded as an "api" span"""
+        rest_client = api_client.rest_client
+        request = rest_client.request
+        host = api_client.configuration.host
+
+        def profiled_request(method, url, query_params=None, headers=None, body=None, post_params=None, _preload_content=True, _request_timeout=None):
+            start = time.perf_counter()
+            path = url[len(host):] if url.startswith(host) else url
+            watching = any(k == "watch" and v for k, v in (query_params or []))
+            args = {"method": method, "path": path, "watch": watching, "sent_bytes": Profiler._body_size(body), "received_bytes": 0}
+            try:
+                resp = request(method, url, query_params=query_params, headers=headers, body=body, post_params=post_params, _preload_content=_preload_content, _request_timeout=_request_timeout)
+                args["status"] = resp.status
+                if not watching:
+                    # reading the body here is transparent to the caller: urllib3 keeps it for the later `.data` access
+                    args["received_bytes"] = len(resp.data or b"")
+                return resp
+            except ApiException as e:
+                args["status"] = e.status
+                args["received_bytes"] = len(e.body or b"")
+                raise
+            finally:
+                Profiler.record(f"{method} {re.sub(r'/namespaces/[^/]+', '/namespaces/{ns}', path)}", "api", start, time.perf_counter(), args)
+
+        rest_client.request = profiled_request
+
+    @staticmethod
+    def _body_size(body) -> int:
+        if body is None:
+            return 0
+        if isinstance(body, (bytes, str)):
+            return len(body)
+        try:
+            return len(json.dumps(body, default=str))
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def print_report(top: int = 25):
+        """Prints the wall time, the slowest span names by total time and the API call totals"""
+        wall = time.perf_counter() - Profiler._t0
+        with Profiler._lock:
+            spans = list(Profiler._spans)
+        by_name = {}
+        for span in spans:
+            entry = by_name.setdefault((span["cat"], span["name"]), [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += span["dur"]
+            entry[2] = max(entry[2], span["dur"])
+        api_spans = [span for span in spans if span["cat"] == "api"]
+
+        print()
+        print(TextColor.blue(f"** Profile (wall time {wall:.3f}s, {len(spans)} span(s)):"))
+        rows = [
+            [cat, name, count, f"{total:.3f}", f"{total / count * 1000:.1f}", f"{longest * 1000:.1f}"]
+            for (cat, name), (count, total, longest) in sorted(by_name.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        ]
+        TridentProtectManager.print_table(["CATEGORY", "NAME", "COUNT", "TOTAL_S", "MEAN_MS", "MAX_MS"], rows, "profile")
+        print()
+        print(
+            f"API calls: {len(api_spans)} ({sum(1 for span in api_spans if span['args'].get('watch'))} watch), "
+            f"time {sum(span['dur'] for span in api_spans):.3f}s, "
+            f"sent {sum(span['args'].get('sent_bytes', 0) for span in api_spans)} bytes, "
+            f"received {sum(span['args'].get('received_bytes', 0) for span in api_spans)} bytes"
+        )
+        if KubeClientContext._instance is not None:
+            print(KubeClientContext._instance.rate_limiter.summary())
+
+    @staticmethod
+    def report(command: str, trace_file: str = ""):
+        """Closes the span of the whole command, prints the report and writes the Chrome trace if requested"""
+        Profiler.record(command, "command", Profiler._t0, time.perf_counter())
+        Profiler.print_report()
+        if trace_file:
+            try:
+                Profiler.write_chrome_trace(trace_file)
+                print(f"Chrome trace written to {trace_file}")
+            except OSError as e:
+                print(TextColor.red(f"Error writing Chrome trace to {trace_file}: {e}"))
+
+    @staticmethod
+    def write_chrome_trace(path: str):
+        """Writes all spans as a Chrome trace (chrome://tracing, Perfetto) JSON file"""
+        with Profiler._lock:
+            spans = list(Profiler._spans)
+        pid = os.getpid()
+        events = [
+            {"name": span["name"], "cat": span["cat"], "ph": "X", "ts": round(span["start"] * 1e6), "dur": round(span["dur"] * 1e6), "pid": pid, "tid": span["tid"], "args": span["args"]}
+            for span in spans
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"startTime": Profiler._wall_t0, "version": CLI_VERSION}}, f, default=str)
+
+
+class ApiRateLimiter:
+    """Token bucket limiting the rate of all API requests of the process, with retries of throttled requests
+
+    Every request takes a token first; tokens refill at `qps` up to `burst`, so short bursts go out immediately
+    and sustained parallel load is spread out before it reaches API Priority and Fairness. Requests rejected with
+    429 are retried for any verb (the server did not execute them), 5xx responses only for API_SAFE_METHODS. The
+    delay is the Retry-After header of the response when present, otherwise an exponential backoff with jitter.
+    """
+
+    def __init__(self, qps: float, burst: int, max_retries: int = DEFAULT_API_MAX_RETRIES, max_retry_delay: float = DEFAULT_API_MAX_RETRY_DELAY_SEC) -> None:
+        if qps < 0 or burst < 1 or max_retries < 0:
+            raise ValueError(f"invalid API rate limit (qps={qps}, burst={burst}, max_retries={max_retries})")
+        self.qps = qps
+        self.burst = burst
+        self.max_retries = max_retries
+        self.max_retry_delay = max_retry_delay
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "rate_limited": 0, "rate_limited_sec": 0.0, "retries_429": 0, "retries_5xx": 0, "retry_delay_sec": 0.0}
+
+    def __repr__(self) -> str:
+        return f"ApiRateLimiter(qps={self.qps}, burst={self.burst}, max_retries={self.max_retries})"
+
+    @staticmethod
+    def from_env() -> "ApiRateLimiter":
+        return ApiRateLimiter(
+            qps=float(os.environ.get(ENV_API_QPS, DEFAULT_API_QPS)),
+            burst=int(os.environ.get(ENV_API_BURST, DEFAULT_API_BURST)),
+            max_retries=int(os.environ.get(ENV_API_MAX_RETRIES, DEFAULT_API_MAX_RETRIES)),
+        )
+
+    def _count(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] += value
+
+    def acquire(self) -> float:
+        """Takes a token, sleeping until one is available; returns the seconds waited"""
+        with self._lock:
+            self.counters["requests"] += 1
+            if self.qps == 0:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps)
+            self._last = now
+            # the token is reserved even if it is not there yet, so waiters are served in arrival order
+            self._tokens -= 1
+            wait = -self._tokens / self.qps if self._tokens < 0 else 0.0
+            if wait:
+                self.counters["rate_limited"] += 1
+                self.counters["rate_limited_sec"] += wait
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def retry_delay(self, e: ApiException, method: str, attempt: int) -> float:
+        """Returns the seconds to wait before retrying a failed request, None if it must not be retried"""
+        if attempt >= self.max_retries:
+            return None
+        if e.status == HTTP_TOO_MANY_REQUESTS:
+            counter = "retries_429"
+        elif e.status in API_RETRIABLE_SERVER_ERRORS and method.upper() in API_SAFE_METHODS:
+            counter = "retries_5xx"
+        else:
+            return None
+        retry_after = (e.headers or {}).get("Retry-After")
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = min(self.max_retry_delay, 2 ** attempt) * random.uniform(0.5, 1)
+        delay = min(max(delay, 0.0), self.max_retry_delay)
+        self._count(counter)
+        self._count("retry_delay_sec", delay)
+        return delay
+
+    def install(self, api_client: ApiClient):
+        """Wraps the REST client of api_client so that every API request is rate limited and retried"""
+        rest_client = api_client.rest_client
+        request = rest_client.request
+
+        def limited_request(method, url, query_params=None, headers=None, body=None, post_params=None, _preload_content=True, _request_timeout=None):
+            attempt = 0
+            while True:
+                self.acquire()
+                try:
+                    return request(method, url, query_params=query_params, headers=headers, body=body, post_params=post_params, _preload_content=_preload_content, _request_timeout=_request_timeout)
+                except ApiException as e:
+                    delay = self.retry_delay(e, method, attempt)
+                    if delay is None:
+                        raise
+                    attempt += 1
+                    log.warning(f"{method} {url} failed with {e.status} {e.reason}, retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                    time.sleep(delay)
+
+        rest_client.request = limited_request
+
+    def snapshot(self) -> dict:
+        """Returns a copy of the counters"""
+        with self._lock:
+            return dict(self.counters)
+
+    def summary(self) -> str:
+        c = self.snapshot()
+        return (
+            f"API rate limiter ({self.qps} qps, burst {self.burst}): {c['requests']} request(s), "
+            f"{c['rate_limited']} delayed for {c['rate_limited_sec']:.3f}s, "
+            f"{c['retries_429']} retried after 429, {c['retries_5xx']} retried after 5xx, retry delays {c['retry_delay_sec']:.3f}s"
+        )
+
+
 class Path:
     @staticmethod
+    @Profiler.traced(cat="preflight")
     def check_oc_installed():
         """Checks if OpenShift CLI (oc) is available in the system PATH
 
@@ -531,6 +1101,7 @@ class Path:
         return
 
     @staticmethod
+    @Profiler.traced(cat="preflight")
     def check_tridentctl_installed():
         """Checks if Trident CLI (tridentctl-protect) is available in the system PATH
 
@@ -543,6 +1114,7 @@ class Path:
         return
 
     @staticmethod
+    @Profiler.traced(cat="preflight")
     def check_trident_protect_plugin_installed():
         """Checks if Trident Protect plugin is installed
 
@@ -554,69 +1126,648 @@ class Path:
         commandStr = " ".join(command)
         log.info(f"executing command: {commandStr}\n")
 
-        process = subprocess.Popen(command)
-        return_code = process.wait()
+        with Profiler.span(commandStr, "subprocess"):
+            process = subprocess.Popen(command)
+            return_code = process.wait()
         if return_code != 0:
             raise RuntimeError(f"Trident Protect CLI Command exited with non-zero return code {return_code}:\n\n`{commandStr}`\n\n")
         return
 
 
-class Condition:
+    @staticmethod
+    def cache_successful_checks():
+        """Makes each check run only until it first succeeds, for long-lived processes whose PATH and plugins do not change"""
+        passed = set()
+        for name in ("check_oc_installed", "check_tridentctl_installed", "check_trident_protect_plugin_installed"):
+            def check_once(name=name, check=getattr(Path, name)):
+                if name not in passed:
+                    check()
+                    passed.add(name)
+            setattr(Path, name, staticmethod(check_once))
+
+
+class PollingPolicy:
+    """Adaptive polling schedule shared by all waiters
+
+    The interval starts at `initial`, grows by `multiplier` up to `max_interval` while the observed phase stays the
+    same, and drops back to `initial` as soon as the phase changes, so short operations and phase transitions
+    (e.g. into the final hooks of a backup) are picked up promptly while long data mover phases are polled
+    rarely. Every interval is randomized by +/- `jitter` so that concurrent waiters do not poll in lockstep,
+    and is capped by the overall `deadline` (seconds from creation, None for no deadline).
+    """
 
-    def __init__(self, name: str, fn: Callable, *args, **kwargs) -> None:
-        if not callable(fn):
-            raise ValueError("The Condition function must be callable")
+    def __init__(
+        self,
+        initial: float = DEFAULT_POLL_INITIAL_INTERVAL_SEC,
+        multiplier: float = DEFAULT_POLL_MULTIPLIER,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL_SEC,
+        jitter: float = DEFAULT_POLL_JITTER,
+        deadline: float = None,
+    ) -> None:
+        if initial <= 0 or multiplier < 1 or max_interval < initial or not 0 <= jitter < 1:
+            raise ValueError(f"invalid polling policy (initial={initial}, multiplier={multiplier}, max_interval={max_interval}, jitter={jitter})")
+        self.initial = initial
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.deadline = deadline
+        self.reset()
 
-        self.name = name
-        self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
+    def __repr__(self) -> str:
+        return f"PollingPolicy(initial={self.initial}, multiplier={self.multiplier}, max_interval={self.max_interval}, jitter={self.jitter}, deadline={self.deadline})"
 
-        self.last_check = False
+    def reset(self):
+        """Restarts the deadline and the interval progression"""
+        self.started = time.monotonic()
+        self.interval = None
+        self.phase = None
 
-    def __str__(self) -> str:
-        return f"Condition (name: {self.name}, last_check: {self.last_check})"
+    def copy(self) -> "PollingPolicy":
+        """Returns a new policy with the same parameters and fresh state"""
+        return PollingPolicy(self.initial, self.multiplier, self.max_interval, self.jitter, self.deadline)
 
-    def __repr__(self) -> str:
-        return self.__str__()
+    def remaining(self) -> float:
+        """Returns the seconds left until the deadline (None without deadline)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - (time.monotonic() - self.started))
+
+    def expired(self) -> bool:
+        return self.deadline is not None and self.remaining() <= 0
+
+    def restart_backoff(self) -> None:
+        """Restarts the interval progression at the initial interval, keeping the deadline
+
+        Used by error backoffs (e.g. of a watch) once the operation succeeds again, so the next error is retried
+        promptly.
+        """
+        self.interval = None
+
+    def observe(self, phase) -> None:
+        """Records the current phase of the awaited object; a phase change restarts polling at the initial interval"""
+        if phase != self.phase:
+            self.phase = phase
+            self.interval = None
+
+    def next_interval(self) -> float:
+        """Returns the next (jittered) interval to sleep and advances the progression"""
+        self.interval = self.initial if self.interval is None else min(self.interval * self.multiplier, self.max_interval)
+        interval = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        remaining = self.remaining()
+        return interval if remaining is None else min(interval, remaining)
+
+    def sleep(self, what: str = "condition") -> float:
+        """Sleeps for the next interval
 
-    def check(self) -> bool:
-        self.last_check = bool(self.fn(*self.args, **self.kwargs))
-        return self.last_check
+        Raises:
+            TimeoutError: If the deadline has passed
+
+        Returns:
+            float: the slept interval in seconds
+        """
+        if self.expired():
+            raise TimeoutError(f"timed out ({self.deadline}s) while waiting for {what}")
+        interval = self.next_interval()
+        time.sleep(interval)
+        return interval
 
 
-def wait_for_condition(
-    condition: Condition,
+def watch_for_condition(
+    resource_api: object,
+    name: str,
+    namespace: str,
+    predicate: Callable,
     timeout: int = None,
     interval: int = 1,
-    fail_on_api_error: bool = True,
-) -> None:
-    """Wait for a condition to be met."""
-    log.info(f"waiting for condition: {condition}")
+    policy: PollingPolicy = None,
+) -> object:
+    """Wait for a named resource to satisfy a predicate using a Kubernetes watch stream
+
+    The current state of the resource is read with a single list call (field-selected on the resource name),
+    which also provides the resourceVersion a watch is then opened from. Every subsequent change of the resource
+    is delivered by the watch as soon as it happens, so no polling is done while the resource is unchanged.
+    When the server closes the watch, it is resumed from the last seen resourceVersion; when that resourceVersion
+    has expired (410 Gone), the resource is re-listed.
+
+    Args:
+        resource_api: DynamicClient resource of the watched kind
+        name: Name of the resource to watch
+        namespace: Namespace of the resource to watch
+        predicate: Callable receiving the ResourceInstance and returning True once the wait is over
+        timeout: Max time in seconds to wait (default: no timeout)
+        interval: Initial time in seconds to back off before re-listing after an unexpected watch error
+        policy: Backoff policy for consecutive watch errors (default: exponential from `interval`, with jitter)
+
+    Raises:
+        TimeoutError: If the predicate is not satisfied within the timeout
+
+    Returns:
+        The ResourceInstance that satisfied the predicate
+    """
+    log.info(f"watching {resource_api.kind} {name} (namespace={namespace}) until condition is met")
+
+    if policy is None:
+        policy = PollingPolicy(initial=interval, max_interval=max(interval, DEFAULT_POLL_MAX_INTERVAL_SEC), deadline=timeout)
 
     max_time = None
     if timeout is not None:
         max_time = time.time() + timeout
 
-    # start the wait block
+    field_selector = f"metadata.name={name}"
+    resource_version = None
     start = time.time()
     while True:
-        if max_time and time.time() >= max_time:
-            raise TimeoutError(f"timed out ({timeout}s) while waiting for condition {condition}")
+        # jitter the watch duration, so that concurrent watchers do not re-establish their watches in lockstep
+        watch_timeout = int(DEFAULT_WATCH_TIMEOUT_SEC * random.uniform(1 - DEFAULT_POLL_JITTER, 1))
+        if max_time:
+            remaining = max_time - time.time()
+            if remaining <= 0:
+                raise TimeoutError(f"timed out ({timeout}s) while watching {resource_api.kind} {name} (namespace={namespace})")
+            watch_timeout = max(1, min(watch_timeout, int(remaining)))
 
-        # check condition
         try:
-            if condition.check():
-                break
+            if resource_version is None:
+                res = resource_api.get(namespace=namespace, field_selector=field_selector)
+                resource_version = res.metadata.resourceVersion
+                policy.restart_backoff()
+                for obj in res.items:
+                    if predicate(obj):
+                        log.info(f"wait completed (total={time.time()-start}s) {resource_api.kind} {name}")
+                        return obj
+
+            log.info(f"opening watch on {resource_api.kind} {name} (namespace={namespace}, resource_version={resource_version}, timeout={watch_timeout}s)")
+            watcher = k8s_watch.Watch()
+            for event in watcher.stream(
+                resource_api.get,
+                namespace=namespace,
+                field_selector=field_selector,
+                resource_version=resource_version,
+                timeout_seconds=watch_timeout,
+                query_params=[("allowWatchBookmarks", "true")],
+                serialize=False,
+                _request_timeout=(30, watch_timeout + 30),
+            ):
+                raw_object = event["raw_object"]
+                resource_version = raw_object.get("metadata", {}).get("resourceVersion") or resource_version
+                if event["type"] == "BOOKMARK":
+                    continue
+                if event["type"] == "DELETED":
+                    log.info(f"{resource_api.kind} {name} was deleted while waiting")
+                    continue
+
+                # the watch is healthy again, so the next error starts backing off from the initial interval
+                policy.restart_backoff()
+                obj = ResourceInstance(resource_api, raw_object)
+                if predicate(obj):
+                    watcher.stop()
+                    log.info(f"wait completed (total={time.time()-start}s) {resource_api.kind} {name}")
+                    return obj
         except ApiException as e:
-            log.warning(f"got api exception while waiting: {e}")
-            if fail_on_api_error:
-                raise
+            if e.status == HTTP_GONE:
+                log.info(f"resourceVersion {resource_version} expired while watching {resource_api.kind} {name}, re-listing")
+                resource_version = None
+                continue
+            log.warning(f"got api exception while watching {resource_api.kind} {name}: {e}")
+            resource_version = None
+            policy.sleep(f"{resource_api.kind} {name}")
+        except Exception as e:
+            log.warning(f"watch of {resource_api.kind} {name} interrupted: {e}")
+            resource_version = None
+            policy.sleep(f"{resource_api.kind} {name}")
 
-        time.sleep(interval)
 
-    end = time.time()
-    log.info(f"wait completed (total={end-start}s) {condition}")
+def project_fields(obj: dict, fields: list[str]) -> ResourceField:
+    """Returns only the given dotted field paths (e.g. ["metadata.name", "status.state"]) of a raw API object
+
+    The result supports the same attribute access as a ResourceInstance (e.g. `obj.status.state`); fields missing from
+    the object are left out.
+    """
+    projected = {}
+    for field in fields:
+        keys = field.split(".")
+        value = obj
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is None:
+            continue
+        target = projected
+        for key in keys[:-1]:
+            target = target.setdefault(key, {})
+        target[keys[-1]] = value
+
+    def to_resource_field(value):
+        if isinstance(value, dict):
+            return ResourceField({k: to_resource_field(v) for k, v in value.items()})
+        if isinstance(value, list):
+            return [to_resource_field(v) for v in value]
+        return value
+
+    return to_resource_field(projected)
+
+
+def jsonpath_lite_tokens(path: str) -> list[str]:
+    """Splits a JSONPath of the subset evaluated by jsonpath_lite into keys and `[...]` tokens
+
+    Raises:
+        ValueError: If the path uses anything else, e.g. filters (`[?(@.type=="Ready")]`) or slices (`[-1:]`)
+    """
+    expression = path.strip()
+    if expression.startswith("{") and expression.endswith("}"):
+        expression = expression[1:-1]
+    expression = expression.lstrip("$").lstrip(".")
+    tokens = re.findall(r"[^.\[\]]+|\[[^\]]*\]", expression)
+    unsupported = [token for token in tokens if token.startswith("[") and not re.fullmatch(r"\[(\*|-?\d+)\]", token.replace(" ", ""))]
+    if unsupported or re.sub(r"[^.\[\]]+|\[[^\]]*\]", "", expression).strip("."):
+        detail = f'"{unsupported[0]}" is not supported, ' if unsupported else ""
+        raise ValueError(f'unsupported JSONPath "{path}": {detail}only keys, list indexes ([0], [-1]) and wildcards ([*]) are supported')
+    return tokens
+
+
+def jsonpath_lite(obj: dict, path: str):
+    """Evaluates a JSONPath subset against a raw API object
+
+    Supported are dotted keys with an optional leading `$`/`.` or surrounding `{}` (e.g. `{.status.state}`),
+    list indexes (`.status.hookResults[0].name`) and wildcards (`.status.hookResults[*].name`, returning a list).
+
+    Raises:
+        ValueError: If the path is not of this subset (see jsonpath_lite_tokens)
+
+    Returns:
+        The selected value, a list of values for wildcard paths, or None if the path does not exist
+    """
+    values = [obj]
+    wildcard = False
+    for token in jsonpath_lite_tokens(path):
+        selected = []
+        for value in values:
+            if token.startswith("["):
+                if not isinstance(value, list):
+                    continue
+                index = token[1:-1].strip()
+                if index == "*":
+                    wildcard = True
+                    selected.extend(value)
+                elif -len(value) <= int(index) < len(value):
+                    selected.append(value[int(index)])
+            elif isinstance(value, dict) and token in value:
+                selected.append(value[token])
+        values = selected
+
+    if wildcard:
+        return values
+    return values[0] if values else None
+
+
+def parse_k8s_timestamp(value: str) -> datetime:
+    """Parses a Kubernetes Time/MicroTime string (e.g. 2024-05-01T10:00:00Z), returns None for empty or invalid values"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value).split(".")[0].rstrip("Z"), "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Returns the p-th percentile (nearest rank) of values, None if empty"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+def format_duration(seconds: float) -> str:
+    """Formats seconds as e.g. 1h02m03s, 4m05s or 6s"""
+    if seconds is None:
+        return ""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m{secs:02d}s"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+def parse_list_columns(columns: str) -> list[tuple]:
+    """Parses `NAME=JSONPath` pairs separated by commas into a list of (name, path) tuples
+
+    Raises:
+        ValueError: If a column is not of the form NAME=JSONPath or its path is not supported by jsonpath_lite
+    """
+    parsed = []
+    for column in columns.split(","):
+        name, sep, path = column.partition("=")
+        if not sep or not name.strip() or not path.strip():
+            raise ValueError(f'invalid column "{column}", expected NAME=JSONPath (e.g. STATE=.status.state)')
+        jsonpath_lite_tokens(path)
+        parsed.append((name.strip(), path.strip()))
+    return parsed
+
+
+def _table_page(page: dict) -> ResourceField:
+    """Converts a meta.k8s.io/v1 Table list page into {"items", "metadata"}, one item per row with its cells by column name
+
+    RuntimeError is raised for a non-Table page (a ValueError raised by a serializer is swallowed by the DynamicClient).
+    """
+    if page.get("kind") != "Table":
+        raise RuntimeError(f'expected a Table response, received kind "{page.get("kind")}"')
+    columns = page.get("columnDefinitions") or []
+    names = [column["name"] for column in columns]
+    items = []
+    for row in page.get("rows") or []:
+        metadata = (row.get("object") or {}).get("metadata") or {}
+        items.append(ResourceField({"columns": columns, "cells": dict(zip(names, row.get("cells") or [])), "metadata": ResourceField(metadata)}))
+    return ResourceField({"items": items, "metadata": ResourceField(page.get("metadata") or {})})
+
+
+def list_in_pages(
+    resource_api: object,
+    namespace: str = None,
+    label_selector: str = None,
+    field_selector: str = None,
+    page_size: int = DEFAULT_LIST_PAGE_SIZE,
+    metadata_only: bool = False,
+    fields: list[str] = None,
+    as_table: bool = False,
+    jsonpaths: list[tuple] = None,
+):
+    """Lists resources in pages of at most page_size objects using limit/continue, yielding one object at a time
+
+    Only one page is held in memory at a time, and the first objects are available as soon as the first page arrives.
+
+    Args:
+        resource_api: DynamicClient resource of the listed kind
+        namespace: Namespace to list (default: all namespaces)
+        label_selector: Label selector restricting the listed objects
+        field_selector: Field selector restricting the listed objects
+        page_size: Max number of objects per list call
+        metadata_only: If True, only the metadata of the objects is transferred (PartialObjectMetadata)
+        fields: If set, each object is projected to these dotted field paths (see project_fields) instead of being
+            deserialized into a full ResourceInstance
+        as_table: If True, the server-side printed table is requested instead of the objects, and each row is
+            yielded as {"columns", "cells", "metadata"} (RuntimeError is raised if the server does not return a Table)
+        jsonpaths: If set, each object is reduced to a flat {name: value} of these (name, JSONPath) pairs (see jsonpath_lite)
+
+    Yields:
+        ResourceInstance of each listed object (a PartialObjectMetadata with metadata_only), or its projection/table row
+    """
+    kwargs = {"header_params": {"Accept": ACCEPT_PARTIAL_OBJECT_METADATA_LIST}} if metadata_only else {}
+    if as_table:
+        kwargs = {"header_params": {"Accept": ACCEPT_TABLE}, "serializer": lambda _, page: _table_page(page)}
+    elif jsonpaths:
+        # validated before any request: a ValueError raised by the serializer would be swallowed by the DynamicClient
+        for _, path in jsonpaths:
+            jsonpath_lite_tokens(path)
+        kwargs["serializer"] = lambda _, page: ResourceField({"items": [ResourceField({name: jsonpath_lite(obj, path) for name, path in jsonpaths}) for obj in page.get("items") or []], "metadata": ResourceField(page.get("metadata") or {})})
+    elif fields:
+        kwargs["serializer"] = lambda _, page: ResourceField({"items": [project_fields(obj, fields) for obj in page.get("items") or []], "metadata": ResourceField(page.get("metadata") or {})})
+    continue_token = None
+    pages = 0
+    while True:
+        res = resource_api.get(namespace=namespace, label_selector=label_selector, field_selector=field_selector, limit=page_size, _continue=continue_token, **kwargs)
+        pages += 1
+        for obj in res.items or []:
+            yield obj
+        continue_token = res.metadata["continue"]
+        if not continue_token:
+            log.info(f"listed {resource_api.kind} (namespace={namespace}) in {pages} page(s) of up to {page_size}")
+            return
+
+
+class WatchedCollection:
+    """Incrementally maintained local view of the objects of one kind in one namespace (list + watch)
+
+    A background thread lists the matching objects once in pages, then keeps the view current from a watch opened
+    at the resourceVersion of that list, resuming from the last seen resourceVersion when the server ends the watch
+    and re-listing only when it has expired (410 Gone). Readers get a consistent snapshot without any API call.
+    `synced` is set while the view is current (listed and watching) and cleared while the watch is failing.
+    """
+
+    def __init__(self, resource_api: object, namespace: str, label_selector: str = None, fields: list[str] = None, page_size: int = DEFAULT_LIST_PAGE_SIZE) -> None:
+        self.resource_api = resource_api
+        self.namespace = namespace
+        self.label_selector = label_selector or None
+        self.fields = fields
+        self.page_size = page_size
+        self.synced = threading.Event()
+        # set once the first list has been attempted, whether or not it succeeded
+        self.attempted = threading.Event()
+        self._objects = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+        self._thread = None
+
+    def __repr__(self) -> str:
+        return f"WatchedCollection({self.resource_api.kind}, namespace={self.namespace}, label_selector={self.label_selector})"
+
+    # the view is only changed through these three methods, called with self._lock held
+    def _replace(self, objects: dict):
+        self._objects = objects
+
+    def _upsert(self, name: str, obj):
+        self._objects[name] = obj
+
+    def _remove(self, name: str):
+        self._objects.pop(name, None)
+
+    def _convert(self, raw: dict):
+        # items of a list response may omit kind and apiVersion, which ResourceInstance requires
+        raw.setdefault("kind", self.resource_api.kind)
+        raw.setdefault("apiVersion", self.resource_api.group_version)
+        return project_fields(raw, self.fields) if self.fields else ResourceInstance(self.resource_api, raw)
+
+    def _list(self) -> str:
+        """Replaces the view with a fresh paginated list, returns the resourceVersion of the list"""
+        objects = {}
+        continue_token = None
+        resource_version = None
+        while True:
+            page = self.resource_api.get(namespace=self.namespace, label_selector=self.label_selector, limit=self.page_size, _continue=continue_token, serializer=lambda _, page: page)
+            metadata = page.get("metadata") or {}
+            resource_version = resource_version or metadata.get("resourceVersion")
+            for raw in page.get("items") or []:
+                objects[raw["metadata"]["name"]] = self._convert(raw)
+            continue_token = metadata.get("continue")
+            if not continue_token:
+                break
+        with self._lock:
+            self._replace(objects)
+        self.synced.set()
+        self.attempted.set()
+        log.info(f"{self}: listed {len(objects)} object(s) at resourceVersion {resource_version}")
+        return resource_version
+
+    def _run(self):
+        policy = PollingPolicy(max_interval=DEFAULT_POLL_MAX_INTERVAL_SEC)
+        resource_version = None
+        while not self._stop.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._list()
+                self._watcher = k8s_watch.Watch()
+                watch_timeout = int(DEFAULT_WATCH_TIMEOUT_SEC * random.uniform(1 - DEFAULT_POLL_JITTER, 1))
+                for event in self._watcher.stream(
+                    self.resource_api.get,
+                    namespace=self.namespace,
+                    label_selector=self.label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=watch_timeout,
+                    query_params=[("allowWatchBookmarks", "true")],
+                    serialize=False,
+                    _request_timeout=(30, watch_timeout + 30),
+                ):
+                    raw = event["raw_object"]
+                    resource_version = raw.get("metadata", {}).get("resourceVersion") or resource_version
+                    if event["type"] == "BOOKMARK":
+                        continue
+                    name = raw["metadata"]["name"]
+                    with self._lock:
+                        if event["type"] == "DELETED":
+                            self._remove(name)
+                        else:
+                            self._upsert(name, self._convert(raw))
+                    policy.restart_backoff()
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    log.info(f"{self}: resourceVersion {resource_version} expired, re-listing")
+                else:
+                    log.warning(f"{self}: api exception while watching: {e}")
+                    self.synced.clear()
+                    self.attempted.set()
+                    self._stop.wait(policy.next_interval())
+                resource_version = None
+            except Exception as e:
+                if self._stop.is_set():
+                    return
+                log.warning(f"{self}: watch interrupted: {e}")
+                self.synced.clear()
+                self.attempted.set()
+                self._stop.wait(policy.next_interval())
+                resource_version = None
+
+    def start(self) -> "WatchedCollection":
+        self._thread = threading.Thread(target=self._run, name=f"watch-{self.resource_api.kind}-{self.namespace}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def items(self) -> list:
+        """Returns a snapshot of the current objects"""
+        with self._lock:
+            return list(self._objects.values())
+
+
+class InformerStore(WatchedCollection):
+    """Process-wide cache of all objects of one kind in one namespace, indexed by name, label and owner uid
+
+    Consistency: reads are served from the view while it is synced, which lags the API server by the latency of the
+    watch (usually well below a second), so a read may miss a change made by someone else moments ago. Misses of
+    getters that expect the object to exist are confirmed with a GET (read-through), so objects created moments
+    ago, e.g. by tridentctl-protect, are found. The object read through is not added to the view: only the watch
+    changes it, since the object may be deleted again (and its DELETED event applied) before a GET could be stored,
+    which would bring it back into the view until the next re-list.
+
+    A store lists and watches its whole collection, which only pays off over many reads, so stores are disabled
+    unless the process is long-lived (see KubeClientContext.enable_stores). Whenever the view is not synced (disabled,
+    not yet listed or watch failing) every read goes to the API server.
+    """
+
+    def __init__(self, resource_api: object, namespace: str, enabled: bool = True) -> None:
+        super().__init__(resource_api, namespace)
+        self.enabled = enabled
+        # (label key, label value) -> names, owner uid -> names
+        self._by_label = {}
+        self._by_owner = {}
+
+    def __repr__(self) -> str:
+        return f"InformerStore({self.resource_api.kind}, namespace={self.namespace})"
+
+    def _index(self, name: str, obj, add: bool):
+        metadata = obj.metadata
+        keys = [(self._by_label, label) for label in dict(metadata.labels or {}).items()]
+        keys += [(self._by_owner, ref.uid) for ref in metadata.ownerReferences or []]
+        for index, key in keys:
+            if add:
+                index.setdefault(key, set()).add(name)
+            elif key in index:
+                index[key].discard(name)
+                if not index[key]:
+                    del index[key]
+
+    def _replace(self, objects: dict):
+        super()._replace(objects)
+        self._by_label = {}
+        self._by_owner = {}
+        for name, obj in objects.items():
+            self._index(name, obj, add=True)
+
+    def _upsert(self, name: str, obj):
+        self._remove(name)
+        super()._upsert(name, obj)
+        self._index(name, obj, add=True)
+
+    def _remove(self, name: str):
+        previous = self._objects.get(name)
+        if previous is not None:
+            self._index(name, previous, add=False)
+        super()._remove(name)
+
+    def ready(self) -> bool:
+        """Returns True if reads can be served from the view, starting the store and waiting for its first list if needed"""
+        if not self.enabled:
+            return False
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self.start()
+        self.attempted.wait(DEFAULT_INFORMER_SYNC_TIMEOUT_SEC)
+        return self.synced.is_set()
+
+    def get(self, name: str, confirm_missing: bool = False):
+        """Returns the object with the given name, or None if it does not exist
+
+        Args:
+            name: name of the object
+            confirm_missing: Set to True to confirm a miss of the view with a GET
+        """
+        if self.ready():
+            with self._lock:
+                obj = self._objects.get(name)
+            if obj is not None or not confirm_missing:
+                return obj
+        try:
+            return self.resource_api.get(name=name, namespace=self.namespace)
+        except ApiException as ex:
+            if ex.status == HTTP_NOT_FOUND:
+                return None
+            raise ex
+
+    def list(self, labels: dict = None) -> list:
+        """Returns the objects having all the given labels (all objects without labels)"""
+        if not self.ready():
+            label_selector = ",".join(f"{key}={value}" for key, value in (labels or {}).items()) or None
+            return list(list_in_pages(self.resource_api, namespace=self.namespace, label_selector=label_selector))
+        with self._lock:
+            if not labels:
+                return list(self._objects.values())
+            names = set.intersection(*(self._by_label.get(item, set()) for item in labels.items()))
+            return [self._objects[name] for name in sorted(names)]
+
+    def owned_by(self, uid: str) -> list:
+        """Returns the objects with an ownerReference to uid, None if the view is not synced"""
+        if not self.ready():
+            return None
+        with self._lock:
+            return [self._objects[name] for name in sorted(self._by_owner.get(uid, ()))]
+
 
 def prompt_user_confirmation(message: str):
     """
@@ -685,8 +1836,9 @@ class TridentProtectCliWrapper:
         commandStr = " ".join(command)
         print(f"executing command: {commandStr}\n")
 
-        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate()
+        with Profiler.span(" ".join(command[:3]), "subprocess", command=commandStr):
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            stdout, stderr = process.communicate()
         if process.returncode != 0:
             raise Exception(f"Command exited with non-zero return code {process.returncode}:\n\n`{commandStr}`\n\n{stderr.decode()}")
         return stdout.decode() + "\n" + stderr.decode()
@@ -725,8 +1877,9 @@ class TridentProtectCliWrapper:
         commandStr = " ".join(command)
         print(f"executing command: {commandStr}\n")
 
-        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate()
+        with Profiler.span(" ".join(command[:3]), "subprocess", command=commandStr):
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            stdout, stderr = process.communicate()
         if process.returncode != 0:
             raise Exception(f"Command exited with non-zero return code {process.returncode}:\n\n`{commandStr}`\n\n{stderr.decode()}")
         return stdout.decode() + "\n" + stderr.decode()
@@ -749,71 +1902,743 @@ class TridentProtectCliWrapper:
         commandStr = " ".join(command)
         print(f"executing command: {commandStr}\n")
 
-        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = process.communicate()
+        with Profiler.span(" ".join(command[:3]), "subprocess", command=commandStr):
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            stdout, stderr = process.communicate()
         if process.returncode != 0:
             raise Exception(f"Command exited with non-zero return code {process.returncode}:\n\n`{commandStr}`\n\n{stderr.decode()}")
         return stdout.decode() + "\n" + stderr.decode()
 
-class CpdbrManager:
+def get_user_cache_dir() -> str:
+    """Returns the per-user cache directory of this tool ($XDG_CACHE_HOME/cpd-trident-protect or ~/.cache/cpd-trident-protect), creating it if needed"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(cache_home, "cpd-trident-protect")
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    return cache_dir
 
-    def __init__(self) -> None:
+
+class KubeClientContext:
+    """Process-wide Kubernetes API client context shared by all managers and helpers
+
+    The kubeconfig (or in-cluster config) is loaded once, and a single ApiClient with one connection pool backs
+    the DynamicClient and the typed APIs, so connections, their TLS sessions and API discovery are reused
+    across every call made by the process. API discovery results are persisted per cluster in the user cache dir,
+    so that subsequent invocations resolve resources without any discovery requests.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+    _stores_enabled = False
+
+    def __init__(self, pool_maxsize: int = DEFAULT_K8S_CONNECTION_POOL_MAXSIZE) -> None:
         try:
             k8s_config.load_incluster_config()
         except k8s_config.ConfigException:
             k8s_config.load_kube_config()
-        self.k8s_dyn_client = DynamicClient(client.ApiClient())
 
-    def resolve_namespaces_from_namespacescope(self, cpd_operator_ns: str, nss_name: str = CPD_NAMESPACESCOPE_NAME) -> list[str]:
-        """Resolves all CPD namespaces from the specified NamespaceScope CR
-        Args:
-            cpd_operator_ns: Name of the CPD tenant operator namespace the NamespaceScope CR is located in
-            nss_name: Name of the NamespaceScope CR containing the namespaces (default: `common-service`)
+        self.configuration = client.Configuration.get_default_copy()
+        self.configuration.connection_pool_maxsize = pool_maxsize
+        self.api_client = ApiClient(self.configuration)
+
+        # enable TCP keep-alive on pooled connections so idle connections survive long waits between calls
+        pool_kw = self.api_client.rest_client.pool_manager.connection_pool_kw
+        pool_kw["socket_options"] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+        if Profiler.enabled():
+            Profiler.instrument_api_client(self.api_client)
+        # installed last so that it wraps the profiler, which then records every attempt of a retried request
+        self.rate_limiter = ApiRateLimiter.from_env()
+        self.rate_limiter.install(self.api_client)
+
+        self.dyn_client = DynamicClient(self.api_client, cache_file=self._get_discovery_cache_file())
+        self.core_v1 = client.CoreV1Api(self.api_client)
+        self.apps_v1 = client.AppsV1Api(self.api_client)
+        self._resources = {}
+        self._resources_lock = threading.Lock()
+        self._stores = {}
+        self._stores_lock = threading.Lock()
+        log.info(f"initialized kubernetes client context (host={self.configuration.host}, pool_maxsize={pool_maxsize}, {self.rate_limiter})")
 
-        Raises:
-            Exception: If there are any errors getting the NamespaceScope CR or retrieving namespaces from the NamespaceScope CR
+    @staticmethod
+    def get() -> "KubeClientContext":
+        """Returns the process-wide client context, creating it on first use"""
+        with KubeClientContext._lock:
+            if KubeClientContext._instance is None:
+                _load_cluster_modules()
+                pool_maxsize = int(os.environ.get(ENV_K8S_CONNECTION_POOL_MAXSIZE, DEFAULT_K8S_CONNECTION_POOL_MAXSIZE))
+                with Profiler.span("KubeClientContext.__init__", "discovery"):
+                    KubeClientContext._instance = KubeClientContext(pool_maxsize)
+            return KubeClientContext._instance
 
-        Returns:
-            List of CPD namespaces resolved from the tenant operator namespace
+    @staticmethod
+    def enable_stores():
+        """Lets the informer stores serve reads, for long-lived processes only (unless disabled by CPD_TP_INFORMER_CACHE)
+
+        Must be called before the first read. In one-shot commands every read is a plain API call: starting a store
+        lists the whole collection, which costs far more than the few reads of a single command.
         """
+        KubeClientContext._stores_enabled = os.environ.get(ENV_INFORMER_CACHE, "true").strip().lower() not in ("0", "false", "no")
+
+    def store(self, resource: tuple, namespace: str) -> InformerStore:
+        """Returns the process-wide InformerStore of (api_version, kind) objects in a namespace, created on first use"""
+        resource_api = self.resource(resource)
+        with self._stores_lock:
+            key = (resource, namespace)
+            if key not in self._stores:
+                self._stores[key] = InformerStore(resource_api, namespace, KubeClientContext._stores_enabled)
+            return self._stores[key]
+
+    def _get_discovery_cache_file(self) -> str:
+        """Returns the discovery cache file of the configured cluster, removing it first if it is older than the TTL"""
+        cache_id = hashlib.sha256(self.configuration.host.encode("utf-8")).hexdigest()[:16]
+        cache_file = os.path.join(get_user_cache_dir(), f"discovery-{cache_id}.json")
+        ttl = int(os.environ.get(ENV_DISCOVERY_CACHE_TTL_SEC, DEFAULT_DISCOVERY_CACHE_TTL_SEC))
         try:
-            nss_api = self.k8s_dyn_client.resources.get(api_version="operator.ibm.com/v1", kind="NamespaceScope")
-            res = nss_api.get(nss_name, cpd_operator_ns)
-            if getattr(res, "status") is None:
-                raise Exception(f'missing ".status" field in NamespaceScope "{nss_name}"')
-            if getattr(res.status, "validatedMembers") is None:
-                raise Exception(f'missing ".status.validatedMembers" field in NamespaceScope "{nss_name}"')
+            age = time.time() - os.path.getmtime(cache_file)
+            if age > ttl:
+                log.info(f"discovery cache {cache_file} expired (age={int(age)}s, ttl={ttl}s), refreshing")
+                os.remove(cache_file)
+        except FileNotFoundError:
+            pass
+        return cache_file
+
+    @Profiler.traced(cat="discovery")
+    def resource(self, api_resource: tuple):
+        """Returns the DynamicClient resource for an (api_version, kind) pair, e.g. RESOURCE_TP_BACKUP
+
+        Resolved resources are kept for the lifetime of the process. A resource missing from the discovery cache
+        (e.g. a CRD installed after the cache was written) makes the DynamicClient refresh the cache once before
+        ResourceNotFoundError is raised.
+        """
+        with self._resources_lock:
+            res = self._resources.get(api_resource)
+            if res is None:
+                api_version, kind = api_resource
+                res = self.dyn_client.resources.get(api_version=api_version, kind=kind)
+                self._resources[api_resource] = res
+            return res
 
-            validated_members = res.status.validatedMembers
-            if not isinstance(validated_members, list):
-                raise Exception(f'expected ".status.validatedMembers" field in NamespaceScope "{nss_name}" to be a list, received: {validated_members}')
-            return validated_members
-        except Exception as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                raise Exception(f'NamespaceScope resource "{nss_name}" not found in namespace "{cpd_operator_ns}": {ex}')
-            raise Exception(f'Error resolving namespaces from NamespaceScope "{nss_name}" in namespace "{cpd_operator_ns}": {ex}')
+    def exec_core_v1(self):
+        """Returns a CoreV1Api for pod exec calls
+
+        `kubernetes.stream.stream` temporarily swaps the request method of the ApiClient it is given, so exec
+        calls get their own ApiClient (built from the already loaded configuration) instead of the shared one.
+        """
+        return client.CoreV1Api(ApiClient(self.configuration))
+
+
+class ServerSideApplier:
+    """Applies manifests and labels through the Kubernetes API using server-side apply
+
+    Objects are applied with the field manager of this tool (FIELD_MANAGER). Fields still owned by the managers
+    recorded by `oc apply` in earlier releases are taken over, while conflicts with any other field manager are
+    reported and fail the apply unless force_conflicts is set. With dry_run, the requests are sent with
+    dryRun=All, so the API server validates and admits the objects without persisting them.
+    """
+
+    def __init__(self, kube: KubeClientContext = None, force_conflicts: bool = False, max_workers: int = DEFAULT_APPLY_MAX_WORKERS) -> None:
+        self.kube = kube or KubeClientContext.get()
+        self.force_conflicts = force_conflicts
+        self.max_workers = max_workers
+
+    @staticmethod
+    def get_conflicts(e: ApiException) -> list[dict]:
+        """Returns the field manager conflicts reported in the Status of a failed apply
 
-    def verify_tenant_service_healthy(self, cpd_operator_ns: str) -> object:
-        """Ensures the cpdbr-tenant-service deployment is available
         Args:
-            cpd_operator_ns: Name of the CPD tenant operator namespace the codbr-tenant-service deployment is located in
-            tenant_service_img_prefix: Image prefix that Trident Protect ExecHooks will select the cpdbr-tenant-service by
+            e (ApiException): 409 Conflict returned for the apply request
+
+        Returns:
+            list[dict]: {"manager", "field", "message"} per conflicting field
+        """
+        try:
+            status = json.loads(e.body)
+        except (TypeError, ValueError):
+            return []
+        conflicts = []
+        for cause in (status.get("details") or {}).get("causes") or []:
+            message = cause.get("message", "")
+            match = re.search(r'conflict with "([^"]+)"', message)
+            conflicts.append({"manager": match.group(1) if match else "", "field": cause.get("field", ""), "message": message})
+        return conflicts
+
+    def apply(self, manifest: str, dry_run: bool = False) -> str:
+        """Applies a single YAML manifest
+
+        Args:
+            manifest (str): YAML manifest of the object to apply
+            dry_run (bool): If True, the object is applied with dryRun=All and not persisted
 
         Raises:
-            Exception: If the cpdbr-tenant-service deployment is unhealthy
+            Exception: If the apply conflicts with fields owned by another field manager
 
         Returns:
-            cpdbr-tenant-service deployment
+            str: kubectl-style result line, e.g. `exechook.protect.trident.netapp.io/app-pre-snapshot serverside-applied`
         """
-        appsv1_api = client.AppsV1Api()
-        deploy = appsv1_api.read_namespaced_deployment(name=CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME, namespace=cpd_operator_ns)
-        log.info(f"{CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={cpd_operator_ns}): \n\n{deploy}\n")
-        replicas = deploy.status.replicas or 0
-        available_replicas = deploy.status.available_replicas or 0
-        if replicas == 0:
-            raise Exception(f"expected .status.replicas of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment to be non-zero (cpd_operator_ns={cpd_operator_ns})")
-        if available_replicas == 0:
-            raise Exception(f"expected .status.available_replicas of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment to be non-zero (cpd_operator_ns={cpd_operator_ns})")
+        body = yaml.safe_load(manifest)
+        kind = body["kind"]
+        name = body["metadata"]["name"]
+        namespace = body["metadata"].get("namespace")
+        resource = self.kube.resource((body["apiVersion"], kind))
+        kwargs = {"dry_run": "All"} if dry_run else {}
+
+        force_conflicts = self.force_conflicts
+        while True:
+            try:
+                resource.server_side_apply(body=body, name=name, namespace=namespace, field_manager=FIELD_MANAGER, force_conflicts=force_conflicts, **kwargs)
+                break
+            except ApiException as e:
+                if e.status != HTTP_CONFLICT or force_conflicts:
+                    raise
+                conflicts = self.get_conflicts(e)
+                if conflicts and all(c["manager"] in LEGACY_APPLY_FIELD_MANAGERS for c in conflicts):
+                    log.info(f'taking over fields of {kind} "{name}" from legacy field managers: {conflicts}')
+                    force_conflicts = True
+                    continue
+                details = "\n".join(f'  {c["field"]}: {c["message"]}' for c in conflicts) or f"  {e.body}"
+                raise Exception(f'Conflict applying {kind} "{name}" in namespace "{namespace}" (field manager "{FIELD_MANAGER}"):\n{details}\nRe-run with `--force_conflicts` to take ownership of the conflicting fields')
+
+        group = resource.group
+        result = f"{kind.lower()}.{group}/{name}" if group else f"{kind.lower()}/{name}"
+        return f"{result} serverside-applied (server dry run)" if dry_run else f"{result} serverside-applied"
+
+    def apply_all(self, manifests: list[str], dry_run: bool = False) -> list[str]:
+        """Applies independent manifests concurrently
+
+        Args:
+            manifests (list[str]): YAML manifests of objects that do not depend on each other
+            dry_run (bool): If True, the objects are applied with dryRun=All and not persisted
+
+        Raises:
+            Exception: The first apply failure, after all applies have finished
+
+        Returns:
+            list[str]: result line per manifest, in the order of the given manifests
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.apply, manifest, dry_run) for manifest in manifests]
+        return [future.result() for future in futures]
+
+    def label_all(self, api_resource: tuple, names: list[str], labels: dict, dry_run: bool = False) -> list[str]:
+        """Sets labels on existing cluster-scoped objects concurrently via JSON merge patch (replacement for `oc label --overwrite`)
+
+        Args:
+            api_resource (tuple): (api_version, kind) of the objects, e.g. RESOURCE_CRD
+            names (list[str]): names of the objects to label
+            labels (dict): labels to set
+            dry_run (bool): If True, the patches are sent with dryRun=All and not persisted
+
+        Returns:
+            list[str]: result line per object, in the order of the given names
+        """
+        resource = self.kube.resource(api_resource)
+        body = {"metadata": {"labels": labels}}
+        kwargs = {"dry_run": "All"} if dry_run else {}
+
+        def label(name: str) -> str:
+            resource.patch(body=body, name=name, content_type="application/merge-patch+json", field_manager=FIELD_MANAGER, **kwargs)
+            return f"{resource.kind.lower()}.{resource.group}/{name} labeled"
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(label, name) for name in names]
+        return [future.result() for future in futures]
+
+
+class TridentProtectCrBackend:
+    """In-process alternative to TridentProtectCliWrapper
+
+    Builds the Backup/BackupRestore CRs that `tridentctl-protect create` would generate and submits them directly
+    through the shared DynamicClient, without spawning tridentctl-protect.
+    """
+
+    @staticmethod
+    def parse_mappings(mapping_string: str) -> list[dict]:
+        """Parses a mapping string of the form "<source1>:<destination1>,<source2>:<destination2>"
+
+        Raises:
+            ValueError: If a mapping is not of the form <source>:<destination>
+
+        Returns:
+            List of {"source": ..., "destination": ...} dicts
+        """
+        mappings = []
+        for pair in mapping_string.split(","):
+            source, sep, destination = pair.strip().partition(":")
+            if not sep or not source or not destination:
+                raise ValueError(f'invalid mapping "{pair}", expected <source>:<destination>')
+            mappings.append({"source": source, "destination": destination})
+        return mappings
+
+    @staticmethod
+    def _create(api_resource: tuple, body: dict, cr_namespace: str, dry_run: bool):
+        kind = body["kind"]
+        name = body["metadata"]["name"]
+        manifest = yaml.dump(body)
+        log.info(f"creating {kind} CR (dry_run={dry_run}):\n{manifest}")
+        print(f"creating {kind} CR (dry_run={dry_run}):\n\n{manifest}")
+
+        api = KubeClientContext.get().resource(api_resource)
+        api.create(body=body, namespace=cr_namespace, dry_run="All" if dry_run else None)
+        if dry_run:
+            return f'{kind} "{name}" validated (Dry Run)'
+        return f'{kind} "{name}" created'
+
+    @staticmethod
+    def backup_create(
+        backup_name: str,
+        cr_namespace: str,
+        appvault_name: str,
+        application_name: str,
+        tp_namespace: str,
+        dry_run: bool,
+        data_mover: str,
+        pvc_bind_timeout_sec: str,
+        reclaim_policy: str,
+        snapshot: str,
+        data_mover_timeout_sec: int,
+        full_backup: bool=False,
+        snapshot_completion_timeout: str=DEFAULT_SNAPSHOT_COMPLETION_TIMEOUT,
+        volume_snapshots_created_timeout: str=DEFAULT_VOLUME_SNAPSHOTS_CREATED_TIMEOUT,
+        volume_snapshots_ready_to_use_timeout: str=DEFAULT_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT
+    ):
+        label_key, _, label_value = LABEL_GENERATED_BY_CPDBR.partition("=")
+        annotations = {
+            ANNOTATION_DATA_MOVER_TIMEOUT_SEC: str(data_mover_timeout_sec),
+            ANNOTATION_SNAPSHOT_COMPLETION_TIMEOUT: snapshot_completion_timeout,
+            ANNOTATION_VOLUME_SNAPSHOTS_CREATED_TIMEOUT: volume_snapshots_created_timeout,
+            ANNOTATION_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT: volume_snapshots_ready_to_use_timeout,
+        }
+        if pvc_bind_timeout_sec != "":
+            annotations[ANNOTATION_PVC_BIND_TIMEOUT_SEC] = str(pvc_bind_timeout_sec)
+        if full_backup:
+            annotations[ANNOTATION_FULL_BACKUP] = "true"
+
+        spec = {
+            "applicationRef": application_name,
+            "appVaultRef": appvault_name,
+        }
+        if data_mover != "":
+            spec["dataMover"] = data_mover
+        if reclaim_policy != "":
+            spec["reclaimPolicy"] = reclaim_policy
+        if snapshot != "":
+            spec["snapshotRef"] = snapshot
+
+        body = {
+            "apiVersion": TRIDENT_PROTECT_API_VERSION,
+            "kind": "Backup",
+            "metadata": {
+                "name": backup_name,
+                "namespace": cr_namespace,
+                "annotations": annotations,
+                "labels": {label_key: label_value},
+            },
+            "spec": spec,
+        }
+        return TridentProtectCrBackend._create(RESOURCE_TP_BACKUP, body, cr_namespace, dry_run)
+
+    @staticmethod
+    def restore_create(
+        restore_name: str,
+        appvault_name: str,
+        cr_namespace: str,
+        namespace_mappings: str,
+        app_archive_path: str,
+        dry_run: bool,
+        data_mover_timeout_sec: int,
+        storageclass_mappings: str,
+        pvc_bind_timeout_sec: str,
+    ):
+        label_key, _, label_value = LABEL_GENERATED_BY_CPDBR.partition("=")
+        annotations = {
+            ANNOTATION_DATA_MOVER_TIMEOUT_SEC: str(data_mover_timeout_sec),
+        }
+        if pvc_bind_timeout_sec != "":
+            annotations[ANNOTATION_PVC_BIND_TIMEOUT_SEC] = str(pvc_bind_timeout_sec)
+
+        spec = {
+            "appArchivePath": app_archive_path,
+            "appVaultRef": appvault_name,
+            "namespaceMapping": TridentProtectCrBackend.parse_mappings(namespace_mappings),
+        }
+        if storageclass_mappings != "":
+            spec["storageClassMapping"] = TridentProtectCrBackend.parse_mappings(storageclass_mappings)
+
+        body = {
+            "apiVersion": TRIDENT_PROTECT_API_VERSION,
+            "kind": "BackupRestore",
+            "metadata": {
+                "name": restore_name,
+                "namespace": cr_namespace,
+                "annotations": annotations,
+                "labels": {label_key: label_value},
+            },
+            "spec": spec,
+        }
+        return TridentProtectCrBackend._create(RESOURCE_TP_BACKUPRESTORE, body, cr_namespace, dry_run)
+
+    @staticmethod
+    def backup_delete(
+        backup_name: str,
+        cr_namespace: str,
+        tp_namespace: str,
+    ):
+        log.info(f"deleting Backup CR {backup_name} (namespace={cr_namespace})")
+        api = KubeClientContext.get().resource(RESOURCE_TP_BACKUP)
+        api.delete(name=backup_name, namespace=cr_namespace)
+        return f'Backup "{backup_name}" deleted'
+
+    @staticmethod
+    def for_backend(cr_backend: str):
+        """Returns the implementation (TridentProtectCrBackend or TridentProtectCliWrapper) of the specified CR backend"""
+        if cr_backend == CR_BACKEND_NATIVE:
+            return TridentProtectCrBackend
+        if cr_backend == CR_BACKEND_TRIDENTCTL:
+            return TridentProtectCliWrapper
+        raise ValueError(f'unknown CR backend "{cr_backend}", expected one of: {CR_BACKEND_TRIDENTCTL}, {CR_BACKEND_NATIVE}')
+
+
+class BackupLease:
+    """coordination.k8s.io Lease guaranteeing a single CPD Trident Protect backup per operator namespace
+
+    The holder identity is the name of the Backup. The Lease is acquired before the Backup CR is created, renewed
+    while the tool waits for the Backup, and released once the Backup reaches a terminal state. Since `backup create`
+    may exit right after creating the Backup, an expired Lease is only reclaimed after a GET shows that the Backup of
+    its holder is not Running (anymore). All updates use the resourceVersion of the read Lease, so of two concurrent
+    invocations exactly one wins.
+    """
+
+    def __init__(self, cr_namespace: str, name: str = BACKUP_LEASE_NAME, duration: int = DEFAULT_BACKUP_LEASE_DURATION_SEC, kube: KubeClientContext = None) -> None:
+        self.cr_namespace = cr_namespace
+        self.name = name
+        self.duration = duration
+        self.kube = kube or KubeClientContext.get()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    @staticmethod
+    def is_expired(lease: object) -> bool:
+        """Returns True if the Lease was not renewed within its duration (or has no holder)"""
+        spec = lease.spec
+        if not spec or not spec.holderIdentity or not spec.renewTime:
+            return True
+        renew_time = parse_k8s_timestamp(spec.renewTime)
+        return renew_time is None or (datetime.now(timezone.utc) - renew_time).total_seconds() > (spec.leaseDurationSeconds or 0)
+
+    def get(self):
+        """Returns the Lease, or None if it does not exist"""
+        try:
+            return self.kube.resource(RESOURCE_LEASE).get(name=self.name, namespace=self.cr_namespace)
+        except ApiException as e:
+            if e.status == HTTP_NOT_FOUND:
+                return None
+            raise
+
+    def _body(self, holder: str, lease: object = None) -> dict:
+        now = self._now()
+        spec = (lease.to_dict().get("spec") or {}) if lease is not None else {}
+        transitions = spec.get("leaseTransitions") or 0
+        same_holder = spec.get("holderIdentity") == holder
+        label_key, _, label_value = LABEL_GENERATED_BY_CPDBR.partition("=")
+        body = {
+            "apiVersion": RESOURCE_LEASE[0],
+            "kind": RESOURCE_LEASE[1],
+            "metadata": {"name": self.name, "namespace": self.cr_namespace, "labels": {label_key: label_value}},
+            "spec": {
+                "holderIdentity": holder,
+                "leaseDurationSeconds": self.duration,
+                "acquireTime": spec.get("acquireTime") if same_holder else now,
+                "renewTime": now,
+                "leaseTransitions": transitions if same_holder or not spec.get("holderIdentity") else transitions + 1,
+            },
+        }
+        if lease is not None:
+            body["metadata"]["resourceVersion"] = lease.metadata.resourceVersion
+        return body
+
+    @Profiler.traced(cat="lease")
+    def acquire(self, holder: str, is_holder_running: Callable[[str], bool], legacy_check: Callable[[], None], dry_run: bool = False) -> bool:
+        """Acquires the Lease for the Backup `holder`
+
+        Args:
+            holder: name of the Backup about to be created
+            is_holder_running: returns True if the Backup of the given name is Running (called for an expired Lease)
+            legacy_check: raises if a CPD backup is Running; used when the Lease does not exist yet (backups created by
+                earlier releases) or cannot be used (e.g. no RBAC permissions on Leases)
+            dry_run: If True, only checks whether the Lease could be acquired
+
+        Raises:
+            Exception: If another CPD backup holds the Lease
+
+        Returns:
+            True if the Lease guards the backup, False if only the legacy check was applied
+        """
+        leases_api = self.kube.resource(RESOURCE_LEASE)
+        try:
+            lease = self.get()
+            if lease is None:
+                legacy_check()
+                if dry_run:
+                    log.info(f"would create Lease {self.cr_namespace}/{self.name} for backup {holder} (dry_run=True)")
+                else:
+                    leases_api.create(body=self._body(holder), namespace=self.cr_namespace)
+                    log.info(f"created Lease {self.cr_namespace}/{self.name} for backup {holder}")
+                return True
+
+            current = lease.spec.holderIdentity if lease.spec else None
+            if current and current != holder:
+                if not self.is_expired(lease):
+                    raise Exception(f'backup "{current}" holds Lease {self.cr_namespace}/{self.name} (renewed {lease.spec.renewTime}) - only one Running CPD Trident Protect backup is allowed at a time. Aborting backup...')
+                if is_holder_running(current):
+                    raise Exception(f'backup "{current}" of expired Lease {self.cr_namespace}/{self.name} is still Running - only one Running CPD Trident Protect backup is allowed at a time. Aborting backup...')
+                log.info(f"reclaiming expired Lease {self.cr_namespace}/{self.name} from backup {current}")
+            if dry_run:
+                log.info(f"would acquire Lease {self.cr_namespace}/{self.name} for backup {holder} (dry_run=True)")
+            else:
+                leases_api.replace(body=self._body(holder, lease), namespace=self.cr_namespace)
+                log.info(f"acquired Lease {self.cr_namespace}/{self.name} for backup {holder}")
+            return True
+        except ApiException as e:
+            if e.status == HTTP_CONFLICT:
+                raise Exception(f"another CPD backup acquired Lease {self.cr_namespace}/{self.name} concurrently. Aborting backup...")
+            if e.status == HTTP_FORBIDDEN:
+                log.warning(f"cannot use Lease {self.cr_namespace}/{self.name}, falling back to listing Running backups: {e.reason}")
+                legacy_check()
+                return False
+            raise
+        except ResourceNotFoundError:
+            legacy_check()
+            return False
+
+    def renew(self, holder: str) -> bool:
+        """Renews the Lease if it is held by `holder`, returns False otherwise"""
+        lease = self.get()
+        if lease is None or not lease.spec or lease.spec.holderIdentity != holder:
+            return False
+        self.kube.resource(RESOURCE_LEASE).replace(body=self._body(holder, lease), namespace=self.cr_namespace)
+        return True
+
+    def release(self, holder: str) -> bool:
+        """Releases the Lease if it is held by `holder`, returns False otherwise"""
+        try:
+            lease = self.get()
+            if lease is None or not lease.spec or lease.spec.holderIdentity != holder:
+                return False
+            body = self._body(holder, lease)
+            body["spec"].update({"holderIdentity": None, "renewTime": None})
+            self.kube.resource(RESOURCE_LEASE).replace(body=body, namespace=self.cr_namespace)
+            log.info(f"released Lease {self.cr_namespace}/{self.name} of backup {holder}")
+            return True
+        except (ApiException, ResourceNotFoundError) as e:
+            log.warning(f"error releasing Lease {self.cr_namespace}/{self.name} of backup {holder}: {e}")
+            return False
+
+    def release_any(self, holders: set) -> bool:
+        """Releases the Lease if it is held by one of the Backups `holders` (a single GET otherwise), returns False otherwise"""
+        try:
+            lease = self.get()
+        except (ApiException, ResourceNotFoundError) as e:
+            log.warning(f"error reading Lease {self.cr_namespace}/{self.name}: {e}")
+            return False
+        holder = lease.spec.holderIdentity if lease is not None and lease.spec else None
+        return holder in holders and self.release(holder)
+
+    @contextlib.contextmanager
+    def renewing(self, holder: str):
+        """Renews the Lease held by `holder` in the background until the context exits (no-op if not the holder)"""
+        stop = threading.Event()
+
+        def renew_loop():
+            while not stop.wait(self.duration / 3):
+                try:
+                    if not self.renew(holder):
+                        log.warning(f"Lease {self.cr_namespace}/{self.name} is no longer held by backup {holder}, stopped renewing")
+                        return
+                except Exception as e:
+                    log.warning(f"error renewing Lease {self.cr_namespace}/{self.name} of backup {holder}: {e}")
+
+        renewer = threading.Thread(target=renew_loop, name=f"lease-{self.cr_namespace}", daemon=True)
+        renewer.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            renewer.join()
+
+
+class PodExecRunner:
+    """Runs a command in a pod over a streaming exec connection
+
+    Output is read while the command runs and handed to `on_line` one line at a time (stdout and stderr interleaved in
+    the order they arrive), so only the last `tail_lines` lines are kept in memory. The exit code is taken from the
+    status the kubelet reports on the exec error channel. The command is abandoned once `timeout` seconds have passed
+    or `cancel` is set; closing the connection does not necessarily stop the process in the container.
+    """
+
+    def __init__(self, kube: KubeClientContext = None, timeout: float = None, cancel: threading.Event = None, on_line: Callable[[str], None] = None, tail_lines: int = DEFAULT_EXEC_OUTPUT_TAIL_LINES) -> None:
+        self.kube = kube or KubeClientContext.get()
+        self.timeout = timeout
+        self.cancel = cancel
+        self.on_line = on_line or self.print_line
+        self.tail = collections.deque(maxlen=tail_lines)
+
+    @staticmethod
+    def print_line(line: str):
+        """Default `on_line`: echoes a line of command output to the console and the log"""
+        print(line)
+        log.info(f"exec output: {line}")
+
+    def tail_text(self) -> str:
+        """Returns the last lines of output of the latest run"""
+        return "\n".join(self.tail)
+
+    def open(self, pod_name: str, namespace: str, command: list[str], stdin: bool = False):
+        """Opens the exec connection and returns the (still running) WSClient"""
+        return stream(
+            self.kube.exec_core_v1().connect_post_namespaced_pod_exec,
+            name=pod_name,
+            namespace=namespace,
+            command=command,
+            stderr=True,
+            stdin=stdin,
+            stdout=True,
+            tty=False,
+            _preload_content=False,
+        )
+
+    @staticmethod
+    def exit_code(status: str, description: str) -> int:
+        """Returns the exit code reported in the exec status (metav1.Status) of a finished command
+
+        Raises:
+            Exception: If no status was reported or the command could not be run at all
+        """
+        if not status.strip():
+            raise Exception(f"{description} ended without reporting an exit status")
+        status = json.loads(status)
+        if status.get("status") == "Success":
+            return 0
+        if status.get("reason") == "NonZeroExitCode":
+            for cause in (status.get("details") or {}).get("causes") or []:
+                if cause.get("reason") == "ExitCode":
+                    return int(cause["message"])
+        raise Exception(f"{description} failed: {status.get('message') or status}")
+
+    def _emit(self, data: str) -> str:
+        """Passes the complete lines of `data` on and returns the unterminated rest"""
+        lines = data.split("\n")
+        rest = lines.pop()
+        for line in lines:
+            self._line(line.rstrip("\r"))
+        while len(rest) > EXEC_OUTPUT_MAX_LINE_CHARS:
+            self._line(rest[:EXEC_OUTPUT_MAX_LINE_CHARS])
+            rest = rest[EXEC_OUTPUT_MAX_LINE_CHARS:]
+        return rest
+
+    def _line(self, line: str):
+        self.tail.append(line)
+        self.on_line(line)
+
+    def run(self, pod_name: str, namespace: str, command: list[str]) -> int:
+        """Runs `command` in the pod and streams its output until it exits
+
+        Args:
+            pod_name: Name of the pod (its first container runs the command)
+            namespace: Namespace of the pod
+            command: Command and arguments, executed without a shell
+
+        Raises:
+            TimeoutError: If the command did not exit within the timeout
+            Exception: If the run was cancelled, the connection failed or the command could not be started
+
+        Returns:
+            Exit code of the command
+        """
+        description = f'"{" ".join(command)}" in pod {namespace}/{pod_name}'
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        self.tail.clear()
+        rest, status = "", ""
+        with Profiler.span(f"exec {pod_name}", "exec", command=" ".join(command)):
+            resp = self.open(pod_name, namespace, command)
+            try:
+                while resp.is_open():
+                    if self.cancel is not None and self.cancel.is_set():
+                        raise Exception(f"{description} was cancelled")
+                    wait = EXEC_POLL_INTERVAL_SEC
+                    if deadline is not None:
+                        wait = min(wait, deadline - time.monotonic())
+                        if wait <= 0:
+                            raise TimeoutError(f"{description} did not finish within {self.timeout}s (the command may still be running in the pod), last output:\n{self.tail_text()}")
+                    resp.update(timeout=wait)
+                    # the status is read before read_all(), which drops every buffered channel
+                    status += resp.read_channel(EXEC_ERROR_CHANNEL)
+                    rest = self._emit(rest + resp.read_all())
+            finally:
+                resp.close()
+        if rest:
+            self._line(rest)
+        return self.exit_code(status, description)
+
+
+class CpdbrManager:
+
+    def __init__(self) -> None:
+        self.kube = KubeClientContext.get()
+        self.k8s_dyn_client = self.kube.dyn_client
+
+    def resolve_namespaces_from_namespacescope(self, cpd_operator_ns: str, nss_name: str = CPD_NAMESPACESCOPE_NAME) -> list[str]:
+        """Resolves all CPD namespaces from the specified NamespaceScope CR
+        Args:
+            cpd_operator_ns: Name of the CPD tenant operator namespace the NamespaceScope CR is located in
+            nss_name: Name of the NamespaceScope CR containing the namespaces (default: `common-service`)
+
+        Raises:
+            Exception: If there are any errors getting the NamespaceScope CR or retrieving namespaces from the NamespaceScope CR
+
+        Returns:
+            List of CPD namespaces resolved from the tenant operator namespace
+        """
+        try:
+            nss_api = self.kube.resource(RESOURCE_NAMESPACESCOPE)
+            res = nss_api.get(nss_name, cpd_operator_ns)
+            if getattr(res, "status") is None:
+                raise Exception(f'missing ".status" field in NamespaceScope "{nss_name}"')
+            if getattr(res.status, "validatedMembers") is None:
+                raise Exception(f'missing ".status.validatedMembers" field in NamespaceScope "{nss_name}"')
+
+            validated_members = res.status.validatedMembers
+            if not isinstance(validated_members, list):
+                raise Exception(f'expected ".status.validatedMembers" field in NamespaceScope "{nss_name}" to be a list, received: {validated_members}')
+            return validated_members
+        except Exception as ex:
+            if ex.status == HTTP_NOT_FOUND:
+                raise Exception(f'NamespaceScope resource "{nss_name}" not found in namespace "{cpd_operator_ns}": {ex}')
+            raise Exception(f'Error resolving namespaces from NamespaceScope "{nss_name}" in namespace "{cpd_operator_ns}": {ex}')
+
+    @Profiler.traced(cat="preflight")
+    def verify_tenant_service_healthy(self, cpd_operator_ns: str) -> object:
+        """Ensures the cpdbr-tenant-service deployment is available
+        Args:
+            cpd_operator_ns: Name of the CPD tenant operator namespace the codbr-tenant-service deployment is located in
+            tenant_service_img_prefix: Image prefix that Trident Protect ExecHooks will select the cpdbr-tenant-service by
+
+        Raises:
+            Exception: If the cpdbr-tenant-service deployment is unhealthy
+
+        Returns:
+            cpdbr-tenant-service deployment
+        """
+        appsv1_api = self.kube.apps_v1
+        deploy = appsv1_api.read_namespaced_deployment(name=CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME, namespace=cpd_operator_ns)
+        log.info(f"{CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={cpd_operator_ns}): \n\n{deploy}\n")
+        replicas = deploy.status.replicas or 0
+        available_replicas = deploy.status.available_replicas or 0
+        if replicas == 0:
+            raise Exception(f"expected .status.replicas of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment to be non-zero (cpd_operator_ns={cpd_operator_ns})")
+        if available_replicas == 0:
+            raise Exception(f"expected .status.available_replicas of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment to be non-zero (cpd_operator_ns={cpd_operator_ns})")
         if replicas != available_replicas:
             raise Exception(f"{CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment is not healthy: {available_replicas}/{replicas} replicas are ready (cpd_operator_ns={cpd_operator_ns})")
         log.info(f"{CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment is healthy ({available_replicas}/{replicas} replicas are ready) (namespace={cpd_operator_ns})")
@@ -831,7 +2656,7 @@ class CpdbrManager:
         Returns:
             The cpdbt-tenant-service pod name
         """
-        corev1_api = client.CoreV1Api()
+        corev1_api = self.kube.core_v1
         pods = corev1_api.list_namespaced_pod(namespace=cpd_operator_ns, label_selector=pod_label_selector)
 
         if not pods.items:
@@ -858,10 +2683,7 @@ class CpdbrManager:
         """
         try:
             # Get the Velero backup API resource
-            velero_backup_api = self.k8s_dyn_client.resources.get(
-                api_version="velero.io/v1",
-                kind="Backup"
-            )
+            velero_backup_api = self.kube.resource(RESOURCE_VELERO_BACKUP)
             
             # Build label selector to find the Velero backup CR
             # Match vendor=trident-protect and vendor-backup-name=<backup_name>
@@ -885,12 +2707,19 @@ class CpdbrManager:
         except Exception as ex:
             raise Exception(f"Failed to get tenant backup for Trident Protect backup '{backup_name}' in namespace '{oadp_ns}': {ex}")
 
-    def delete_tenant_backup(self, backup_name: str, cpd_operator_ns: str, oadp_ns: str):
+    @staticmethod
+    def tenant_backup_delete_command(backup_name: str, oadp_ns: str) -> list[str]:
+        """Returns the cpdbr-oadp command deleting the tenant-backup of a Trident Protect backup"""
+        return ["/cpdbr-scripts/cpdbr-oadp", "tenant-backup", "delete", backup_name, f"--namespace={oadp_ns}"]
+
+    def delete_tenant_backup(self, backup_name: str, cpd_operator_ns: str, oadp_ns: str, timeout: float = DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC, cancel: threading.Event = None):
         """Deletes a CPD tenant backup by finding the Velero backup CR via labels and executing delete command
         Args:
             backup_name: Name of the Trident Protect backup related to the tenant-backup that will be deleted
             cpd_operator_ns: Name of the CPD tenant operator namespace
             oadp_ns: OADP Operator namespace
+            timeout: Max time in seconds the delete command may run (None for no limit)
+            cancel: Event abandoning the delete command once set
         
         Raises:
             Exception: If the tenant-backup is not found or deletion fails
@@ -905,36 +2734,58 @@ class CpdbrManager:
             # Delete the tenant-backup using the cpdbr-oadp command with the Velero backup CR name
             log.info(f"Deleting tenant backup via Velero Backup CR: {backup_name} in namespace: {oadp_ns}")
             
-            cmd = f"/cpdbr-scripts/cpdbr-oadp tenant-backup delete {backup_name} --namespace={oadp_ns}"
-            wrapped_cmd = f"""
-            {cmd}
-            code=$?
-            echo "__EXIT_CODE__=$code"
-            exit $code
-            """
-            
-            coreV1 = client.CoreV1Api(ApiClient())
-            output = stream(
-                coreV1.connect_post_namespaced_pod_exec,
-                name=pod_name,
-                namespace=cpd_operator_ns,
-                command=["/bin/sh", "-c", wrapped_cmd],
-                stderr=True,
-                stdin=False,
-                stdout=True,
-                tty=False,
-            )
-            
-            if "__EXIT_CODE__=0" not in output:
-                raise RuntimeError(f"Delete command failed for Velero Backup '{backup_name}':\n{output}")
+            cmd = self.tenant_backup_delete_command(backup_name, oadp_ns)
+            print(f"Running in pod {cpd_operator_ns}/{pod_name}: {' '.join(cmd)}")
+            runner = PodExecRunner(self.kube, timeout=timeout, cancel=cancel)
+            exit_code = runner.run(pod_name, cpd_operator_ns, cmd)
+            if exit_code != 0:
+                raise RuntimeError(f"Delete command failed for Velero Backup '{backup_name}' with exit code {exit_code}, last output:\n{runner.tail_text()}")
             
             print(f"Successfully deleted tenant backup via Velero Backup CR: {backup_name}")
-            print("Command Output: ")
-            print(output)
                 
         except Exception as ex:
             raise Exception(f"Failed to delete tenant backup for Trident Protect backup '{backup_name}' in namespace '{cpd_operator_ns}': {ex}")
 
+    def delete_tenant_backups(self, backup_names: list[str], cpd_operator_ns: str, oadp_ns: str, timeout: float = DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC, cancel: threading.Event = None) -> dict[str, str]:
+        """Deletes several CPD tenant backups through one TenantServiceExecSession
+
+        All delete commands are pipelined into the session up front and their results collected in order, so the
+        cpdbr-tenant-service pod is resolved and connected to once for the whole batch.
+
+        Args:
+            backup_names: Names of the Trident Protect backups whose tenant-backups will be deleted
+            cpd_operator_ns: Name of the CPD tenant operator namespace
+            oadp_ns: OADP Operator namespace
+            timeout: Max time in seconds each delete command may run (None for no limit)
+            cancel: Event abandoning the remaining deletes once set
+
+        Returns:
+            Error message per backup name, None for the tenant-backups that were deleted
+        """
+        results = {}
+        with TenantServiceExecSession(cpd_operator_ns, cpdbr=self, timeout=timeout, cancel=cancel) as session:
+            try:
+                for backup_name in backup_names:
+                    session.submit(self.tenant_backup_delete_command(backup_name, oadp_ns))
+            except Exception as ex:
+                return {backup_name: f"tenant-backup delete was not run: {ex}" for backup_name in backup_names}
+            for i, backup_name in enumerate(backup_names):
+                print(TextColor.blue(f"** Deleting CPD tenant backup '{backup_name}' ({i + 1}/{len(backup_names)})..."))
+                try:
+                    exit_code, tail = session.collect()
+                except Exception as ex:
+                    results[backup_name] = str(ex)
+                    for skipped in backup_names[i + 1:]:
+                        results[skipped] = f"tenant-backup delete was not run: the exec session was closed after deleting '{backup_name}' failed"
+                    break
+                if exit_code == 0:
+                    print(TextColor.green(f"Successfully deleted CPD tenant backup '{backup_name}'"))
+                    results[backup_name] = None
+                else:
+                    results[backup_name] = f"Delete command failed for Velero Backup '{backup_name}' with exit code {exit_code}, last output:\n" + "\n".join(tail)
+                    print(TextColor.red(results[backup_name]))
+        return results
+
     def refresh_cpdbr_trident_protect_namespace_mapping_cm(self, cm_name:str, namespace: str, mapping_string: str, dry_run: bool):
         """
         Create, updates, or deletes the ConfigMap for Trident Protect Namespace Mapping based on the provided namespace mappings
@@ -973,7 +2824,7 @@ class CpdbrManager:
                 num_mappings_with_change_detected += 1
 
         # Update the ConfigMap if it exists ... 
-        api_instance = client.CoreV1Api()
+        api_instance = self.kube.core_v1
         
         existing_config_map = None
         try:
@@ -1019,6 +2870,136 @@ class CpdbrManager:
 
 
 
+class TenantServiceExecSession:
+    """Long-lived shell in the cpdbr-tenant-service pod running cpdbr-oadp commands over a single exec connection
+
+    The pod is resolved once and `/bin/sh` is started with stdin attached. Every command is written to the shell as
+    one line, run in a subshell with stdin from /dev/null and stderr merged into stdout, and followed by a marker
+    line carrying its exit code, so several commands can be submitted before the first result is collected. Results
+    are collected in submission order. A command that fails to finish within `timeout` (or is cancelled) leaves the
+    shell in an unknown state: the session is closed, its pending commands are dropped, and it is reopened on next use.
+    """
+
+    def __init__(self, cpd_operator_ns: str, cpdbr: CpdbrManager = None, timeout: float = DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC, cancel: threading.Event = None, on_line: Callable[[str], None] = None, tail_lines: int = DEFAULT_EXEC_OUTPUT_TAIL_LINES) -> None:
+        self.cpd_operator_ns = cpd_operator_ns
+        self.cpdbr = cpdbr or CpdbrManager()
+        self.timeout = timeout
+        self.cancel = cancel
+        self.on_line = on_line or PodExecRunner.print_line
+        self.tail_lines = tail_lines
+        self.marker = f"__CPDBR_EXIT_{uuid.uuid4().hex}__"
+        self.pod_name = None
+        self._resp = None
+        self._rest = ""
+        self._status = ""
+        self._seq = 0
+        self._pending = collections.deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def resolve_pod(self) -> str:
+        """Returns the running cpdbr-tenant-service pod, looked up once per session"""
+        if self.pod_name is None:
+            deploy = self.cpdbr.verify_tenant_service_healthy(self.cpd_operator_ns)
+            pod_label_selector = ",".join([f"{k}={v}" for k, v in deploy.spec.selector.match_labels.items()])
+            self.pod_name = self.cpdbr.get_tenant_service_pod_name(pod_label_selector, self.cpd_operator_ns)
+        return self.pod_name
+
+    def open(self):
+        """Starts the shell unless it is already running"""
+        if self._resp is not None and self._resp.is_open():
+            return
+        pod_name = self.resolve_pod()
+        self._resp = PodExecRunner(self.cpdbr.kube).open(pod_name, self.cpd_operator_ns, ["/bin/sh"], stdin=True)
+        self._rest, self._status = "", ""
+        self._pending.clear()
+        log.info(f"opened exec session to pod {self.cpd_operator_ns}/{pod_name}")
+
+    def close(self):
+        """Ends the shell and closes the connection; pending commands are dropped"""
+        if self._resp is None:
+            return
+        try:
+            if self._resp.is_open():
+                self._resp.write_stdin("exit\n")
+        except Exception as e:
+            log.warning(f"error ending exec session to pod {self.cpd_operator_ns}/{self.pod_name}: {e}")
+        finally:
+            self._resp.close()
+            self._resp = None
+            self._pending.clear()
+
+    def submit(self, command: list[str]) -> int:
+        """Sends a command to the shell without waiting for it and returns its sequence number"""
+        self.open()
+        self._seq += 1
+        self._resp.write_stdin(f"( {shlex.join(command)} ) </dev/null 2>&1; printf '%s %s %s\\n' {self.marker} {self._seq} \"$?\"\n")
+        self._pending.append((self._seq, " ".join(command)))
+        return self._seq
+
+    def _next_line(self):
+        """Pops the next complete (or overlong) line of buffered output, None if there is none yet"""
+        line, sep, rest = self._rest.partition("\n")
+        if sep:
+            self._rest = rest
+            return line.rstrip("\r")
+        if len(self._rest) > EXEC_OUTPUT_MAX_LINE_CHARS:
+            line, self._rest = self._rest[:EXEC_OUTPUT_MAX_LINE_CHARS], self._rest[EXEC_OUTPUT_MAX_LINE_CHARS:]
+            return line
+        return None
+
+    def collect(self) -> tuple[int, list[str]]:
+        """Waits for the oldest submitted command and streams its output to `on_line`
+
+        Raises:
+            TimeoutError: If the command did not finish within the timeout (the session is closed)
+            Exception: If the session was cancelled, nothing was submitted or the shell exited unexpectedly
+
+        Returns:
+            Exit code and last output lines of the command
+        """
+        if not self._pending:
+            raise Exception("no command was submitted to the exec session")
+        seq, command = self._pending[0]
+        description = f'"{command}" in pod {self.cpd_operator_ns}/{self.pod_name}'
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        tail = collections.deque(maxlen=self.tail_lines)
+        while True:
+            line = self._next_line()
+            while line is not None:
+                output, found, result = line.partition(self.marker)
+                if output or not found:
+                    tail.append(output)
+                    self.on_line(output)
+                if found:
+                    result_seq, exit_code = result.split()
+                    if int(result_seq) == seq:
+                        self._pending.popleft()
+                        return int(exit_code), list(tail)
+                line = self._next_line()
+            if not self._resp.is_open():
+                self._resp = None
+                self._pending.clear()
+                raise Exception(f"shell exited while running {description}: {self._status.strip() or 'no status'}")
+            if self.cancel is not None and self.cancel.is_set():
+                self.close()
+                raise Exception(f"{description} was cancelled")
+            wait = EXEC_POLL_INTERVAL_SEC
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    self.close()
+                    raise TimeoutError(f"{description} did not finish within {self.timeout}s (the command may still be running in the pod), last output:\n" + "\n".join(tail))
+            self._resp.update(timeout=wait)
+            # the status is read before read_all(), which drops every buffered channel
+            self._status += self._resp.read_channel(EXEC_ERROR_CHANNEL)
+            self._rest += self._resp.read_all()
+
+
 class TridentProtectManager:
 
     def __init__(self, tp_namespace: str) -> None:
@@ -1026,77 +3007,116 @@ class TridentProtectManager:
             raise ValueError("tp_namespace cannot be empty")
         self.tp_namespace = tp_namespace
 
-        try:
-            k8s_config.load_incluster_config()
-        except k8s_config.ConfigException:
-            k8s_config.load_kube_config()
-        self.k8s_dyn_client = DynamicClient(client.ApiClient())
+        self.kube = KubeClientContext.get()
+        self.k8s_dyn_client = self.kube.dyn_client
 
     def get_tp_namespace(self):
         """Returns the trident protect namespace."""
         return self.tp_namespace
     
-    def _label_main_crds(self):
-        
-        crds = [
-            "catalogsources.operators.coreos.com",
-            "namespacescopes.operator.ibm.com",
-            "commonservices.operator.ibm.com",
-            "operatorgroups.operators.coreos.com"
-        ]
-        message = f"labeling main crds={crds} with 'icpdsupport/cpdbr=true'"
+    def _label_main_crds(self, applier: ServerSideApplier, dry_run: bool):
+        crds = list(CPD_MAIN_CRDS)
+        message = f"labeling main crds={crds} with '{LABEL_CPDBR}=true'" if not dry_run else f"labeling main crds={crds} with '{LABEL_CPDBR}=true' (Dry Run)"
         log.info(message)
         print(TextColor.blue(message))
 
-        for crd in crds:
-            command = ["oc", "label", "crd", f"{crd}", "icpdsupport/cpdbr=true", "--overwrite=true"]
-            command_str = " ".join(command)
-            
-            message = f"running command to label crd={crd}, command={command_str}"
-            log.info(message)
-            print(TextColor.blue(message))
+        results = applier.label_all(RESOURCE_CRD, crds, {LABEL_CPDBR: "true"}, dry_run)
+        for result in results:
+            log.info(result)
 
-            process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, stderr = process.communicate()
-            if process.returncode != 0:
-                raise Exception(f"Command exited with non-zero return code {process.returncode}:\n\n`{command_str}`\n\n{stderr.decode()}")
-            log.info(f"stdout={stdout}")
-            log.info(f"stderr={stderr}")
-        
         message = f"finished labeling main crds={crds}"
         log.info(message)
         print(TextColor.green(message))
 
-    def _delete_post_backup_hooks(self, cpd_operator_ns: str, dry_run: bool):
-        """Delete any existing post-backup hooks (deprecated hook type)"""
-        exechooks = self.get_exechooks(cr_namespace=cpd_operator_ns)
-        
-        if not exechooks or not hasattr(exechooks, 'items'):
-            return
-        
+    def _apply_yaml_definitions(self, yaml_definitions: list[dict], applier: ServerSideApplier, dry_run: bool):
+        """Applies yaml definitions ({"displayName", "manifest"}) of objects that do not depend on each other concurrently"""
+        for yaml_definition in yaml_definitions:
+            print()
+            if dry_run:
+                print(TextColor.blue(f"** Preview of manifest for {yaml_definition['displayName']} (Dry Run)..."))
+            else:
+                print(TextColor.blue(f"** Applying manifest for {yaml_definition['displayName']}..."))
+            print(yaml_definition["manifest"])
+
+        results = applier.apply_all([yaml_definition["manifest"] for yaml_definition in yaml_definitions], dry_run)
+
+        print()
+        for yaml_definition, result in zip(yaml_definitions, results):
+            log.info(result)
+            print(result)
+            print(TextColor.green(f"Successfully applied manifest for {yaml_definition['displayName']}")) if not dry_run else print(TextColor.green(f"Successfully validated manifest for {yaml_definition['displayName']} (Dry Run)"))
+
+    def _delete_post_backup_hooks(self, cpd_operator_ns: str, dry_run: bool) -> list[str]:
+        """Delete any existing post-backup hooks (deprecated hook type), returning the names of the deleted hooks"""
         post_backup_hooks = []
-        for hook in exechooks.items:
-            if hasattr(hook, 'metadata') and hasattr(hook.metadata, 'name') and hasattr(hook, 'spec') and hasattr(hook.spec, 'stage') and hasattr(hook.spec, 'action'):
-                if hook.spec.stage == 'Post' and hook.spec.action == 'Backup':
-                    post_backup_hooks.append(hook.metadata.name)
+        for hook in self.iter_exechooks(cpd_operator_ns, fields=["metadata.name", "spec.stage", "spec.action"]):
+            if hook.spec and hook.spec.stage == 'Post' and hook.spec.action == 'Backup':
+                post_backup_hooks.append(hook.metadata.name)
         
         if len(post_backup_hooks) > 0:
-            exechooks_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHook")
+            exechooks_api = self.kube.resource(RESOURCE_TP_EXECHOOK)
             for hook_name in post_backup_hooks:
                 if not dry_run:
                     try:
                         exechooks_api.delete(name=hook_name, namespace=cpd_operator_ns)
                     except Exception as e:
                         log.error(f"Failed to delete post-backup ExecHook '{hook_name}': {e}")
+        return post_backup_hooks
+
+    def _get_exechook_yaml_definitions(self, application_name: str, cpd_operator_ns: str, cpdbr_tenant_service_image_prefix: str, exec_hook_timeout: int) -> list[dict]:
+        """Returns the rendered ExecHook yaml definitions ({"displayName", "name", "manifest"}) of an Application"""
+        yaml_trident_protect_exechook_pre_snapshot = YamlTemplates.get_template_yaml_trident_protect_exechook_pre_snapshot(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+        yaml_trident_protect_exechook_post_snapshot = YamlTemplates.get_template_yaml_trident_protect_exechook_post_snapshot(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+        yaml_trident_protect_exechook_post_backup = YamlTemplates.get_template_yaml_trident_protect_exechook_post_backup(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+        yaml_trident_protect_exechook_post_restore = YamlTemplates.get_template_yaml_trident_protect_exechook_post_restore(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
 
-    def do_install(self, application_name: str, cpd_operator_ns: str, cpdbr_tenant_service_image_prefix: str, exec_hook_timeout: int, dry_run: bool, label_main_crds: bool = True):
+        return [
+            {"displayName": "yaml_trident_protect_exechook_pre_snapshot", "name": f"{application_name}-pre-snapshot", "manifest": yaml_trident_protect_exechook_pre_snapshot},
+            {"displayName": "yaml_trident_protect_exechook_post_snapshot", "name": f"{application_name}-post-snapshot", "manifest": yaml_trident_protect_exechook_post_snapshot},
+            {"displayName": "yaml_trident_protect_exechook_post_backup", "name": f"{application_name}-post-backup", "manifest": yaml_trident_protect_exechook_post_backup},
+            {"displayName": "yaml_trident_protect_exechook_post_restore", "name": f"{application_name}-post-restore", "manifest": yaml_trident_protect_exechook_post_restore},
+        ]
+
+    @staticmethod
+    def diff_exechooks(yaml_definitions: list[dict], exechooks: list) -> list[dict]:
+        """Compares rendered ExecHook yaml definitions against the live ExecHooks by content hash
+
+        Args:
+            yaml_definitions (list[dict]): rendered ExecHooks, as returned by _get_exechook_yaml_definitions
+            exechooks (list): live ExecHook objects of the namespace
+
+        Returns:
+            list[dict]: the yaml definitions, each extended with "state" (DRIFT_STATE_*), "desiredHash" and "liveHash"
+        """
+        live_hashes = {}
+        for hook in exechooks:
+            annotations = hook.metadata.annotations or {}
+            live_hashes[hook.metadata.name] = annotations.get(ANNOTATION_CONTENT_HASH) or ""
+
+        diff = []
+        for yaml_definition in yaml_definitions:
+            body = yaml.safe_load(yaml_definition["manifest"])
+            desired_hash = body["metadata"]["annotations"][ANNOTATION_CONTENT_HASH]
+            live_hash = live_hashes.get(yaml_definition["name"])
+            if live_hash is None:
+                state = DRIFT_STATE_MISSING
+            elif live_hash != desired_hash:
+                state = DRIFT_STATE_OUT_OF_DATE
+            else:
+                state = DRIFT_STATE_UP_TO_DATE
+            diff.append(dict(yaml_definition, state=state, desiredHash=desired_hash, liveHash=live_hash))
+        return diff
+
+    @Profiler.traced()
+    def do_install(self, application_name: str, cpd_operator_ns: str, cpdbr_tenant_service_image_prefix: str, exec_hook_timeout: int, dry_run: bool, label_main_crds: bool = True, force_conflicts: bool = False):
         if not application_name:
             raise ValueError("application_name cannot be empty")
 
         cpdbr = CpdbrManager()
+        applier = ServerSideApplier(self.kube, force_conflicts=force_conflicts)
 
         if label_main_crds:
-            self._label_main_crds()
+            self._label_main_crds(applier, dry_run)
 
         # Delete any existing post-backup hooks (deprecated)
         self._delete_post_backup_hooks(cpd_operator_ns, dry_run)
@@ -1105,23 +3125,11 @@ class TridentProtectManager:
         log.info(f"resolved namespaces: {resolved_namespaces}")
 
         yaml_trident_protect_application = YamlTemplates.get_template_yaml_trident_protect_application(application_name, cpd_operator_ns, resolved_namespaces)
-        yaml_trident_protect_exechook_pre_snapshot = YamlTemplates.get_template_yaml_trident_protect_exechook_pre_snapshot(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
-        yaml_trident_protect_exechook_post_snapshot = YamlTemplates.get_template_yaml_trident_protect_exechook_post_snapshot(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
-        yaml_trident_protect_exechook_post_backup = YamlTemplates.get_template_yaml_trident_protect_exechook_post_backup(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
-        yaml_trident_protect_exechook_post_restore = YamlTemplates.get_template_yaml_trident_protect_exechook_post_restore(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
 
-        yaml_definitions_to_apply = [{"displayName": "yaml_trident_protect_application", "manifest": yaml_trident_protect_application}, {"displayName": "yaml_trident_protect_exechook_pre_snapshot", "manifest": yaml_trident_protect_exechook_pre_snapshot}, {"displayName": "yaml_trident_protect_exechook_post_snapshot", "manifest": yaml_trident_protect_exechook_post_snapshot}, {"displayName": "yaml_trident_protect_exechook_post_backup", "manifest": yaml_trident_protect_exechook_post_backup}, {"displayName": "yaml_trident_protect_exechook_post_restore", "manifest": yaml_trident_protect_exechook_post_restore}]
-        for yaml_definition in yaml_definitions_to_apply:
-            print()
-            if dry_run:
-                print(TextColor.blue(f"** Preview of manifest for {yaml_definition['displayName']} (Dry Run)..."))
-                print(yaml_definition["manifest"])
-                continue
-            print(TextColor.blue(f"** Applying manifest for {yaml_definition['displayName']}..."))
-            print(yaml_definition["manifest"])
-            stdout = YamlTemplates.oc_apply_yaml_from_string(yaml_definition["manifest"])
-            print(stdout)
-            print(TextColor.green(f"Successfully applied manifest for {yaml_definition['displayName']}"))
+        # the ExecHooks reference the Application, so it is applied first and the ExecHooks are applied concurrently afterwards
+        self._apply_yaml_definitions([{"displayName": "yaml_trident_protect_application", "manifest": yaml_trident_protect_application}], applier, dry_run)
+        yaml_definitions_to_apply = self._get_exechook_yaml_definitions(application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+        self._apply_yaml_definitions(yaml_definitions_to_apply, applier, dry_run)
 
         print(TextColor.green(f"Successfully completed installation")) if not dry_run else print(TextColor.green(f"Successfully completed installation (Dry Run)"))
 
@@ -1129,35 +3137,37 @@ class TridentProtectManager:
             print()
             print("To perform the installation, re-run the command without the `--dry_run` option")
 
-    def do_upgrade(self, application_name: str, cpd_operator_ns: str, cpdbr_tenant_service_image_prefix: str, exec_hook_timeout: int, dry_run: bool):
+    @Profiler.traced()
+    def do_upgrade(self, application_name: str, cpd_operator_ns: str, cpdbr_tenant_service_image_prefix: str, exec_hook_timeout: int, dry_run: bool, force_conflicts: bool = False):
         if not application_name:
             raise ValueError("application_name cannot be empty")
 
-        exechooks = self.get_exechooks(cr_namespace=cpd_operator_ns)
+        applier = ServerSideApplier(self.kube, force_conflicts=force_conflicts)
+
+        exechooks = list(self.iter_exechooks(cpd_operator_ns, fields=["metadata.name", "metadata.annotations"]))
         
-        if not exechooks or not hasattr(exechooks, 'items') or len(exechooks.items) == 0:
+        if len(exechooks) == 0:
             raise ValueError(f"No ExecHooks found in namespace '{cpd_operator_ns}'. No existing installation detected. Please use the 'install' command to perform initial installation.")
         
         # Delete any existing post-backup hooks (deprecated)
-        self._delete_post_backup_hooks(cpd_operator_ns, dry_run)
-        
-        yaml_trident_protect_exechook_pre_snapshot = YamlTemplates.get_template_yaml_trident_protect_exechook_pre_snapshot(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
-        yaml_trident_protect_exechook_post_snapshot = YamlTemplates.get_template_yaml_trident_protect_exechook_post_snapshot(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
-        yaml_trident_protect_exechook_post_backup = YamlTemplates.get_template_yaml_trident_protect_exechook_post_backup(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
-        yaml_trident_protect_exechook_post_restore = YamlTemplates.get_template_yaml_trident_protect_exechook_post_restore(self.tp_namespace, application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+        deleted_hooks = self._delete_post_backup_hooks(cpd_operator_ns, dry_run)
+        live_exechooks = [hook for hook in exechooks if hook.metadata.name not in deleted_hooks]
 
-        yaml_definitions_to_apply = [{"displayName": "yaml_trident_protect_exechook_pre_snapshot", "manifest": yaml_trident_protect_exechook_pre_snapshot}, {"displayName": "yaml_trident_protect_exechook_post_snapshot", "manifest": yaml_trident_protect_exechook_post_snapshot}, {"displayName": "yaml_trident_protect_exechook_post_backup", "manifest": yaml_trident_protect_exechook_post_backup}, {"displayName": "yaml_trident_protect_exechook_post_restore", "manifest": yaml_trident_protect_exechook_post_restore}]
-        for yaml_definition in yaml_definitions_to_apply:
-            print()
-            if dry_run:
-                print(TextColor.blue(f"** Preview of manifest for {yaml_definition['displayName']} (Dry Run)..."))
-                print(yaml_definition["manifest"])
-                continue
-            print(TextColor.blue(f"** Applying manifest for {yaml_definition['displayName']}..."))
-            print(yaml_definition["manifest"])
-            stdout = YamlTemplates.oc_apply_yaml_from_string(yaml_definition["manifest"])
-            print(stdout)
-            print(TextColor.green(f"Successfully applied manifest for {yaml_definition['displayName']}"))
+        # only apply the ExecHooks whose rendered content hash differs from the one stamped on the live ExecHook
+        yaml_definitions = self._get_exechook_yaml_definitions(application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+        diff = TridentProtectManager.diff_exechooks(yaml_definitions, live_exechooks)
+        yaml_definitions_to_apply = [d for d in diff if d["state"] != DRIFT_STATE_UP_TO_DATE]
+
+        print()
+        for d in diff:
+            log.info(f'ExecHook "{d["name"]}" state={d["state"]} desiredHash={d["desiredHash"]} liveHash={d["liveHash"]}')
+            if d["state"] == DRIFT_STATE_UP_TO_DATE:
+                print(TextColor.green(f'ExecHook "{d["name"]}" is up-to-date, skipping'))
+            else:
+                print(TextColor.yellow(f'ExecHook "{d["name"]}" is {d["state"]}, will be applied'))
+
+        if yaml_definitions_to_apply:
+            self._apply_yaml_definitions(yaml_definitions_to_apply, applier, dry_run)
 
         print(TextColor.green(f"Successfully completed upgrade")) if not dry_run else print(TextColor.green(f"Successfully completed upgrade (Dry Run)"))
 
@@ -1165,6 +3175,72 @@ class TridentProtectManager:
             print()
             print("To perform the upgrade, re-run the command without the `--dry_run` option")
 
+    def get_exechook_drift(self, cpd_operator_ns: str, application_name: str, cpdbr_tenant_service_image_prefix: str, exec_hook_timeout: int) -> dict:
+        """Compares the ExecHooks of an operator namespace against the ones this version of the tool would apply, without writing anything
+
+        Args:
+            cpd_operator_ns (str): CPD tenant operator namespace
+            application_name (str): name of the Trident Protect Application; if empty, the only Application in the namespace is used
+            cpdbr_tenant_service_image_prefix (str): image prefix the ExecHooks are rendered with
+            exec_hook_timeout (int): ExecHook timeout the ExecHooks are rendered with
+
+        Raises:
+            Exception: If the Application cannot be determined
+
+        Returns:
+            dict: {"namespace", "application", "exechooks"} where exechooks is the result of diff_exechooks
+        """
+        if not application_name:
+            applications = self.kube.resource(RESOURCE_TP_APPLICATION).get(namespace=cpd_operator_ns)
+            names = [app.metadata.name for app in applications.items]
+            if len(names) != 1:
+                raise Exception(f'expected exactly one Application in namespace "{cpd_operator_ns}", found {names}; use --application_name to select one')
+            application_name = names[0]
+
+        exechooks = self.iter_exechooks(cpd_operator_ns, fields=["metadata.name", "metadata.annotations"])
+        yaml_definitions = self._get_exechook_yaml_definitions(application_name, cpd_operator_ns, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+        return {"namespace": cpd_operator_ns, "application": application_name, "exechooks": TridentProtectManager.diff_exechooks(yaml_definitions, exechooks)}
+
+    @Profiler.traced()
+    def do_drift(self, cpd_operator_namespaces: list[str], application_name: str, cpdbr_tenant_service_image_prefix: str, exec_hook_timeout: int):
+        """Reports out-of-date ExecHooks across CPD tenant operator namespaces
+
+        Raises:
+            Exception: If drift is detected in any namespace, or a namespace cannot be checked
+        """
+        def check(cpd_operator_ns: str):
+            try:
+                return self.get_exechook_drift(cpd_operator_ns, application_name, cpdbr_tenant_service_image_prefix, exec_hook_timeout)
+            except Exception as e:
+                return {"namespace": cpd_operator_ns, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=DEFAULT_APPLY_MAX_WORKERS) as executor:
+            reports = list(executor.map(check, cpd_operator_namespaces))
+
+        drifted = []
+        failed = []
+        for report in reports:
+            print()
+            if "error" in report:
+                failed.append(report["namespace"])
+                print(TextColor.red(f'** Namespace "{report["namespace"]}": {report["error"]}'))
+                continue
+            print(TextColor.blue(f'** Namespace "{report["namespace"]}" (Application "{report["application"]}"):'))
+            for d in report["exechooks"]:
+                log.info(f'namespace={report["namespace"]} ExecHook "{d["name"]}" state={d["state"]} desiredHash={d["desiredHash"]} liveHash={d["liveHash"]}')
+                line = f'{d["name"]:<60} {d["state"]}'
+                print(TextColor.green(line)) if d["state"] == DRIFT_STATE_UP_TO_DATE else print(TextColor.yellow(line))
+            if any(d["state"] != DRIFT_STATE_UP_TO_DATE for d in report["exechooks"]):
+                drifted.append(report["namespace"])
+
+        print()
+        if failed:
+            raise Exception(f"ExecHook drift check failed for namespaces {failed}" + (f", drift detected in namespaces {drifted}" if drifted else ""))
+        if drifted:
+            raise Exception(f"ExecHook drift detected in namespaces {drifted}; run the `upgrade` command to update them")
+        print(TextColor.green(f"No ExecHook drift detected in namespaces {cpd_operator_namespaces}"))
+
+    @Profiler.traced()
     def do_uninstall(self, application_name: str, cr_namespace: str, dry_run: bool):
         print()
         print(TextColor.blue(f'** Uninstalling ExecHooks associated with Application "{application_name}"...')) if not dry_run else print(TextColor.blue(f'** Uninstalling ExecHooks associated with Application "{application_name}" (Dry Run)...'))
@@ -1175,12 +3251,79 @@ class TridentProtectManager:
         self.delete_application(application_name, cr_namespace, dry_run)
 
         print()
-        print(TextColor.green(f"Successfully completed uninstallation")) if not dry_run else print(TextColor.green(f"Successfully completed uninstallation (Dry Run)"))
-
-        if dry_run:
-            print()
-            print("To perform the uninstallation, re-run the command without the `--dry_run` option")
+        print(TextColor.green(f"Successfully completed uninstallation")) if not dry_run else print(TextColor.green(f"Successfully completed uninstallation (Dry Run)"))
+
+        if dry_run:
+            print()
+            print("To perform the uninstallation, re-run the command without the `--dry_run` option")
+
+    def _check_no_running_backup(self, cr_namespace: str):
+        """Raises if a Backup created by this tool is Running in the namespace (lists all of them)"""
+        print(TextColor.blue(f"** Checking existing Trident Protect Backup CR(s)..."))
+        try:
+            cpdbr_trident_backups=self.iter_backups(cr_namespace, f"{LABEL_GENERATED_BY_CPDBR}", fields=["metadata.name", "status.state"])
+            running=[backup.metadata.name for backup in cpdbr_trident_backups if backup.status and backup.status.state == TRIDENT_PROTECT_STATUS_RUNNING]
+            num_running=len(running)
+            if num_running > 0:
+                log.info(f"found {num_running} Running Trident Protect Backup CR(s): {running}")
+                raise Exception(f'Detected {num_running} existing Trident Protect Backup CR(s) with {LABEL_GENERATED_BY_CPDBR} in a Running state - only one Running CPD Trident Protect backup is allowed at a time. Aborting backup...')
+        except Exception as e:
+            raise Exception(f'Error detecting existing Trident Protect Backup CR(s): {e}')
+
+    def is_backup_active(self, name: str, cr_namespace: str) -> bool:
+        """Returns True if the Backup exists and has not reached a terminal state yet
+
+        A single GET, or in long-lived processes a read of the synced Backup informer store, where a Backup created
+        or finished by someone else moments ago may not be seen yet (see InformerStore).
+        """
+        backup = self.get_backup_by_name_or_none(name, cr_namespace)
+        if backup is None:
+            return False
+        return not (backup.status and backup.status.state in TRIDENT_PROTECT_TERMINAL_STATES)
+
+    @Profiler.traced(cat="preflight")
+    def verify_backup_preflight(self, cpdbr: CpdbrManager, cr_namespace: str):
+        """Runs the checks required before creating a Backup of a CPD tenant
+
+        Args:
+            cpdbr: CpdbrManager used to check the cpdbr-tenant-service deployment
+            cr_namespace: CPD tenant operator namespace
+
+        Raises:
+            Exception: If the cpdbr-tenant-service deployment is not healthy or the ExecHook CRs do not match its image
+        """
+        print()
+        print(TextColor.blue(f"** Checking health of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={cr_namespace}) ..."))
+        cpdbr_tenant_service_deploy = cpdbr.verify_tenant_service_healthy(cpd_operator_ns=cr_namespace)
+        print(TextColor.green(f"Successfully detected healthy {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment"))
+        print()
+
+        print()
+        print(TextColor.blue(f"** Verifying ExecHook CR label selector against {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={cr_namespace}) ..."))
+        try:
+            cpdbr_tenant_service_deploy_image = str(cpdbr_tenant_service_deploy.spec.template.spec.containers[0].image)
+            if cpdbr_tenant_service_deploy_image == "":
+                raise Exception(f"expected .spec.template.spec.containers[0].image of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} to be a non-empty string")
+        except Exception as ex:
+            raise RuntimeError(f"error getting {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment image: err={ex}")
+        try:
+            exechooks = self.kube.store(RESOURCE_TP_EXECHOOK, cr_namespace).list()
+            log.info(f"ExecHooks: \n\n{exechooks}\n")
+            if len(exechooks) == 0:
+                raise Exception("expected exechooks to be a non-empty list, please run cpd-trident-protect.py install command or check with 'oc get exechooks.protect.trident.netapp.io -n $PROJECT_CPD_INST_OPERATORS'")
+            for exechook in exechooks:
+                try:
+                    container_image_prefix = str(exechook.spec.matchingCriteria[0].value)
+                except:
+                    raise Exception(f'error parsing container_image_prefix for ExecHook CR "{exechook.metadata.name}"')
+                if not cpdbr_tenant_service_deploy_image.startswith(container_image_prefix):
+                    raise Exception(f'expected .spec.matchingCriteria[0] of ExecHook "{exechook.metadata.name}" to match {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment image "{cpdbr_tenant_service_deploy_image}", received {container_image_prefix} - please update the {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment image or reinstall the ExecHook CR(s) with the proper image prefix')
+        except Exception as ex:
+            raise RuntimeError(f"error verifying ExecHook CRs: {ex}")
+        print(TextColor.green(f"Successfully verified ExecHook CR label selector against {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={cr_namespace})"))
+        print()
 
+    @Profiler.traced()
     def do_backup(
         self,
         app_vault: str,
@@ -1196,53 +3339,202 @@ class TridentProtectManager:
         full_backup: bool=False,
         snapshot_completion_timeout: str=DEFAULT_SNAPSHOT_COMPLETION_TIMEOUT,
         volume_snapshots_created_timeout: str=DEFAULT_VOLUME_SNAPSHOTS_CREATED_TIMEOUT,
-        volume_snapshots_ready_to_use_timeout: str=DEFAULT_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT
+        volume_snapshots_ready_to_use_timeout: str=DEFAULT_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT,
+        cr_backend: str=CR_BACKEND_TRIDENTCTL
     ):
         tp_namespace=self.get_tp_namespace()
         
         print(f"trident protect namespace: {tp_namespace}")
         print(f"cr namespace: {cr_namespace}")
 
-        print()
-        print(TextColor.blue(f"** Checking existing Trident Protect Backup CR(s)..."))
-        tpm = TridentProtectManager(tp_namespace)
-        try:
-            cpdbr_trident_backups=tpm.get_backups(cr_namespace, f"{LABEL_GENERATED_BY_CPDBR}").items
-            running=[backup for backup in cpdbr_trident_backups if backup.status.state == TRIDENT_PROTECT_STATUS_RUNNING]
-            num_running=len(running)
-            if num_running > 0:
-                log.info(f"found {num_running} Running Trident Protect Backup CR(s): \n\n{cpdbr_trident_backups}")
-                raise Exception(f'Detected {num_running} existing Trident Protect Backup CR(s) with {LABEL_GENERATED_BY_CPDBR} in a Running state - only one Running CPD Trident Protect backup is allowed at a time. Aborting backup...')
-        except Exception as e:
-            raise Exception(f'Error detecting existing Trident Protect Backup CR(s): {e}')
-
         existing_backup = self.get_backup_by_name_or_none(backup_name, cr_namespace)
         if existing_backup is not None:
             raise Exception(f'Trident Protect Backup CR with name "{backup_name}" already exists, aborting backup...')
 
         print()
-        print(TextColor.blue(f"** Creating backup CR from tridentctl-protect create...")) if not dry_run else print(TextColor.blue(f"** Preview of backup CR from tridentctl-protect create (Dry Run)..."))
-        stdout = TridentProtectCliWrapper.backup_create(
-            backup_name=backup_name,
-            cr_namespace=cr_namespace,
-            appvault_name=app_vault,
-            application_name=application,
-            tp_namespace=self.get_tp_namespace(),
-            dry_run=dry_run,
-            data_mover=data_mover,
-            pvc_bind_timeout_sec=pvc_bind_timeout_sec,
-            reclaim_policy=reclaim_policy,
-            snapshot=snapshot,
-            data_mover_timeout_sec=data_mover_timeout_sec,
-            full_backup=full_backup,
-            snapshot_completion_timeout=snapshot_completion_timeout,
-            volume_snapshots_created_timeout=volume_snapshots_created_timeout,
-            volume_snapshots_ready_to_use_timeout=volume_snapshots_ready_to_use_timeout
-        )
+        print(TextColor.blue(f"** Acquiring backup Lease {BACKUP_LEASE_NAME}..."))
+        lease = BackupLease(cr_namespace)
+        try:
+            guarded = lease.acquire(
+                holder=backup_name,
+                is_holder_running=lambda name: self.is_backup_active(name, cr_namespace),
+                legacy_check=lambda: self._check_no_running_backup(cr_namespace),
+                dry_run=dry_run
+            )
+        except Exception as e:
+            raise Exception(f'Error acquiring backup Lease: {e}')
+        print(TextColor.green(f"Successfully acquired backup Lease {BACKUP_LEASE_NAME}" if guarded else "No Running CPD Trident Protect backup detected"))
+
+        print()
+        backend_desc = "tridentctl-protect create" if cr_backend == CR_BACKEND_TRIDENTCTL else "the Kubernetes API"
+        print(TextColor.blue(f"** Creating backup CR from {backend_desc}...")) if not dry_run else print(TextColor.blue(f"** Preview of backup CR from {backend_desc} (Dry Run)..."))
+        try:
+            stdout = TridentProtectCrBackend.for_backend(cr_backend).backup_create(
+                backup_name=backup_name,
+                cr_namespace=cr_namespace,
+                appvault_name=app_vault,
+                application_name=application,
+                tp_namespace=self.get_tp_namespace(),
+                dry_run=dry_run,
+                data_mover=data_mover,
+                pvc_bind_timeout_sec=pvc_bind_timeout_sec,
+                reclaim_policy=reclaim_policy,
+                snapshot=snapshot,
+                data_mover_timeout_sec=data_mover_timeout_sec,
+                full_backup=full_backup,
+                snapshot_completion_timeout=snapshot_completion_timeout,
+                volume_snapshots_created_timeout=volume_snapshots_created_timeout,
+                volume_snapshots_ready_to_use_timeout=volume_snapshots_ready_to_use_timeout
+            )
+        except Exception:
+            if guarded and not dry_run:
+                lease.release(backup_name)
+            raise
         print(stdout)
-        print(TextColor.green("Successfully created Backup via tridentctl-protect")) if not dry_run else None
+        print(TextColor.green(f"Successfully created Backup via {'tridentctl-protect' if cr_backend == CR_BACKEND_TRIDENTCTL else 'the Kubernetes API'}")) if not dry_run else None
+
+    @Profiler.traced()
+    def do_backup_list(self, cr_namespace: str, label_selector: str, output: str = LIST_OUTPUT_TABLE, columns: str = None):
+        """Lists the Backups of a namespace transferring as little as possible
+
+        Name output requests metadata only. Table output uses the server-side printed table (the printer columns of
+        the Backup CRD), falling back to the default columns if the server cannot provide one. JSON output and
+        custom columns are evaluated with JSONPath-lite expressions on each page as it arrives.
+
+        Args:
+            cr_namespace (str): namespace of the Backups
+            label_selector (str): label selector restricting the listed Backups (empty for all)
+            output (str): one of LIST_OUTPUT_*
+            columns (str): custom NAME=JSONPath columns, separated by commas
+        """
+        backups_api = self.kube.resource(RESOURCE_TP_BACKUP)
+        label_selector = label_selector or None
+
+        if output == LIST_OUTPUT_NAME:
+            for backup in list_in_pages(backups_api, namespace=cr_namespace, label_selector=label_selector, metadata_only=True):
+                print(f"backup.{backups_api.group}/{backup.metadata.name}")
+            return
+
+        if output in (LIST_OUTPUT_TABLE, LIST_OUTPUT_WIDE) and not columns:
+            try:
+                rows = list(list_in_pages(backups_api, namespace=cr_namespace, label_selector=label_selector, as_table=True))
+                column_defs = rows[0].columns if rows else []
+                visible = [c["name"] for c in column_defs if output == LIST_OUTPUT_WIDE or not c.get("priority")]
+                TridentProtectManager.print_table([name.upper() for name in visible], [[row.cells[name] for name in visible] for row in rows], cr_namespace)
+                return
+            except (RuntimeError, ApiException) as e:
+                log.info(f"server-side table not available for {backups_api.kind}, using default columns: {e}")
+
+        jsonpaths = parse_list_columns(columns or DEFAULT_BACKUP_LIST_COLUMNS)
+        rows = list_in_pages(backups_api, namespace=cr_namespace, label_selector=label_selector, jsonpaths=jsonpaths)
+        if output == LIST_OUTPUT_JSON:
+            print(json.dumps([dict(row) for row in rows], indent=2))
+            return
+        TridentProtectManager.print_table([name for name, _ in jsonpaths], [[row[name] for name, _ in jsonpaths] for row in rows], cr_namespace)
+
+    @staticmethod
+    def get_backup_timeline(backup: object) -> dict:
+        """Collects the timestamps of a Backup: creation, completion, its True status conditions and the first start and
+        last completion of each of its hook run results
+
+        Returns:
+            dict of event name -> datetime (events without a timestamp are left out)
+        """
+        timeline = {
+            "created": parse_k8s_timestamp(backup.metadata.creationTimestamp),
+            "completed": parse_k8s_timestamp(backup.status.completionTimestamp) if backup.status else None,
+        }
+        status = backup.status
+        for condition in (status.conditions if status else None) or []:
+            if str(condition.status) == "True":
+                timeline[f"condition:{condition.type}"] = parse_k8s_timestamp(condition.lastTransitionTime)
+        for event, hook_results_field in zip(("pre_snapshot_hooks", "post_snapshot_hooks", "post_backup_hooks"), BACKUP_HOOK_RESULTS_FIELDS):
+            results = (status[hook_results_field] if status else None) or []
+            starts = [parse_k8s_timestamp(result.startTimestamp or result.startTime) for result in results]
+            ends = [parse_k8s_timestamp(result.completionTimestamp or result.completionTime) for result in results]
+            timeline[f"{event}_start"] = min((t for t in starts if t), default=None)
+            timeline[f"{event}_end"] = max((t for t in ends if t), default=None)
+        return {event: t for event, t in timeline.items() if t is not None}
+
+    @staticmethod
+    def get_backup_phase_durations(timeline: dict) -> dict:
+        """Returns the duration in seconds of each of BACKUP_REPORT_PHASES (None if the timeline lacks its events)"""
+        durations = {}
+        for phase, start_events, end_events in BACKUP_REPORT_PHASES:
+            start = next((timeline[e] for e in start_events if e in timeline), None)
+            end = next((timeline[e] for e in end_events if e in timeline), None)
+            durations[phase] = (end - start).total_seconds() if start and end and end >= start else None
+        return durations
+
+    def do_backup_report(self, targets: dict, label_selector: str, output: str = LIST_OUTPUT_TABLE):
+        """Reports the phase durations of Backups and their percentiles across the Completed ones
+
+        Args:
+            targets: namespace -> names of the Backups to report, or None for every Backup matching label_selector
+            label_selector: label selector of the list calls
+            output: LIST_OUTPUT_TABLE or LIST_OUTPUT_JSON
+        """
+        backups_api = self.kube.resource(RESOURCE_TP_BACKUP)
+        backups = {ns: list_in_pages(backups_api, namespace=ns, label_selector=label_selector or None, fields=BACKUP_REPORT_FIELDS) for ns in targets}
+        self.print_backup_report(targets, backups, output)
+
+    @staticmethod
+    def print_backup_report(targets: dict, backups: dict, output: str = LIST_OUTPUT_TABLE):
+        """Prints the backup report of do_backup_report from Backups fetched by the caller (API server or catalog)
+
+        Args:
+            targets: namespace -> names of the Backups to report, or None for every Backup given
+            backups: namespace -> iterable of Backups (ResourceFields with at least BACKUP_REPORT_FIELDS)
+            output: LIST_OUTPUT_TABLE or LIST_OUTPUT_JSON
+        """
+        reports = []
+        for ns, names in targets.items():
+            for backup in backups[ns]:
+                if names is not None and backup.metadata.name not in names:
+                    continue
+                timeline = TridentProtectManager.get_backup_timeline(backup)
+                reports.append({
+                    "namespace": ns,
+                    "name": backup.metadata.name,
+                    "state": (backup.status.state if backup.status else None) or "",
+                    "created": backup.metadata.creationTimestamp,
+                    "durations": TridentProtectManager.get_backup_phase_durations(timeline),
+                })
+        reports.sort(key=lambda r: (r["created"] or "", r["namespace"], r["name"]))
+
+        phases = [phase for phase, _, _ in BACKUP_REPORT_PHASES]
+        stats = {}
+        for phase in phases:
+            values = [r["durations"][phase] for r in reports if r["state"] == TRIDENT_PROTECT_STATUS_COMPLETED and r["durations"][phase] is not None]
+            stats[phase] = {"count": len(values), **{f"p{p}": percentile(values, p) for p in BACKUP_REPORT_PERCENTILES}, "max": max(values, default=None)}
+
+        if output == LIST_OUTPUT_JSON:
+            print(json.dumps({"backups": reports, "percentiles": stats}, indent=2))
+            return
+
+        rows = [[r["namespace"], r["name"], r["state"], r["created"]] + [format_duration(r["durations"][phase]) for phase in phases] for r in reports]
+        TridentProtectManager.print_table(["NAMESPACE", "NAME", "STATE", "CREATED"] + [phase.upper() for phase in phases], rows, ", ".join(targets))
+        if not reports:
+            return
+        print()
+        print(TextColor.blue(f"** Phase durations across {sum(1 for r in reports if r['state'] == TRIDENT_PROTECT_STATUS_COMPLETED)} Completed backup(s):"))
+        stat_names = [f"p{p}" for p in BACKUP_REPORT_PERCENTILES] + ["max"]
+        rows = [[phase, stats[phase]["count"]] + [format_duration(stats[phase][name]) for name in stat_names] for phase in phases]
+        TridentProtectManager.print_table(["PHASE", "COUNT"] + [name.upper() for name in stat_names], rows, ", ".join(targets))
+
+    @staticmethod
+    def print_table(headers: list[str], rows: list[list], cr_namespace: str):
+        """Prints rows as left-aligned columns under the given headers"""
+        if not rows:
+            print(f"No resources found in {cr_namespace} namespace.")
+            return
+        cells = [["" if v is None else (",".join(str(x) for x in v) if isinstance(v, list) else str(v)) for v in row] for row in rows]
+        widths = [max(len(headers[i]), *(len(row[i]) for row in cells)) for i in range(len(headers))]
+        for line in [headers] + cells:
+            print("   ".join(value.ljust(widths[i]) for i, value in enumerate(line)).rstrip())
 
-    def do_backup_delete(self, backup_name: str, cr_namespace: str, oadp_namespace: str, no_prompt: bool = False):
+    @Profiler.traced()
+    def do_backup_delete(self, backup_name: str, cr_namespace: str, oadp_namespace: str, no_prompt: bool = False, cr_backend: str = CR_BACKEND_TRIDENTCTL, tenant_backup_delete_timeout: int = DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC):
         tp_namespace = self.get_tp_namespace()
 
         print(f"trident protect namespace: {self.get_tp_namespace()}")
@@ -1263,7 +3555,7 @@ class TridentProtectManager:
                     raise Exception('Operation aborted by user.')
             
             print(TextColor.blue(f"** Deleting Trident Protect Backup CR..."))
-            stdout = TridentProtectCliWrapper.backup_delete(
+            stdout = TridentProtectCrBackend.for_backend(cr_backend).backup_delete(
                 backup_name=backup_name,
                 cr_namespace=cr_namespace,
                 tp_namespace=tp_namespace
@@ -1286,11 +3578,11 @@ class TridentProtectManager:
                 if not prompt_user_confirmation(f"Are you sure you want to delete the CPD Tenant Backup '{backup_name}'?"):
                     raise Exception('Operation aborted by user.')
             print(TextColor.blue(f"** Deleting CPD tenant backup..."))
-            stdout = cpdbr.delete_tenant_backup(backup_name=backup_name, cpd_operator_ns=cr_namespace, oadp_ns=oadp_namespace)
-            print(stdout)
+            cpdbr.delete_tenant_backup(backup_name=backup_name, cpd_operator_ns=cr_namespace, oadp_ns=oadp_namespace, timeout=tenant_backup_delete_timeout)
             print(TextColor.green(f"Successfully deleted CPD tenant backup '{backup_name}'"))
         print()
 
+    @Profiler.traced()
     def do_restore_create(
         self,
         app_vault: str,
@@ -1301,7 +3593,8 @@ class TridentProtectManager:
         dry_run: bool,
         data_mover_timeout_sec: int,
         storageclass_mappings: str,
-        pvc_bind_timeout_sec: str
+        pvc_bind_timeout_sec: str,
+        cr_backend: str = CR_BACKEND_TRIDENTCTL
     ):
 
         print(f"trident protect namespace: {self.get_tp_namespace()}")
@@ -1310,7 +3603,7 @@ class TridentProtectManager:
         try:
             print()
             print(TextColor.blue("** Creating BackupRestore...")) if not dry_run else print(TextColor.blue("** Creating BackupRestore (Dry Run)..."))
-            stdout = TridentProtectCliWrapper.restore_create(
+            stdout = TridentProtectCrBackend.for_backend(cr_backend).restore_create(
                 restore_name=restore_name,
                 appvault_name=app_vault,
                 cr_namespace=cr_namespace,
@@ -1327,8 +3620,19 @@ class TridentProtectManager:
             log.info(e)
             raise Exception(e)
 
-        print(TextColor.green("Successfully created BackupRestore via tridentctl-protect"))
+        print(TextColor.green(f"Successfully created BackupRestore via {'tridentctl-protect' if cr_backend == CR_BACKEND_TRIDENTCTL else 'the Kubernetes API'}"))
+
+    @staticmethod
+    def _retry_status_check(policy: PollingPolicy, wait: bool, message: str) -> bool:
+        """Sleeps for the next interval of the policy and returns True if a failed status check should be retried"""
+        if not wait or policy.expired():
+            return False
+        interval = policy.next_interval()
+        print(TextColor.blue(f"{message}, retrying in {interval:.1f} seconds"))
+        time.sleep(interval)
+        return True
 
+    @Profiler.traced()
     def do_backup_status(self, backup_name: str, cr_namespace: str, wait: bool):
 
         print(f"trident protect namespace: {self.get_tp_namespace()}")
@@ -1339,13 +3643,16 @@ class TridentProtectManager:
         print()
         print(TextColor.blue(f"** Checking Backup CR status... (backup_name={backup_name}, cr_namespace={cr_namespace})"))
 
-        retry_count = 3
+        settle_policy = PollingPolicy(max_interval=DEFAULT_STATUS_SETTLE_TIMEOUT_SEC / 3, deadline=DEFAULT_STATUS_SETTLE_TIMEOUT_SEC)
         while True:
             if wait:
                 try:
                     print()
                     print(TextColor.blue("** Waiting for Backup to finish..."))
-                    self.wait_for_backup(backup_name, cr_namespace, None, 10)
+                    lease = BackupLease(cr_namespace)
+                    with lease.renewing(backup_name):
+                        self.wait_for_backup(backup_name, cr_namespace, None, 10)
+                    lease.release(backup_name)
                 except Exception as e:
                     log.info(e)
                     raise Exception(e)
@@ -1365,24 +3672,15 @@ class TridentProtectManager:
                 raise Exception(e)
 
             if getattr(backup_obj, "status") is None:
-                if wait and retry_count > 0:
-                    retry_count = retry_count - 1
-                    print(TextColor.blue(f'missing "status" field in Backup "{backup_name}", retrying in 5 seconds'))
-                    time.sleep(5)
+                if self._retry_status_check(settle_policy, wait, f'missing "status" field in Backup "{backup_name}"'):
                     continue
                 raise Exception(f'missing "status" field in Backup "{backup_name}"')
             if getattr(backup_obj.status, "state") is None:
-                if wait and retry_count > 0:
-                    retry_count = retry_count - 1
-                    print(TextColor.blue(f'missing ".status.state" field in Backup "{backup_name}", retrying in 5 seconds'))
-                    time.sleep(5)
+                if self._retry_status_check(settle_policy, wait, f'missing ".status.state" field in Backup "{backup_name}"'):
                     continue
                 raise Exception(f'missing ".status.state" field in Backup "{backup_name}"')
             if backup_obj.status.state != TRIDENT_PROTECT_STATUS_COMPLETED:
-                if wait and retry_count > 0:
-                    retry_count = retry_count - 1
-                    print(TextColor.blue(f'Expected backup .status.state to be "{TRIDENT_PROTECT_STATUS_COMPLETED}": received "{backup_obj.status.state}", retrying in 5 seconds'))
-                    time.sleep(5)
+                if self._retry_status_check(settle_policy, wait, f'Expected backup .status.state to be "{TRIDENT_PROTECT_STATUS_COMPLETED}": received "{backup_obj.status.state}"'):
                     continue
                 raise Exception(f'Expected backup .status.state to be "{TRIDENT_PROTECT_STATUS_COMPLETED}": received "{backup_obj.status.state}", backup_name="{backup_name}"')
             if backup_obj.status.state == TRIDENT_PROTECT_STATUS_COMPLETED:
@@ -1391,14 +3689,14 @@ class TridentProtectManager:
         print()
         print(TextColor.blue("** Validating backup hook results..."))
         try:
-            self.check_for_hook_results_failures_in_backup(backup_obj, "preSnapshotExecHooksRunResults")
-            self.check_for_hook_results_failures_in_backup(backup_obj, "postSnapshotExecHooksRunResults")
-            self.check_for_hook_results_failures_in_backup(backup_obj, "postBackupExecHooksRunResults")
+            for hook_results_field in BACKUP_HOOK_RESULTS_FIELDS:
+                self.check_for_hook_results_failures_in_backup(backup_obj, hook_results_field)
         except Exception as e:
             raise Exception(f"Error checking for hook failures in backup '{backup_name}': {e}")
 
         print(TextColor.green("Successfully completed backup"))
 
+    @Profiler.traced()
     def do_restore_status(self, restore_name: str, cr_namespace: str, wait: bool):
 
         print(f"trident protect namespace: {self.get_tp_namespace()}")
@@ -1409,7 +3707,7 @@ class TridentProtectManager:
         print()
         print(TextColor.blue(f"** Checking BackupRestore CR status... (restore_name={restore_name}, cr_namespace={cr_namespace})"))
 
-        retry_count = 3
+        settle_policy = PollingPolicy(max_interval=DEFAULT_STATUS_SETTLE_TIMEOUT_SEC / 3, deadline=DEFAULT_STATUS_SETTLE_TIMEOUT_SEC)
         while True:
             if wait:
                 try:
@@ -1435,24 +3733,15 @@ class TridentProtectManager:
                 raise Exception(e)
 
             if getattr(backup_restore_obj, "status") is None:
-                if wait and retry_count > 0:
-                    retry_count = retry_count - 1
-                    print(TextColor.blue(f'missing "status" field in BackupRestore "{restore_name}", retrying in 5 seconds'))
-                    time.sleep(5)
+                if self._retry_status_check(settle_policy, wait, f'missing "status" field in BackupRestore "{restore_name}"'):
                     continue
                 raise Exception(f'missing "status" field in BackupRestore "{restore_name}"')
             if getattr(backup_restore_obj.status, "state") is None:
-                if wait and retry_count > 0:
-                    retry_count = retry_count - 1
-                    print(TextColor.blue(f'missing ".status.state" field in BackupRestore "{restore_name}", retrying in 5 seconds'))
-                    time.sleep(5)
+                if self._retry_status_check(settle_policy, wait, f'missing ".status.state" field in BackupRestore "{restore_name}"'):
                     continue
                 raise Exception(f'missing ".status.state" field in BackupRestore "{restore_name}"')
             if backup_restore_obj.status.state != TRIDENT_PROTECT_STATUS_COMPLETED:
-                if wait and retry_count > 0:
-                    retry_count = retry_count - 1
-                    print(TextColor.blue(f'expected BackupRestore "{restore_name}" to be "{TRIDENT_PROTECT_STATUS_COMPLETED}", received "{backup_restore_obj.status.state}", retrying in 5 seconds'))
-                    time.sleep(5)
+                if self._retry_status_check(settle_policy, wait, f'expected BackupRestore "{restore_name}" to be "{TRIDENT_PROTECT_STATUS_COMPLETED}", received "{backup_restore_obj.status.state}"'):
                     continue
                 raise Exception(f'expected BackupRestore "{restore_name}" to be "{TRIDENT_PROTECT_STATUS_COMPLETED}", received "{backup_restore_obj.status.state}"')
             if backup_restore_obj.status.state == TRIDENT_PROTECT_STATUS_COMPLETED:
@@ -1501,57 +3790,228 @@ class TridentProtectManager:
 
         print()
 
-    def get_backups(self, cr_namespace: str, label_selector: str):
-        try:
-            backups_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="Backup")
+    @staticmethod
+    def get_status_targets(names: list[str], cr_namespaces: list[str]) -> dict:
+        """Groups the CR names given to a status command by namespace
 
-            res = backups_api.get(namespace=cr_namespace, label_selector=label_selector)
-            return res
-        except ResourceNotFoundError as ex:
-            raise ex
-        except ApiException as ex:
-            log.error("Exception when calling ResourceApi->get: %s" % ex)
-            raise ex
+        Names are either plain (tracked in the only given namespace) or qualified as <namespace>/<name>.
 
-    def get_backup_by_name(self, name: str, cr_namespace: str):
+        Returns:
+            dict of namespace -> list of names, or namespace -> None (track every CR matching the selector) without names
+        """
+        if not names:
+            return {ns: None for ns in cr_namespaces}
+        targets = {}
+        for name in names:
+            ns, sep, short_name = name.rpartition("/")
+            if not sep:
+                if len(cr_namespaces) != 1:
+                    raise Exception(f'name "{name}" is ambiguous with {len(cr_namespaces)} namespaces, use <namespace>/<name>')
+                ns = cr_namespaces[0]
+            targets.setdefault(ns, [])
+            if short_name not in targets[ns]:
+                targets[ns].append(short_name)
+        return targets
+
+    @Profiler.traced()
+    def do_status_many(self, kind: str, targets: dict, label_selector: str, wait: bool, policy: PollingPolicy = None) -> dict:
+        """Reports the state of many Backups or BackupRestores at once
+
+        Every tick lists each namespace once and fans the result out to the tracked CRs, so the API calls scale with the
+        number of namespaces rather than the number of CRs. Completed Backups are also checked for hook failures from the
+        same list response; the post-restore ExecHooksRun of a BackupRestore is only validated by the single-CR status.
+        A CR that disappears is NotFound at once, while waiting for a named CR that was never seen (e.g. right after it
+        was requested) continues for up to DEFAULT_STATUS_SETTLE_TIMEOUT_SEC before it is NotFound.
+
+        Args:
+            kind: "Backup" or "BackupRestore"
+            targets: namespace -> names of the CRs to track, or None to track every CR matching label_selector
+            label_selector: label selector of the list calls
+            wait: If True, polls until every tracked CR is in a terminal state
+            policy: polling schedule while waiting (default: PollingPolicy())
+
+        Raises:
+            Exception: If no CR matches, or (once all tracked CRs are done) any of them is not Completed or has hook failures
+
+        Returns:
+            dict of (namespace, name) -> state
+        """
+        resource_api = self.kube.resource((TRIDENT_PROTECT_API_VERSION, kind))
+        fields = ["metadata.name", "status.state", "status.error"]
+        if kind == RESOURCE_TP_BACKUP[1]:
+            fields += [f"status.{field}" for field in BACKUP_HOOK_RESULTS_FIELDS]
+        policy = policy or PollingPolicy()
+
+        print(f"trident protect namespace: {self.get_tp_namespace()}")
+        print(f"namespaces: {', '.join(targets)}")
+        print(f"label selector: {label_selector}")
+        print(f"wait: {wait}")
+        print()
+        print(TextColor.blue(f"** Checking {kind} CR status..."))
+
+        states = {(ns, name): None for ns, names in targets.items() for name in names or []}
+        errors = {}
+        seen = set()
+        settle_policy = PollingPolicy(max_interval=DEFAULT_STATUS_SETTLE_TIMEOUT_SEC / 3, deadline=DEFAULT_STATUS_SETTLE_TIMEOUT_SEC)
+        while True:
+            for ns, names in targets.items():
+                listed = set()
+                finished = set()
+                for obj in list_in_pages(resource_api, namespace=ns, label_selector=label_selector or None, fields=fields):
+                    name = obj.metadata.name
+                    if names is not None and name not in names:
+                        continue
+                    listed.add(name)
+                    seen.add((ns, name))
+                    state = (obj.status.state if obj.status else None) or ""
+                    errors[(ns, name)] = obj.status.error if obj.status else None
+                    if state == TRIDENT_PROTECT_STATUS_COMPLETED and kind == RESOURCE_TP_BACKUP[1]:
+                        try:
+                            for hook_results_field in BACKUP_HOOK_RESULTS_FIELDS:
+                                self.check_for_hook_results_failures_in_backup(obj, hook_results_field)
+                        except Exception as e:
+                            errors[(ns, name)] = f"hook results: {e}"
+                    if state != states.get((ns, name)) and state in TRIDENT_PROTECT_TERMINAL_STATES:
+                        finished.add(name)
+                    self._report_state_change(kind, ns, name, states.get((ns, name)), state)
+                    states[(ns, name)] = state
+                for (state_ns, name), state in states.items():
+                    if state_ns != ns or name in listed or state == STATUS_NOT_FOUND:
+                        continue
+                    # a named CR that was never seen may not have been created yet
+                    if (ns, name) in seen or not wait or settle_policy.expired():
+                        self._report_state_change(kind, ns, name, state, STATUS_NOT_FOUND)
+                        states[(ns, name)] = STATUS_NOT_FOUND
+                # release the Lease of a terminal Backup, also one first seen terminal (e.g. `backup create` exited early)
+                if finished and kind == RESOURCE_TP_BACKUP[1]:
+                    BackupLease(ns).release_any(finished)
+
+            if not states:
+                raise Exception(f"no {kind} CR found in namespace(s) {', '.join(targets)} (label selector: {label_selector})")
+            done = sum(1 for state in states.values() if state in TRIDENT_PROTECT_TERMINAL_STATES + (STATUS_NOT_FOUND,))
+            if not wait or done == len(states):
+                break
+            policy.observe(tuple(sorted(states.items())))
+            interval = policy.next_interval()
+            if any(state is None and key not in seen for key, state in states.items()):
+                interval = min(interval, settle_policy.remaining())
+            print(TextColor.blue(f"{done}/{len(states)} {kind} CR(s) finished, checking again in {interval:.1f} seconds"))
+            time.sleep(interval)
+
+        print()
+        rows = [[ns, name, state, errors.get((ns, name))] for (ns, name), state in sorted(states.items())]
+        self.print_table(["NAMESPACE", "NAME", "STATE", "ERROR"], rows, ", ".join(targets))
+        print()
+
+        failed = [f"{ns}/{name} ({state or 'Pending'})" for (ns, name), state in sorted(states.items()) if state != TRIDENT_PROTECT_STATUS_COMPLETED or errors.get((ns, name))]
+        if failed:
+            raise Exception(f'{len(failed)} of {len(states)} {kind} CR(s) not "{TRIDENT_PROTECT_STATUS_COMPLETED}" without errors: {", ".join(failed)}')
+        print(TextColor.green(f"Successfully completed {len(states)} {kind} CR(s)"))
+        return states
+
+    @staticmethod
+    def _report_state_change(kind: str, cr_namespace: str, name: str, previous: str, state: str):
+        if previous == state:
+            return
+        color = TextColor.blue
+        if state == TRIDENT_PROTECT_STATUS_COMPLETED:
+            color = TextColor.green
+        elif state in TRIDENT_PROTECT_TERMINAL_STATES + (STATUS_NOT_FOUND,):
+            color = TextColor.red
+        print(color(f"{kind} {cr_namespace}/{name}: {previous or '-'} -> {state or 'Pending'}"))
+
+    def iter_backups(self, cr_namespace: str, label_selector: str = None, fields: list[str] = None):
+        """Iterates over the Backups of a namespace page by page, optionally projected to the given fields (see list_in_pages)"""
+        return list_in_pages(self.kube.resource(RESOURCE_TP_BACKUP), namespace=cr_namespace, label_selector=label_selector, fields=fields)
+
+    def iter_resource_backups(self, cr_namespace: str, label_selector: str = None, fields: list[str] = None):
+        """Iterates over the ResourceBackups of a namespace page by page, optionally projected to the given fields (see list_in_pages)"""
+        return list_in_pages(self.kube.resource(RESOURCE_TP_RESOURCEBACKUP), namespace=cr_namespace, label_selector=label_selector, fields=fields)
+
+    def iter_exechooks(self, cr_namespace: str, label_selector: str = None, fields: list[str] = None):
+        """Iterates over the ExecHooks of a namespace page by page, optionally projected to the given fields (see list_in_pages)"""
+        return list_in_pages(self.kube.resource(RESOURCE_TP_EXECHOOK), namespace=cr_namespace, label_selector=label_selector, fields=fields)
+
+    def iter_exechooksruns(self, cr_namespace: str, label_selector: str = None, fields: list[str] = None):
+        """Iterates over the ExecHooksRuns of a namespace page by page, optionally projected to the given fields (see list_in_pages)"""
+        return list_in_pages(self.kube.resource(RESOURCE_TP_EXECHOOKSRUN), namespace=cr_namespace, label_selector=label_selector, fields=fields)
+
+    def iter_backuprestores(self, cr_namespace: str, label_selector: str = None, fields: list[str] = None):
+        """Iterates over the BackupRestores of a namespace page by page, optionally projected to the given fields (see list_in_pages)"""
+        return list_in_pages(self.kube.resource(RESOURCE_TP_BACKUPRESTORE), namespace=cr_namespace, label_selector=label_selector, fields=fields)
+
+    def _get_cached(self, api_resource: tuple, name: str, cr_namespace: str, must_exist: bool):
+        """Gets a CR from the informer store of its kind and namespace (see InformerStore for the consistency guarantees)
+
+        Args:
+            api_resource: (api_version, kind) of the CR, e.g. RESOURCE_TP_BACKUP
+            name: name of the CR
+            cr_namespace: namespace of the CR
+            must_exist: Set to True to confirm a miss with a GET and raise if the CR does not exist
+
+        Raises:
+            ApiException: If the CR does not exist and must_exist (404), or on any other API error
+
+        Returns:
+            The CR, or None if it does not exist and not must_exist
+        """
         if not name:
             raise ValueError("name cannot be empty")
 
         try:
-            backups_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="Backup")
-
-            # label_selector = "app=my-app"
-            res = backups_api.get(name=name, namespace=cr_namespace)
-            return res
+            res = self.kube.store(api_resource, cr_namespace).get(name, confirm_missing=must_exist)
         except ResourceNotFoundError as ex:
             raise ex
         except ApiException as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                log.error("resource %s not found in namespace %s: %s" % (name, cr_namespace, ex))
-            else:
-                log.error("Exception when calling ResourceApi->get: %s" % ex)
+            log.error("Exception when calling ResourceApi->get: %s" % ex)
             raise ex
+        if res is None and must_exist:
+            log.error("resource %s not found in namespace %s" % (name, cr_namespace))
+            raise ApiException(status=HTTP_NOT_FOUND, reason=f"{api_resource[1]} {name} not found in namespace {cr_namespace}")
+        return res
 
-    def get_backup_by_name_or_none(self, name: str, cr_namespace: str):
-        if not name:
-            raise ValueError("name cannot be empty")
-
+    def get_backups(self, cr_namespace: str, label_selector: str):
         try:
-            backups_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="Backup")
-            res = backups_api.get(name=name, namespace=cr_namespace)
+            backups_api = self.kube.resource(RESOURCE_TP_BACKUP)
+
+            res = backups_api.get(namespace=cr_namespace, label_selector=label_selector)
             return res
         except ResourceNotFoundError as ex:
             raise ex
         except ApiException as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                return None
-            else:
-                log.error("Exception when calling ResourceApi->get: %s" % ex)
+            log.error("Exception when calling ResourceApi->get: %s" % ex)
             raise ex
 
+    def get_backup_by_name(self, name: str, cr_namespace: str):
+        return self._get_cached(RESOURCE_TP_BACKUP, name, cr_namespace, must_exist=True)
+
+    def get_backup_by_name_or_none(self, name: str, cr_namespace: str):
+        return self._get_cached(RESOURCE_TP_BACKUP, name, cr_namespace, must_exist=False)
+
+    def get_backup_app_archive_path(self, backup_name: str, cr_namespace: str, app_vault: str) -> str:
+        """Returns the AppVault path of a Completed Backup, to restore it by name
+
+        The Backup is always read from the API server rather than the local backup catalog: a catalogued Backup may
+        have been deleted (e.g. by `backup prune`) since the last sync, and its AppVault path must not be restored.
+
+        Raises:
+            Exception: If the Backup does not exist, is not Completed or was not stored in app_vault
+        """
+        backup = self.get_backup_by_name_or_none(backup_name, cr_namespace)
+        backup = backup.to_dict() if backup is not None else None
+        if backup is None:
+            raise Exception(f'Backup "{backup_name}" does not exist in namespace "{cr_namespace}"')
+        status = backup.get("status") or {}
+        if status.get("state") != TRIDENT_PROTECT_STATUS_COMPLETED or not status.get("appArchivePath"):
+            raise Exception(f'Backup "{backup_name}" is in state "{status.get("state")}", only {TRIDENT_PROTECT_STATUS_COMPLETED} backups can be restored')
+        backup_app_vault = (backup.get("spec") or {}).get("appVaultRef")
+        if backup_app_vault != app_vault:
+            raise Exception(f'Backup "{backup_name}" is stored in AppVault "{backup_app_vault}", not "{app_vault}"')
+        return status["appArchivePath"]
+
     def get_resource_backups(self, cr_namespace: str):
         try:
-            resource_backups_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ResourceBackup")
+            resource_backups_api = self.kube.resource(RESOURCE_TP_RESOURCEBACKUP)
 
             res = resource_backups_api.get(namespace=cr_namespace)
             return res
@@ -1566,7 +4026,7 @@ class TridentProtectManager:
             raise ValueError("name cannot be empty")
 
         try:
-            resource_backups_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ResourceBackup")
+            resource_backups_api = self.kube.resource(RESOURCE_TP_RESOURCEBACKUP)
 
             # label_selector = "app=my-app"
             res = resource_backups_api.get(name=name, namespace=cr_namespace)
@@ -1583,7 +4043,7 @@ class TridentProtectManager:
     def get_exechooks(self, cr_namespace: str):
 
         try:
-            exechooks_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHook")
+            exechooks_api = self.kube.resource(RESOURCE_TP_EXECHOOK)
 
             res = exechooks_api.get(namespace=cr_namespace)
             return res
@@ -1594,27 +4054,12 @@ class TridentProtectManager:
             raise ex
 
     def get_exechook_by_name(self, name: str, cr_namespace: str):
-        if not name:
-            raise ValueError("name cannot be empty")
-
-        try:
-            exechooks_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHook")
-
-            res = exechooks_api.get(name=name, namespace=cr_namespace)
-            return res
-        except ResourceNotFoundError as ex:
-            raise ex
-        except ApiException as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                log.error("resource %s not found in namespace %s: %s" % (name, cr_namespace, ex))
-            else:
-                log.error("Exception when calling ResourceApi->get: %s" % ex)
-            raise ex
+        return self._get_cached(RESOURCE_TP_EXECHOOK, name, cr_namespace, must_exist=True)
 
     def get_exechooksruns(self, cr_namespace: str):
 
         try:
-            exechooksrun_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHooksRun")
+            exechooksrun_api = self.kube.resource(RESOURCE_TP_EXECHOOKSRUN)
 
             res = exechooksrun_api.get(namespace=cr_namespace)
             return res
@@ -1629,7 +4074,7 @@ class TridentProtectManager:
             raise ValueError("name cannot be empty")
 
         try:
-            exechooksrun_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHooksRun")
+            exechooksrun_api = self.kube.resource(RESOURCE_TP_EXECHOOKSRUN)
 
             res = exechooksrun_api.get(name=name, namespace=cr_namespace)
             return res
@@ -1644,128 +4089,26 @@ class TridentProtectManager:
 
     def get_backuprestores(self, cr_namespace: str):
         try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
-
-            res = br_api.get(namespace=cr_namespace)
-            return res
-        except ResourceNotFoundError as ex:
-            raise ex
-        except ApiException as ex:
-            log.error("Exception when calling ResourceApi->get: %s" % ex)
-            raise ex
-
-    def get_backuprestore_uid(self, name: str, cr_namespace: str):
-        if not name:
-            raise ValueError("name cannot be empty")
-
-        try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
-
-            # label_selector = "app=my-app"
-            res = br_api.get(name=name, namespace=cr_namespace)
-            return res.metadata.uid
-        except ResourceNotFoundError as ex:
-            raise ex
-        except ApiException as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                log.error("resource %s not found in namespace %s: %s" % (name, cr_namespace, ex))
-            else:
-                log.error("Exception when calling ResourceApi->get: %s" % ex)
-            raise ex
-
-    def get_backuprestores(self, cr_namespace: str):
-        try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
+            br_api = self.kube.resource(RESOURCE_TP_BACKUPRESTORE)
 
             res = br_api.get(namespace=cr_namespace)
             return res
         except ResourceNotFoundError as ex:
             raise ex
         except ApiException as ex:
-            log.error("Exception when calling ResourceApi->get: %s" % ex)
-            raise ex
-
-    def get_backuprestore_uid(self, name: str, cr_namespace: str):
-        if not name:
-            raise ValueError("name cannot be empty")
-
-        try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
-
-            # label_selector = "app=my-app"
-            res = br_api.get(name=name, namespace=cr_namespace)
-            return res.metadata.uid
-        except ResourceNotFoundError as ex:
-            raise ex
-        except ApiException as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                log.error("resource %s not found in namespace %s: %s" % (name, cr_namespace, ex))
-            else:
-                log.error("Exception when calling ResourceApi->get: %s" % ex)
-            raise ex
-
-    def get_exechooksruns_owned_by_uid(self, uid: str, cr_namespace: str):
-        ehr_list = self.get_exechooksruns(cr_namespace)
-        owned_ehrs = []
-
-        if ehr_list is None:
-            return owned_ehrs
-
-        for ehr in ehr_list.items:
-            if ehr.metadata.ownerReferences:
-                for ref in ehr.metadata.ownerReferences:
-                    if ref.uid == uid:
-                        owned_ehrs.append(ehr)
-                        break
-
-        return owned_ehrs
-
-    def get_backuprestore_by_name(self, name: str, cr_namespace: str):
-        if not name:
-            raise ValueError("name cannot be empty")
-
-        try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
-
-            # label_selector = "app=my-app"
-            res = br_api.get(name=name, namespace=cr_namespace)
-            return res
-        except ResourceNotFoundError as ex:
-            raise ex
-        except ApiException as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                log.error("resource %s not found in namespace %s: %s" % (name, cr_namespace, ex))
-            else:
-                log.error("Exception when calling ResourceApi->get: %s" % ex)
-            raise ex
-
-    def get_backuprestore_by_name_or_none(self, name: str, cr_namespace: str):
-        if not name:
-            raise ValueError("name cannot be empty")
-
-        try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
-            res = br_api.get(name=name, namespace=cr_namespace)
-            return res
-        except ResourceNotFoundError as ex:
-            raise ex
-        except ApiException as ex:
-            if ex.status == HTTP_NOT_FOUND:
-                return None
-            else:
-                log.error("Exception when calling ResourceApi->get: %s" % ex)
+            log.error("Exception when calling ResourceApi->get: %s" % ex)
             raise ex
 
-    def get_backuprestore_by_name(self, name: str, cr_namespace: str):
+    def get_backuprestore_uid(self, name: str, cr_namespace: str):
         if not name:
             raise ValueError("name cannot be empty")
 
         try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
+            br_api = self.kube.resource(RESOURCE_TP_BACKUPRESTORE)
 
             # label_selector = "app=my-app"
             res = br_api.get(name=name, namespace=cr_namespace)
-            return res
+            return res.metadata.uid
         except ResourceNotFoundError as ex:
             raise ex
         except ApiException as ex:
@@ -1775,112 +4118,122 @@ class TridentProtectManager:
                 log.error("Exception when calling ResourceApi->get: %s" % ex)
             raise ex
 
-    def get_backuprestore_by_name_or_none(self, name: str, cr_namespace: str):
+    def get_backuprestores(self, cr_namespace: str):
+        try:
+            br_api = self.kube.resource(RESOURCE_TP_BACKUPRESTORE)
+
+            res = br_api.get(namespace=cr_namespace)
+            return res
+        except ResourceNotFoundError as ex:
+            raise ex
+        except ApiException as ex:
+            log.error("Exception when calling ResourceApi->get: %s" % ex)
+            raise ex
+
+    def get_backuprestore_uid(self, name: str, cr_namespace: str):
         if not name:
             raise ValueError("name cannot be empty")
 
         try:
-            br_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
+            br_api = self.kube.resource(RESOURCE_TP_BACKUPRESTORE)
+
+            # label_selector = "app=my-app"
             res = br_api.get(name=name, namespace=cr_namespace)
-            return res
+            return res.metadata.uid
         except ResourceNotFoundError as ex:
             raise ex
         except ApiException as ex:
             if ex.status == HTTP_NOT_FOUND:
-                return None
+                log.error("resource %s not found in namespace %s: %s" % (name, cr_namespace, ex))
             else:
                 log.error("Exception when calling ResourceApi->get: %s" % ex)
             raise ex
 
-    def wait_for_backup(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+    def _index_exechooksruns_by_owner_uid(self, cr_namespace: str) -> dict:
+        """Scans the ExecHooksRuns of a namespace page by page (metadata only) and indexes their names by owner uid"""
+        exechooksrun_api = self.kube.resource(RESOURCE_TP_EXECHOOKSRUN)
+        index = {}
+        for ehr in list_in_pages(exechooksrun_api, namespace=cr_namespace, metadata_only=True):
+            for ref in ehr.metadata.ownerReferences or []:
+                index.setdefault(ref.uid, []).append(ehr.metadata.name)
+        log.info(f"indexed ExecHooksRuns of {len(index)} owners in namespace {cr_namespace}")
+        return index
+
+    def get_exechooksruns_owned_by_uid(self, uid: str, cr_namespace: str):
+        """Returns the ExecHooksRuns owned by the resource with the given uid
+
+        They are served from the owner index of the ExecHooksRun informer store when it is synced. Otherwise the owners
+        of all ExecHooksRuns of the namespace are indexed by a paginated, metadata-only scan, and only the matching
+        ExecHooksRuns are fetched in full. Nothing is written to the cluster.
+        """
+        owned_ehrs = self.kube.store(RESOURCE_TP_EXECHOOKSRUN, cr_namespace).owned_by(uid)
+        if owned_ehrs is not None:
+            return owned_ehrs
 
-        def check_backup_state(bk_name, cr_ns):
-            log.info(f"checking backup {bk_name} state ...")
+        index = self._index_exechooksruns_by_owner_uid(cr_namespace)
+        owned_ehrs = []
+        for name in index.get(uid, []):
             try:
-                obj = self.get_backup_by_name(bk_name, cr_ns)
-                log.info(f"backup status: {obj.status}")
-                if obj.status is None or obj.status.state == "":
-                    return False
-                elif obj.status.state == TRIDENT_PROTECT_STATUS_COMPLETED or obj.status.state == TRIDENT_PROTECT_STATUS_FAILED or obj.status.state == TRIDENT_PROTECT_STATUS_REMOVED or obj.status.state == TRIDENT_PROTECT_STATUS_ERROR:
-                    # terminate state, e.g.: Completed
-                    # possible final state values: Ready, Completed, Available, Failed, Removed, Error
-                    return True
-                else:
-                    # Running state
-                    return False
-            except Exception as ex:
-                log.error("Exception occurred: %s" % ex)
-                return False
+                owned_ehrs.append(self.get_exechooksrun_by_name(name, cr_namespace))
+            except ApiException as ex:
+                if ex.status != HTTP_NOT_FOUND:
+                    raise ex
 
-        wait_cond = Condition("check-backup", check_backup_state, name, cr_namespace)
-        wait_for_condition(wait_cond, timeout, interval, False)
+        return owned_ehrs
 
-    def wait_for_resource_backup(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+    def get_backuprestore_by_name(self, name: str, cr_namespace: str):
+        return self._get_cached(RESOURCE_TP_BACKUPRESTORE, name, cr_namespace, must_exist=True)
 
-        def check_resource_backup_state(bk_name, cr_ns):
-            log.info(f"checking resourcebackup {bk_name} state ...")
-            try:
-                obj = self.get_resource_backup_by_name(bk_name, cr_ns)
-                log.info(f"resourcebackup status: {obj.status}")
-                if obj.status is None or obj.status.state == "":
-                    return False
-                elif obj.status.state == TRIDENT_PROTECT_STATUS_COMPLETED or obj.status.state == TRIDENT_PROTECT_STATUS_FAILED or obj.status.state == TRIDENT_PROTECT_STATUS_REMOVED or obj.status.state == TRIDENT_PROTECT_STATUS_ERROR:
-                    # terminate state, e.g.: Completed
-                    # possible final state values: Ready, Completed, Available, Failed, Removed, Error
-                    return True
-                else:
-                    # Running state
-                    return False
-            except Exception as ex:
-                log.error("Exception occurred: %s" % ex)
-                return False
+    def get_backuprestore_by_name_or_none(self, name: str, cr_namespace: str):
+        return self._get_cached(RESOURCE_TP_BACKUPRESTORE, name, cr_namespace, must_exist=False)
 
-        wait_cond = Condition("check-resource-backup", check_resource_backup_state, name, cr_namespace)
-        wait_for_condition(wait_cond, timeout, interval, False)
+    def get_backuprestore_by_name(self, name: str, cr_namespace: str):
+        return self._get_cached(RESOURCE_TP_BACKUPRESTORE, name, cr_namespace, must_exist=True)
 
-    def wait_for_exechooksrun(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+    def get_backuprestore_by_name_or_none(self, name: str, cr_namespace: str):
+        return self._get_cached(RESOURCE_TP_BACKUPRESTORE, name, cr_namespace, must_exist=False)
 
-        def check_exechooksrun_state(ehr_name, cr_ns):
-            log.info(f"checking exechooksrun {ehr_name} state ...")
-            try:
-                obj = self.get_exechooksrun_by_name(ehr_name, cr_ns)
-                log.info(f"exechooksrun status: {obj.status}")
-                if obj.status is None or obj.status.state == "":
-                    return False
-                elif obj.status.state == TRIDENT_PROTECT_STATUS_COMPLETED or obj.status.state == TRIDENT_PROTECT_STATUS_FAILED or obj.status.state == TRIDENT_PROTECT_STATUS_REMOVED:
-                    return True
-                else:
-                    # Running state
-                    return False
-            except Exception as ex:
-                log.error("Exception occurred: %s" % ex)
-                return False
+    @Profiler.traced(cat="wait")
+    def _wait_for_terminal_state(self, kind: str, name: str, cr_namespace: str, terminal_states: tuple, timeout: int = None, interval: int = 1):
+        """Waits for a Trident Protect CR to reach one of the specified terminal states via a watch stream
 
-        wait_cond = Condition("check-exechooksrun", check_exechooksrun_state, name, cr_namespace)
-        wait_for_condition(wait_cond, timeout, interval, False)
+        Args:
+            kind: Kind of the Trident Protect CR (e.g.: Backup)
+            name: Name of the CR
+            cr_namespace: Namespace of the CR
+            terminal_states: .status.state values that end the wait
+            timeout: Max time in seconds to wait (default: no timeout)
+            interval: Time in seconds to back off before re-listing after an unexpected watch error
 
-    def wait_for_backuprestore(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+        Raises:
+            TimeoutError: If the CR does not reach a terminal state within the timeout
 
-        def check_backuprestore_state(br_name, cr_ns):
-            log.info(f"checking backuprestore {br_name} state ...")
-            try:
-                obj = self.get_backuprestore_by_name(br_name, cr_ns)
-                log.info(f"backuprestore status: {obj.status}")
-                if obj.status is None or obj.status.state == "":
-                    return False
-                elif obj.status.state == TRIDENT_PROTECT_STATUS_COMPLETED or obj.status.state == TRIDENT_PROTECT_STATUS_FAILED or obj.status.state == TRIDENT_PROTECT_STATUS_REMOVED or obj.status.state == TRIDENT_PROTECT_STATUS_ERROR:
-                    # terminate state, e.g.: Completed
-                    # possible final state values: Ready, Completed, Available, Failed, Removed, Error
-                    return True
-                else:
-                    # Running state
-                    return False
-            except Exception as ex:
-                log.error("Exception occurred: %s" % ex)
+        Returns:
+            The CR object in its terminal state
+        """
+
+        def check_state(obj):
+            status = getattr(obj, "status")
+            log.info(f"{kind.lower()} {name} status: {status}")
+            if status is None or not status.state:
                 return False
+            # terminate state, e.g.: Completed
+            return status.state in terminal_states
+
+        api = self.kube.resource((TRIDENT_PROTECT_API_VERSION, kind))
+        return watch_for_condition(api, name, cr_namespace, check_state, timeout, interval)
+
+    def wait_for_backup(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+        return self._wait_for_terminal_state("Backup", name, cr_namespace, TRIDENT_PROTECT_TERMINAL_STATES, timeout, interval)
+
+    def wait_for_resource_backup(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+        return self._wait_for_terminal_state("ResourceBackup", name, cr_namespace, TRIDENT_PROTECT_TERMINAL_STATES, timeout, interval)
+
+    def wait_for_exechooksrun(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+        return self._wait_for_terminal_state("ExecHooksRun", name, cr_namespace, TRIDENT_PROTECT_EHR_TERMINAL_STATES, timeout, interval)
 
-        wait_cond = Condition("check-backuprestore", check_backuprestore_state, name, cr_namespace)
-        wait_for_condition(wait_cond, timeout, interval, False)
+    def wait_for_backuprestore(self, name: str, cr_namespace: str, timeout: int = None, interval: int = 1):
+        return self._wait_for_terminal_state("BackupRestore", name, cr_namespace, TRIDENT_PROTECT_TERMINAL_STATES, timeout, interval)
 
     def _create_exechooksrun(self, name: str, cr_namespace: str, spec: object, dry_run: bool):
         body = {
@@ -1899,7 +4252,7 @@ class TridentProtectManager:
             return
 
         try:
-            exechooksrun_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHooksRun")
+            exechooksrun_api = self.kube.resource(RESOURCE_TP_EXECHOOKSRUN)
             return exechooksrun_api.create(body=body, namespace=cr_namespace)
         except ResourceNotFoundError as ex:
             raise ex
@@ -1923,7 +4276,7 @@ class TridentProtectManager:
             return
 
         try:
-            resource_backup_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ResourceBackup")
+            resource_backup_api = self.kube.resource(RESOURCE_TP_RESOURCEBACKUP)
             return resource_backup_api.create(body=body, namespace=cr_namespace)
         except ResourceNotFoundError as ex:
             raise ex
@@ -1956,7 +4309,7 @@ class TridentProtectManager:
             return
 
         try:
-            bir_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="BackupRestore")
+            bir_api = self.kube.resource(RESOURCE_TP_BACKUPRESTORE)
             return bir_api.create(body=body, namespace=cr_namespace)
         except ResourceNotFoundError as ex:
             raise ex
@@ -1979,7 +4332,7 @@ class TridentProtectManager:
     def delete_resource_backup_by_name(self, name: str, cr_namespace: str):
 
         try:
-            resource_backup_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ResourceBackup")
+            resource_backup_api = self.kube.resource(RESOURCE_TP_RESOURCEBACKUP)
 
             res = resource_backup_api.delete(name=name, namespace=cr_namespace)
             return res
@@ -1992,7 +4345,7 @@ class TridentProtectManager:
     def delete_exechooksrun_by_name(self, name: str, cr_namespace: str):
 
         try:
-            exechooksrun_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHooksRun")
+            exechooksrun_api = self.kube.resource(RESOURCE_TP_EXECHOOKSRUN)
 
             res = exechooksrun_api.delete(name=name, namespace=cr_namespace)
             return res
@@ -2006,10 +4359,9 @@ class TridentProtectManager:
         if not application_name:
             raise ValueError("application name cannot be empty")
 
-        exechooks_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="ExecHook")
-        res = exechooks_api.get(namespace=cr_namespace)
+        exechooks_api = self.kube.resource(RESOURCE_TP_EXECHOOK)
         to_delete: list[str] = []
-        for hook in res.items:
+        for hook in self.iter_exechooks(cr_namespace, fields=["metadata.name", "spec.applicationRef"]):
             if getattr(hook, "spec") is None:
                 continue
             if getattr(hook.spec, "applicationRef") is None:
@@ -2052,7 +4404,7 @@ class TridentProtectManager:
         if not application_name:
             raise ValueError("application name cannot be empty")
 
-        applications_api = self.k8s_dyn_client.resources.get(api_version="protect.trident.netapp.io/v1", kind="Application")
+        applications_api = self.kube.resource(RESOURCE_TP_APPLICATION)
 
         res = None
         try:
@@ -2087,44 +4439,1150 @@ class TridentProtectManager:
             AttributeError: If the backup does not contain the hook_results_field
             Exception: If there are any failures in the backup's hook results
 
-        Returns:
-            None
-        """
+        Returns:
+            None
+        """
+
+        if getattr(backup, "status") is None:
+            raise AttributeError(f'".status" field not found in Trident Protect backup CR')
+        if getattr(backup.status, hook_results_field) is None:
+            raise AttributeError(f'".status.{hook_results_field}" not found in Trident Protect backup CR')
+        for result in backup.status[hook_results_field]:
+            if getattr(result, "failures") is not None:
+                raise Exception(f"detected {len(result.failures)} failures in {hook_results_field}: {str(result.failures)}")
+
+    def check_for_hook_results_failures_in_exechooksrun(self, ehr: object):
+        """Checks for failures in a Trident Protect ExecHooksRun CR
+        Args:
+            ehr (object): Trident Protect ExecHooksRun CR Object to search against for hook results.
+            hook_results_field: Name of the hook results field to check.
+
+        Raises:
+            AttributeError: If the ehr does not contain the expected results field
+            Exception: If there are any failures in the hook results
+
+        Returns:
+            None
+        """
+
+        if getattr(ehr, "status") is None:
+            raise AttributeError(f'".status" field not found in Trident Protect ExecHooksRun CR')
+        if getattr(ehr.status, "matchingContainers") is None:
+            raise AttributeError(f'".status.matchingContainers" field not found in Trident Protect ExecHooksRun CR')
+
+        matchingContainersLen = len(ehr.status.matchingContainers)
+        if matchingContainersLen != 1:
+            raise AttributeError(f'expected ".status.matchingContainers" field of Trident Protect ExecHooksRun CR to be 1, received {matchingContainersLen}: {str(ehr.status.matchingContainers)}')
+        result = ehr.status.matchingContainers[0]
+
+        if getattr(result, "failures") is not None:
+            raise Exception(f"detected {len(result.failures)} failures in ExecHooksRun result: {str(result.failures)}")
+
+class BackupOrchestrator:
+    """Runs preflight, creation and wait of the Backups of many CPD tenants in parallel
+
+    Tenants are processed on a bounded worker pool. Tenants sharing an operator namespace are serialized so that
+    the single Running Backup per namespace rule of `do_backup` holds, and a global cap bounds the number of
+    Backups in flight (from creation until a terminal state) across all tenants.
+    """
+
+    def __init__(
+        self,
+        tp_namespace: str,
+        max_workers: int = DEFAULT_CREATE_MANY_MAX_WORKERS,
+        max_concurrent_backups: int = DEFAULT_CREATE_MANY_MAX_CONCURRENT_BACKUPS,
+        dry_run: bool = False,
+        cr_backend: str = CR_BACKEND_TRIDENTCTL
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, received {max_workers}")
+        if max_concurrent_backups < 1:
+            raise ValueError(f"max_concurrent_backups must be at least 1, received {max_concurrent_backups}")
+        self.tp_namespace = tp_namespace
+        self.max_workers = max_workers
+        self.dry_run = dry_run
+        self.cr_backend = cr_backend
+        self._backup_slots = threading.BoundedSemaphore(max_concurrent_backups)
+        self._namespace_locks = {}
+        self._namespace_locks_lock = threading.Lock()
+
+    @staticmethod
+    def load_inventory(path: str, defaults: dict) -> list[dict]:
+        """Loads the tenants of a YAML or JSON inventory file
+
+        The file holds either a list of tenants or a mapping with a `tenants` list and optional `defaults` applied to
+        every tenant. Each tenant needs `namespace`, `application_name` and `appvault_name` and may override any other
+        `backup create` argument; `backup_name` defaults to `<application_name>-<timestamp>`.
+
+        Args:
+            path: path of the inventory file
+            defaults: values of the optional keys used when neither the tenant nor the inventory defaults set them
+
+        Raises:
+            Exception: If the file cannot be read or a tenant is invalid
+
+        Returns:
+            List of tenants with all keys of BACKUP_INVENTORY_REQUIRED_KEYS and BACKUP_INVENTORY_OPTIONAL_KEYS set
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                inventory = yaml.safe_load(f)
+        except Exception as e:
+            raise Exception(f'error reading inventory file "{path}": {e}')
+
+        inventory_defaults = {}
+        if isinstance(inventory, dict):
+            inventory_defaults = inventory.get("defaults") or {}
+            inventory = inventory.get("tenants")
+        if not isinstance(inventory, list) or len(inventory) == 0:
+            raise Exception(f'expected inventory file "{path}" to contain a non-empty list of tenants')
+
+        allowed_keys = set(BACKUP_INVENTORY_REQUIRED_KEYS + BACKUP_INVENTORY_OPTIONAL_KEYS)
+        timestamp = time.strftime("%Y%m%d%H%M%S")
+        tenants = []
+        seen = set()
+        for i, entry in enumerate(inventory):
+            if not isinstance(entry, dict):
+                raise Exception(f"inventory tenant #{i + 1}: expected a mapping, received {type(entry).__name__}")
+            unknown = set(entry) - allowed_keys
+            if unknown:
+                raise Exception(f"inventory tenant #{i + 1}: unknown key(s) {sorted(unknown)}, allowed keys are {sorted(allowed_keys)}")
+            tenant = {**defaults, **inventory_defaults, **entry}
+            for key in BACKUP_INVENTORY_REQUIRED_KEYS:
+                if str(tenant.get(key) or "").strip() == "":
+                    raise Exception(f'inventory tenant #{i + 1}: missing required key "{key}"')
+            if not tenant.get("backup_name"):
+                tenant["backup_name"] = f"{tenant['application_name']}-{timestamp}"
+            key = (tenant["namespace"], tenant["backup_name"])
+            if key in seen:
+                raise Exception(f'inventory tenant #{i + 1}: duplicate backup "{key[1]}" in namespace "{key[0]}"')
+            seen.add(key)
+            tenants.append(tenant)
+        return tenants
+
+    def _namespace_lock(self, namespace: str) -> threading.Lock:
+        with self._namespace_locks_lock:
+            return self._namespace_locks.setdefault(namespace, threading.Lock())
+
+    def _backup_tenant(self, tenant: dict):
+        namespace = tenant["namespace"]
+        backup_name = tenant["backup_name"]
+        tpm = TridentProtectManager(tp_namespace=self.tp_namespace)
+        tpm.verify_backup_preflight(cpdbr=CpdbrManager(), cr_namespace=namespace)
+        with self._backup_slots:
+            pvc_bind_timeout_sec = tenant["pvc_bind_timeout_sec"]
+            tpm.do_backup(
+                app_vault=tenant["appvault_name"],
+                cr_namespace=namespace,
+                application=tenant["application_name"],
+                backup_name=backup_name,
+                dry_run=self.dry_run,
+                data_mover=str(tenant["data_mover"]),
+                pvc_bind_timeout_sec=int(pvc_bind_timeout_sec) if str(pvc_bind_timeout_sec) != "" else "",
+                reclaim_policy=str(tenant["reclaim_policy"]),
+                snapshot=str(tenant["snapshot"]),
+                data_mover_timeout_sec=int(tenant["data_mover_timeout_sec"]),
+                full_backup=bool(tenant["full_backup"]),
+                snapshot_completion_timeout=str(tenant["snapshot_completion_timeout"]),
+                volume_snapshots_created_timeout=str(tenant["volume_snapshots_created_timeout"]),
+                volume_snapshots_ready_to_use_timeout=str(tenant["volume_snapshots_ready_to_use_timeout"]),
+                cr_backend=self.cr_backend
+            )
+            if not self.dry_run:
+                tpm.do_backup_status(backup_name=backup_name, cr_namespace=namespace, wait=True)
+
+    def _run_tenant(self, tenant: dict) -> dict:
+        namespace = tenant["namespace"]
+        desc = f'namespace={namespace}, application={tenant["application_name"]}, backup_name={tenant["backup_name"]}'
+        result = {"tenant": tenant, "error": None, "duration": 0.0}
+        output = io.StringIO()
+        start = time.monotonic()
+        with ThreadOutputRouter.capture(output):
+            try:
+                with self._namespace_lock(namespace):
+                    ThreadOutputRouter.emit(TextColor.blue(f"** Started backup ({desc})"))
+                    self._backup_tenant(tenant)
+            except Exception as e:
+                log.info(f"backup failed ({desc}): {e}")
+                result["error"] = str(e)
+        result["duration"] = time.monotonic() - start
+
+        status = TextColor.red(f"Failed: {result['error']}") if result["error"] else TextColor.green("Dry run completed" if self.dry_run else "Completed")
+        duration = f'{result["duration"]:.0f}s'
+        ThreadOutputRouter.emit(f"{TextColor.blue(f'** Finished backup ({desc}) in {duration}')}\n{output.getvalue()}{status}\n")
+        return result
+
+    def run(self, tenants: list[dict]) -> list[dict]:
+        """Backs up all tenants and returns one result per tenant, in inventory order
+
+        Returns:
+            List of {"tenant": dict, "error": str or None, "duration": float}
+        """
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tenants))) as executor:
+            return list(executor.map(self._run_tenant, tenants))
+
+
+class BackupPruner:
+    """Applies a retention policy to the Trident Protect Backups of a CPD tenant and their tenant backups
+
+    The plan is computed from one list of the labeled Backups and one list of the Velero tenant backups, joined on
+    the vendor-backup-name label. keep_last, keep_daily and keep_weekly only count Completed Backups: the newest
+    ones, and the newest one of each of the most recent days / ISO weeks that have one. Backups that are still
+    running and, with older_than, Backups younger than that age are never pruned; everything else is. Pruned Backup
+    CRs are deleted on a bounded worker pool, and the tenant backups of the deleted CRs are then pipelined through a
+    single TenantServiceExecSession (a tenant backup is left alone if its Backup CR could not be deleted).
+    """
+
+    def __init__(
+        self,
+        tp_namespace: str,
+        cr_namespace: str,
+        oadp_namespace: str,
+        keep_last: int = 0,
+        keep_daily: int = 0,
+        keep_weekly: int = 0,
+        older_than: str = None,
+        label_selector: str = LABEL_GENERATED_BY_CPDBR,
+        max_workers: int = DEFAULT_PRUNE_MAX_WORKERS,
+        cr_backend: str = CR_BACKEND_TRIDENTCTL,
+        tenant_backup_delete_timeout: int = DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC
+    ) -> None:
+        if min(keep_last, keep_daily, keep_weekly) < 0:
+            raise ValueError("keep_last, keep_daily and keep_weekly must not be negative")
+        if not (keep_last or keep_daily or keep_weekly or older_than):
+            raise ValueError("at least one of keep_last, keep_daily, keep_weekly or older_than is required")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, received {max_workers}")
+        self.kube = KubeClientContext.get()
+        self.tp_namespace = tp_namespace
+        self.cr_namespace = cr_namespace
+        self.oadp_namespace = oadp_namespace
+        self.keep_last = keep_last
+        self.keep_daily = keep_daily
+        self.keep_weekly = keep_weekly
+        self.older_than = older_than
+        self.older_than_sec = self.parse_age(older_than) if older_than else None
+        self.label_selector = label_selector
+        self.max_workers = max_workers
+        self.cr_backend = cr_backend
+        self.tenant_backup_delete_timeout = tenant_backup_delete_timeout
+
+    @staticmethod
+    def parse_age(value: str) -> int:
+        """Parses an age such as 90m, 12h, 30d or 4w into seconds"""
+        match = re.fullmatch(r"(\d+)([mhdw])", str(value).strip())
+        if not match:
+            raise ValueError(f'invalid age "{value}", expected a number followed by one of: {", ".join(PRUNE_AGE_UNITS)} (e.g. 30d)')
+        return int(match.group(1)) * PRUNE_AGE_UNITS[match.group(2)]
+
+    def list_tenant_backups(self) -> dict[str, list[str]]:
+        """Returns the names of the Velero tenant backups per Trident Protect backup name"""
+        tenant_backups = {}
+        for velero_backup in list_in_pages(
+            self.kube.resource(RESOURCE_VELERO_BACKUP),
+            namespace=self.oadp_namespace,
+            label_selector=f"{LABEL_TENANT_BACKUP_VENDOR}=trident-protect",
+            fields=["metadata.name", "metadata.labels"],
+        ):
+            labels = velero_backup.metadata.labels
+            backup_name = labels[LABEL_TENANT_BACKUP_VENDOR_BACKUP_NAME] if labels else None
+            if backup_name:
+                tenant_backups.setdefault(backup_name, []).append(velero_backup.metadata.name)
+        return tenant_backups
+
+    def plan(self, now: datetime = None) -> list[dict]:
+        """Decides which Backups to keep and which to prune
+
+        Returns:
+            List of {"name", "state", "created", "tenant_backups", "prune", "reasons"}, newest Backup first
+        """
+        now = now or datetime.now(timezone.utc)
+        tenant_backups = self.list_tenant_backups()
+        entries = []
+        for backup in list_in_pages(
+            self.kube.resource(RESOURCE_TP_BACKUP),
+            namespace=self.cr_namespace,
+            label_selector=self.label_selector or None,
+            fields=["metadata.name", "metadata.creationTimestamp", "status.state"],
+        ):
+            entries.append({
+                "name": backup.metadata.name,
+                "state": (backup.status.state if backup.status else None) or "",
+                "created": parse_k8s_timestamp(backup.metadata.creationTimestamp),
+                "tenant_backups": tenant_backups.get(backup.metadata.name, []),
+                "prune": False,
+                "reasons": [],
+            })
+        entries.sort(key=lambda e: e["created"] or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+
+        completed = [e for e in entries if e["state"] == TRIDENT_PROTECT_STATUS_COMPLETED and e["created"]]
+        for entry in completed[:self.keep_last]:
+            entry["reasons"].append("last")
+        for count, label, period in (
+            (self.keep_daily, "daily", lambda t: t.strftime("%Y-%m-%d")),
+            (self.keep_weekly, "weekly", lambda t: "%d-W%02d" % t.isocalendar()[:2]),
+        ):
+            periods = set()
+            for entry in completed:
+                key = period(entry["created"])
+                if key in periods:
+                    continue
+                if len(periods) == count:
+                    break
+                periods.add(key)
+                entry["reasons"].append(f"{label} {key}")
+
+        for entry in entries:
+            if entry["state"] not in TRIDENT_PROTECT_TERMINAL_STATES:
+                entry["reasons"].append("in progress")
+            elif self.older_than_sec and (entry["created"] is None or (now - entry["created"]).total_seconds() < self.older_than_sec):
+                entry["reasons"].append(f"newer than {self.older_than}")
+            entry["prune"] = not entry["reasons"]
+        return entries
+
+    def print_plan(self, entries: list[dict]):
+        rows = [
+            [e["name"], e["state"], e["created"].strftime("%Y-%m-%dT%H:%M:%SZ") if e["created"] else "", ",".join(e["tenant_backups"]) or "-", "prune" if e["prune"] else "keep", ", ".join(e["reasons"])]
+            for e in entries
+        ]
+        TridentProtectManager.print_table(["NAME", "STATE", "CREATED", "TENANT BACKUP", "ACTION", "REASON"], rows, self.cr_namespace)
+
+    @staticmethod
+    def delete_backup_crs(backups: list[tuple[str, str]], tp_namespace: str, cr_backend: str, max_workers: int = DEFAULT_PRUNE_MAX_WORKERS) -> dict[tuple[str, str], str]:
+        """Deletes Backup CRs on a bounded worker pool through the specified CR backend
+
+        Args:
+            backups: (namespace, name) of the Backup CRs to delete
+            tp_namespace: Trident Protect operator namespace
+            cr_backend: CR_BACKEND_TRIDENTCTL or CR_BACKEND_NATIVE
+            max_workers: number of Backup CRs deleted in parallel
+
+        Returns:
+            Error message per (namespace, name), None for the Backup CRs that were deleted (or already gone)
+        """
+        backend = TridentProtectCrBackend.for_backend(cr_backend)
+
+        def delete(backup: tuple[str, str]) -> str:
+            namespace, name = backup
+            output = io.StringIO()
+            with ThreadOutputRouter.capture(output):
+                try:
+                    backend.backup_delete(backup_name=name, cr_namespace=namespace, tp_namespace=tp_namespace)
+                except ApiException as e:
+                    if e.status != HTTP_NOT_FOUND:
+                        return str(e)
+                except Exception as e:
+                    return str(e)
+            log.info(f"deleted Backup CR {namespace}/{name}: {output.getvalue()}")
+            ThreadOutputRouter.emit(TextColor.green(f"Deleted Trident Protect Backup CR '{name}' (namespace={namespace})"))
+            return None
+
+        if not backups:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(backups))) as executor:
+            return dict(zip(backups, executor.map(delete, backups)))
+
+    def apply(self, entries: list[dict]) -> list[dict]:
+        """Deletes the Backups (and tenant backups) the plan prunes
+
+        Returns:
+            List of {"name", "error"} per pruned Backup, in plan order
+        """
+        pruned = [e for e in entries if e["prune"]]
+        if not pruned:
+            return []
+        print(TextColor.blue(f"** Deleting {len(pruned)} Trident Protect Backup CR(s) (max_workers={self.max_workers})..."))
+        cr_errors = self.delete_backup_crs([(self.cr_namespace, e["name"]) for e in pruned], self.tp_namespace, self.cr_backend, self.max_workers)
+        errors = {name: error for (_, name), error in cr_errors.items()}
+        print()
+
+        tenant_backup_names = [e["name"] for e in pruned if e["tenant_backups"] and errors[e["name"]] is None]
+        if tenant_backup_names:
+            print(TextColor.blue(f"** Deleting {len(tenant_backup_names)} CPD tenant backup(s)..."))
+            tenant_errors = CpdbrManager().delete_tenant_backups(
+                tenant_backup_names,
+                cpd_operator_ns=self.cr_namespace,
+                oadp_ns=self.oadp_namespace,
+                timeout=self.tenant_backup_delete_timeout
+            )
+            for name, error in tenant_errors.items():
+                if error:
+                    errors[name] = f"Backup CR deleted, tenant backup not deleted: {error}"
+            print()
+        return [{"name": e["name"], "error": errors[e["name"]]} for e in pruned]
+
+
+class BackupReconciler:
+    """Finds Trident Protect Backups and Velero tenant backups that are out of sync
+
+    The Backups of every CPD operator namespace and the Velero tenant backups of the OADP namespace are listed once
+    each and hash-joined on the vendor-backup-name label. Reported are finished Backups created by this tool without
+    a tenant backup (tp-only), finished tenant backups without a Backup in any of the namespaces (velero-only, or
+    velero-unknown-tenant when they belong to none of the listed tenants), and pairs where either side did not
+    complete (matched-failed). Orphans can be cleaned up: tp-only Backup CRs are deleted on a bounded worker pool,
+    velero-only tenant backups through one TenantServiceExecSession per tenant. velero-unknown-tenant tenant backups
+    are never deleted, since they may belong to a tenant whose Backups were not listed.
+    """
+
+    def __init__(
+        self,
+        tp_namespace: str,
+        cr_namespaces: list[str],
+        oadp_namespace: str,
+        max_workers: int = DEFAULT_PRUNE_MAX_WORKERS,
+        cr_backend: str = CR_BACKEND_TRIDENTCTL,
+        tenant_backup_delete_timeout: int = DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, received {max_workers}")
+        self.kube = KubeClientContext.get()
+        self.tp_namespace = tp_namespace
+        self.cr_namespaces = list(cr_namespaces)
+        self.oadp_namespace = oadp_namespace
+        self.max_workers = max_workers
+        self.cr_backend = cr_backend
+        self.tenant_backup_delete_timeout = tenant_backup_delete_timeout
+        self.matched = 0
+        self.tenant_backup_count = 0
+
+    def tenant_namespace(self, velero_backup: object) -> str:
+        """Returns the listed CPD operator namespace a tenant backup belongs to, None if it includes none of them"""
+        included = list(velero_backup.spec.includedNamespaces or []) if velero_backup.spec else []
+        return next((ns for ns in self.cr_namespaces if ns in included), None)
+
+    def join(self) -> list[dict]:
+        """Joins the Backups and the tenant backups and returns the out-of-sync entries
+
+        Returns:
+            List of {"category", "namespace", "backup", "state", "tenant_backup", "phase"}
+        """
+        label_key, _, label_value = LABEL_GENERATED_BY_CPDBR.partition("=")
+        tenant_backups = {}
+        for velero_backup in list_in_pages(
+            self.kube.resource(RESOURCE_VELERO_BACKUP),
+            namespace=self.oadp_namespace,
+            label_selector=f"{LABEL_TENANT_BACKUP_VENDOR}=trident-protect",
+            fields=["metadata.name", "metadata.labels", "spec.includedNamespaces", "status.phase"],
+        ):
+            labels = velero_backup.metadata.labels
+            backup_name = labels[LABEL_TENANT_BACKUP_VENDOR_BACKUP_NAME] if labels else None
+            if backup_name:
+                tenant_backups.setdefault(backup_name, []).append(velero_backup)
+        self.tenant_backup_count = sum(len(v) for v in tenant_backups.values())
+
+        entries = []
+        self.matched = 0
+        joined = set()
+        backups_api = self.kube.resource(RESOURCE_TP_BACKUP)
+        for ns in self.cr_namespaces:
+            # every Backup takes part in the join, but only the ones created by this tool can be tp-only
+            for backup in list_in_pages(backups_api, namespace=ns, fields=["metadata.name", "metadata.labels", "status.state"]):
+                name = backup.metadata.name
+                state = (backup.status.state if backup.status else None) or ""
+                matches = tenant_backups.get(name)
+                if not matches:
+                    labels = backup.metadata.labels
+                    if state in TRIDENT_PROTECT_TERMINAL_STATES and labels and labels[label_key] == label_value:
+                        entries.append({"category": RECONCILE_TP_ONLY, "namespace": ns, "backup": name, "state": state, "tenant_backup": None, "phase": None})
+                    continue
+                joined.add(name)
+                self.matched += 1
+                phases = [(v.status.phase if v.status else None) or "" for v in matches]
+                finished = state in TRIDENT_PROTECT_TERMINAL_STATES and all(phase in VELERO_BACKUP_TERMINAL_PHASES for phase in phases)
+                if finished and (state != TRIDENT_PROTECT_STATUS_COMPLETED or any(phase != VELERO_BACKUP_PHASE_COMPLETED for phase in phases)):
+                    entries.append({"category": RECONCILE_MATCHED_FAILED, "namespace": ns, "backup": name, "state": state, "tenant_backup": ",".join(v.metadata.name for v in matches), "phase": ",".join(phases)})
+
+        for name, matches in sorted(tenant_backups.items()):
+            if name in joined:
+                continue
+            for velero_backup in matches:
+                phase = (velero_backup.status.phase if velero_backup.status else None) or ""
+                if phase in VELERO_BACKUP_TERMINAL_PHASES:
+                    ns = self.tenant_namespace(velero_backup)
+                    category = RECONCILE_VELERO_ONLY if ns else RECONCILE_VELERO_UNKNOWN_TENANT
+                    entries.append({"category": category, "namespace": ns, "backup": name, "state": None, "tenant_backup": velero_backup.metadata.name, "phase": phase})
+        return entries
+
+    def print_report(self, entries: list[dict], output: str = LIST_OUTPUT_TABLE):
+        if output == LIST_OUTPUT_JSON:
+            print(json.dumps({"matched": self.matched, "tenant_backups": self.tenant_backup_count, "out_of_sync": entries}, indent=2))
+            return
+        rows = [[e["category"], e["namespace"] or "-", e["backup"], e["state"] or "-", e["tenant_backup"] or "-", e["phase"] or "-"] for e in entries]
+        if rows:
+            TridentProtectManager.print_table(["CATEGORY", "NAMESPACE", "BACKUP", "STATE", "TENANT BACKUP", "PHASE"], rows, "")
+            print()
+        counts = {category: sum(1 for e in entries if e["category"] == category) for category in (RECONCILE_TP_ONLY, RECONCILE_VELERO_ONLY, RECONCILE_VELERO_UNKNOWN_TENANT, RECONCILE_MATCHED_FAILED)}
+        print(f"{self.matched} matched, " + ", ".join(f"{count} {category}" for category, count in counts.items()))
+
+    def cleanup(self, entries: list[dict]) -> list[dict]:
+        """Deletes the tp-only Backup CRs and the velero-only tenant backups of the entries
+
+        Raises:
+            Exception: If tp-only Backups would be deleted although no tenant backup was found at all (most likely
+                the wrong OADP namespace)
+
+        Returns:
+            List of {"category", "namespace", "backup", "error"} per orphan
+        """
+        tp_only = [e for e in entries if e["category"] == RECONCILE_TP_ONLY]
+        velero_only = [e for e in entries if e["category"] == RECONCILE_VELERO_ONLY]
+        if tp_only and self.tenant_backup_count == 0:
+            raise Exception(f"no Velero tenant backups were found in namespace {self.oadp_namespace}, refusing to delete {len(tp_only)} Backup CR(s) as orphans (check --oadp_namespace)")
+
+        errors = {}
+        if tp_only:
+            print(TextColor.blue(f"** Deleting {len(tp_only)} Trident Protect Backup CR(s) without tenant backup (max_workers={self.max_workers})..."))
+            errors.update(BackupPruner.delete_backup_crs([(e["namespace"], e["backup"]) for e in tp_only], self.tp_namespace, self.cr_backend, self.max_workers))
+            print()
+        by_namespace = {}
+        for e in velero_only:
+            names = by_namespace.setdefault(e["namespace"], [])
+            if e["backup"] not in names:
+                names.append(e["backup"])
+        for ns, names in by_namespace.items():
+            print(TextColor.blue(f"** Deleting {len(names)} CPD tenant backup(s) without Backup CR through the cpdbr-tenant-service of namespace {ns}..."))
+            tenant_errors = CpdbrManager().delete_tenant_backups(names, cpd_operator_ns=ns, oadp_ns=self.oadp_namespace, timeout=self.tenant_backup_delete_timeout)
+            errors.update({(ns, name): error for name, error in tenant_errors.items()})
+            print()
+        return [{"category": e["category"], "namespace": e["namespace"], "backup": e["backup"], "error": errors.get((e["namespace"], e["backup"]))} for e in tp_only + velero_only]
+
+
+class MetricsExporter:
+    """Exposes the backup and restore state of CPD tenants as OpenMetrics gauges
+
+    Every tenant (CPD operator namespace) gets a WatchedCollection of its Backups and BackupRestores created by this
+    tool, and the OADP namespace a WatchedCollection of the Velero tenant backups, so a scrape only renders the local
+    views and costs no API call regardless of the number of tenants or the scrape interval.
+    """
+
+    def __init__(self, cpd_operator_namespaces: list[str], oadp_namespace: str = None, label_selector: str = LABEL_GENERATED_BY_CPDBR) -> None:
+        self.kube = KubeClientContext.get()
+        self.cpd_operator_namespaces = list(cpd_operator_namespaces)
+        self.oadp_namespace = oadp_namespace or None
+        backup_fields = ["metadata.name", "metadata.creationTimestamp", "status.state", "status.completionTimestamp", "status.conditions"]
+        backup_fields += [f"status.{field}" for field in BACKUP_HOOK_RESULTS_FIELDS]
+        restore_fields = ["metadata.name", "metadata.creationTimestamp", "status.state", "status.completionTimestamp"]
+        backups_api = self.kube.resource(RESOURCE_TP_BACKUP)
+        restores_api = self.kube.resource(RESOURCE_TP_BACKUPRESTORE)
+        self.backups = {ns: WatchedCollection(backups_api, ns, label_selector, backup_fields) for ns in self.cpd_operator_namespaces}
+        self.restores = {ns: WatchedCollection(restores_api, ns, label_selector, restore_fields) for ns in self.cpd_operator_namespaces}
+        self.tenant_backups = None
+        if self.oadp_namespace:
+            self.tenant_backups = WatchedCollection(
+                self.kube.resource(RESOURCE_VELERO_BACKUP),
+                self.oadp_namespace,
+                f"{LABEL_TENANT_BACKUP_VENDOR}=trident-protect",
+                ["metadata.name", "metadata.labels", "status.phase"],
+            )
+
+    def collections(self) -> list[tuple]:
+        """Returns (namespace, kind, WatchedCollection) of every watched collection"""
+        collections = [(ns, RESOURCE_TP_BACKUP[1], c) for ns, c in self.backups.items()]
+        collections += [(ns, RESOURCE_TP_BACKUPRESTORE[1], c) for ns, c in self.restores.items()]
+        if self.tenant_backups is not None:
+            collections.append((self.oadp_namespace, "VeleroBackup", self.tenant_backups))
+        return collections
+
+    def start(self, sync_timeout: float = DEFAULT_EXPORTER_SYNC_TIMEOUT_SEC):
+        """Starts all watched collections and waits (up to sync_timeout) for their initial list"""
+        for _, _, collection in self.collections():
+            collection.start()
+        deadline = time.monotonic() + sync_timeout
+        for ns, kind, collection in self.collections():
+            if not collection.synced.wait(max(0, deadline - time.monotonic())):
+                log.warning(f"exporter: {kind} collection of namespace {ns} not synced after {sync_timeout}s")
+
+    def stop(self):
+        for _, _, collection in self.collections():
+            collection.stop()
+
+    @staticmethod
+    def _escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    @staticmethod
+    def _is_successful(backup: object) -> bool:
+        """Returns True for a Completed Backup without hook failures"""
+        if backup.status is None or backup.status.state != TRIDENT_PROTECT_STATUS_COMPLETED:
+            return False
+        return not any(result.failures for field in BACKUP_HOOK_RESULTS_FIELDS for result in (backup.status[field] or []))
+
+    def render(self) -> str:
+        """Renders the current view of all collections in the OpenMetrics text format"""
+        start = time.monotonic()
+        now = datetime.now(timezone.utc)
+        metrics = {}
+
+        def sample(name: str, kind: str, help: str, labels: dict, value: float):
+            samples = metrics.setdefault(f"{EXPORTER_METRIC_PREFIX}_{name}", (kind, help, []))[2]
+            samples.append((labels, value))
+
+        tenant_backups = {}
+        if self.tenant_backups is not None:
+            for velero_backup in self.tenant_backups.items():
+                labels = velero_backup.metadata.labels
+                backup_name = labels[LABEL_TENANT_BACKUP_VENDOR_BACKUP_NAME] if labels else None
+                if backup_name:
+                    tenant_backups[backup_name] = velero_backup
+
+        for ns in self.cpd_operator_namespaces:
+            backups = sorted(self.backups[ns].items(), key=lambda b: b.metadata.creationTimestamp or "")
+            states = {}
+            for backup in backups:
+                state = (backup.status.state if backup.status else None) or "Unknown"
+                states[state] = states.get(state, 0) + 1
+            for state, count in sorted(states.items()):
+                sample("backups", "gauge", "Number of Backup CRs by state", {"namespace": ns, "state": state}, count)
+            running = sum(1 for b in backups if not b.status or b.status.state not in TRIDENT_PROTECT_TERMINAL_STATES)
+            sample("operations_running", "gauge", "Number of Backups/BackupRestores not in a terminal state", {"namespace": ns, "kind": RESOURCE_TP_BACKUP[1]}, running)
+
+            finished = [b for b in backups if b.status and b.status.state in TRIDENT_PROTECT_TERMINAL_STATES]
+            if finished:
+                for hook_results_field in BACKUP_HOOK_RESULTS_FIELDS:
+                    failures = sum(len(result.failures or []) for result in (finished[-1].status[hook_results_field] or []))
+                    sample("backup_last_hook_failures", "gauge", "Number of hook failures of the last finished Backup", {"namespace": ns, "hook": hook_results_field}, failures)
+
+            successful = [b for b in backups if self._is_successful(b)]
+            if successful:
+                last = successful[-1]
+                timeline = TridentProtectManager.get_backup_timeline(last)
+                completed = timeline.get("completed") or timeline.get("created")
+                sample("backup_last_success_timestamp_seconds", "gauge", "Completion time of the last successful Backup", {"namespace": ns}, completed.timestamp())
+                sample("backup_last_success_age_seconds", "gauge", "Seconds since the completion of the last successful Backup (RPO)", {"namespace": ns}, (now - completed).total_seconds())
+                for phase, duration in TridentProtectManager.get_backup_phase_durations(timeline).items():
+                    if duration is not None:
+                        sample("backup_last_success_phase_duration_seconds", "gauge", "Phase durations of the last successful Backup", {"namespace": ns, "phase": phase}, duration)
+                if self.tenant_backups is not None:
+                    velero_backup = tenant_backups.get(last.metadata.name)
+                    tenant_backup_completed = velero_backup is not None and velero_backup.status is not None and velero_backup.status.phase == TRIDENT_PROTECT_STATUS_COMPLETED
+                    sample("backup_last_success_tenant_backup_completed", "gauge", "1 if the Velero tenant backup of the last successful Backup is Completed", {"namespace": ns}, int(tenant_backup_completed))
+
+            restores = sorted(self.restores[ns].items(), key=lambda r: r.metadata.creationTimestamp or "")
+            running = sum(1 for r in restores if not r.status or r.status.state not in TRIDENT_PROTECT_TERMINAL_STATES)
+            sample("operations_running", "gauge", "Number of Backups/BackupRestores not in a terminal state", {"namespace": ns, "kind": RESOURCE_TP_BACKUPRESTORE[1]}, running)
+            finished = [r for r in restores if r.status and r.status.state in TRIDENT_PROTECT_TERMINAL_STATES]
+            if finished:
+                last = finished[-1]
+                created = parse_k8s_timestamp(last.metadata.creationTimestamp)
+                completed = parse_k8s_timestamp(last.status.completionTimestamp)
+                if created and completed:
+                    sample("restore_last_duration_seconds", "gauge", "Duration of the last finished BackupRestore", {"namespace": ns, "state": last.status.state}, (completed - created).total_seconds())
+                    sample("restore_last_completion_timestamp_seconds", "gauge", "Completion time of the last finished BackupRestore", {"namespace": ns, "state": last.status.state}, completed.timestamp())
+
+        for ns, kind, collection in self.collections():
+            sample("exporter_collection_synced", "gauge", "1 once the watched collection completed its initial list", {"namespace": ns, "kind": kind}, int(collection.synced.is_set()))
+        counters = self.kube.rate_limiter.snapshot()
+        sample("exporter_api_requests", "counter", "API requests of the exporter process", {}, counters["requests"])
+        sample("exporter_api_rate_limited_seconds", "counter", "Time API requests waited for the client-side rate limiter", {}, counters["rate_limited_sec"])
+        for reason in ("429", "5xx"):
+            sample("exporter_api_retries", "counter", "API requests retried after throttling (429) or a server error (5xx)", {"reason": reason}, counters[f"retries_{reason}"])
+        sample("exporter_render_duration_seconds", "gauge", "Time spent rendering the metrics", {}, time.monotonic() - start)
+
+        lines = []
+        for name, (kind, help, samples) in metrics.items():
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"# HELP {name} {help}")
+            # OpenMetrics counter samples carry the _total suffix, their family name does not
+            sample_name = f"{name}_total" if kind == "counter" else name
+            for labels, value in samples:
+                label_text = ",".join(f'{k}="{self._escape(v)}"' for k, v in labels.items())
+                lines.append(f"{sample_name}{{{label_text}}} {value}" if label_text else f"{sample_name} {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        """Writes the metrics to path atomically, so node-exporter never reads a partial file"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def serve_http(self, address: str, port: int):
+        """Serves the metrics at http://<address>:<port>/metrics until interrupted"""
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(HTTP_NOT_FOUND)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                log.debug(f"exporter: {self.address_string()} {format % args}")
+
+        server = ThreadingHTTPServer((address, port), MetricsHandler)
+        print(TextColor.green(f"Serving metrics at http://{address or '0.0.0.0'}:{server.server_address[1]}/metrics"))
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+
+class BackupCatalog:
+    """Local SQLite catalog of the Backups and Velero tenant backups of CPD tenants
+
+    There is one database per cluster in the user cache directory. `sync` brings every (kind, namespace) collection up
+    to date: the first sync lists it in pages, later syncs only replay the watch events since the resourceVersion
+    stored with the collection (ending once the server has been idle for CATALOG_WATCH_IDLE_SEC), and a collection
+    is only re-listed when that resourceVersion has expired (410 Gone). The stored resourceVersion only advances when
+    the collection changes (bookmarks rarely arrive within the idle window), so a collection left unchanged for longer
+    than the compaction window of the API server (minutes by default) is re-listed by its next sync. Reads never call the API server: they work
+    offline and are answered from the indexes on kind, namespace, creation time, labels and the vendor-backup-name
+    of the tenant backups. Only equality (`key=value`) and existence (`key`) label selectors are evaluated locally.
+    """
+
+    SCHEMA = (
+        """CREATE TABLE objects (
+            kind TEXT NOT NULL, namespace TEXT NOT NULL, name TEXT NOT NULL, created TEXT, vendor_backup_name TEXT,
+            body TEXT NOT NULL, PRIMARY KEY (kind, namespace, name))""",
+        "CREATE INDEX objects_created ON objects (kind, namespace, created)",
+        "CREATE INDEX objects_vendor_backup_name ON objects (vendor_backup_name) WHERE vendor_backup_name IS NOT NULL",
+        """CREATE TABLE labels (
+            kind TEXT NOT NULL, namespace TEXT NOT NULL, name TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,
+            PRIMARY KEY (kind, namespace, name, key))""",
+        "CREATE INDEX labels_key_value ON labels (kind, namespace, key, value)",
+        """CREATE TABLE collections (
+            kind TEXT NOT NULL, namespace TEXT NOT NULL, resource_version TEXT, synced_at REAL, PRIMARY KEY (kind, namespace))""",
+    )
+
+    def __init__(self, path: str) -> None:
+        import sqlite3
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != CATALOG_SCHEMA_VERSION:
+            # the catalog only caches cluster state, so an outdated schema is simply rebuilt by the next sync
+            with self.db:
+                for table in ("objects", "labels", "collections"):
+                    self.db.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in self.SCHEMA:
+                    self.db.execute(statement)
+                self.db.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+
+    @staticmethod
+    def cluster_host() -> str:
+        """Returns the API server URL of the current kubeconfig context without connecting to it"""
+        if KubeClientContext._instance is not None:
+            return KubeClientContext._instance.configuration.host
+        _load_cluster_modules()
+        configuration = client.Configuration()
+        try:
+            k8s_config.load_incluster_config(client_configuration=configuration)
+        except k8s_config.ConfigException:
+            k8s_config.load_kube_config(client_configuration=configuration)
+        return configuration.host
+
+    @staticmethod
+    def open() -> "BackupCatalog":
+        """Opens (creating it if needed) the catalog of the cluster of the current kubeconfig context"""
+        cache_id = hashlib.sha256(BackupCatalog.cluster_host().encode("utf-8")).hexdigest()[:16]
+        return BackupCatalog(os.path.join(get_user_cache_dir(), f"{CATALOG_FILE_PREFIX}-{cache_id}.sqlite"))
+
+    def close(self):
+        self.db.close()
+
+    def _put(self, kind: str, namespace: str, raw: dict):
+        metadata = raw.get("metadata") or {}
+        labels = metadata.get("labels") or {}
+        name = metadata["name"]
+        vendor_backup_name = labels.get(LABEL_TENANT_BACKUP_VENDOR_BACKUP_NAME) if kind == CATALOG_KIND_VELERO_BACKUP else None
+        self.db.execute(
+            "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?)",
+            (kind, namespace, name, metadata.get("creationTimestamp"), vendor_backup_name, json.dumps(raw, separators=(",", ":"))),
+        )
+        self.db.execute("DELETE FROM labels WHERE kind = ? AND namespace = ? AND name = ?", (kind, namespace, name))
+        self.db.executemany("INSERT INTO labels VALUES (?, ?, ?, ?, ?)", [(kind, namespace, name, k, str(v)) for k, v in labels.items()])
+
+    def _delete(self, kind: str, namespace: str, name: str = None):
+        """Deletes one object, or all objects of the collection without a name"""
+        condition, params = "kind = ? AND namespace = ?", (kind, namespace)
+        if name is not None:
+            condition, params = condition + " AND name = ?", params + (name,)
+        self.db.execute(f"DELETE FROM objects WHERE {condition}", params)
+        self.db.execute(f"DELETE FROM labels WHERE {condition}", params)
+
+    @staticmethod
+    def _fetch(resource_api: object, namespace: str, label_selector: str, resource_version: str) -> tuple:
+        """Fetches the changes of a collection since resource_version (runs on a worker thread, no database access)
+
+        Returns:
+            ("delta", resourceVersion, [(event type, raw object)]) or, if there is no usable resourceVersion,
+            ("list", resourceVersion, [raw object])
+        """
+        if resource_version:
+            events = []
+            watcher = k8s_watch.Watch()
+            try:
+                for event in watcher.stream(
+                    resource_api.get,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=CATALOG_WATCH_TIMEOUT_SEC,
+                    query_params=[("allowWatchBookmarks", "true")],
+                    serialize=False,
+                    _request_timeout=(30, CATALOG_WATCH_IDLE_SEC),
+                ):
+                    raw = event["raw_object"]
+                    # a bookmark advances the resourceVersion of a collection that did not change
+                    resource_version = raw.get("metadata", {}).get("resourceVersion") or resource_version
+                    if event["type"] != "BOOKMARK":
+                        events.append((event["type"], raw))
+                return "delta", resource_version, events
+            except urllib3.exceptions.ReadTimeoutError:
+                # the server replays all events since resource_version at once, so an idle watch means caught up
+                return "delta", resource_version, events
+            except ApiException as e:
+                if e.status != HTTP_GONE:
+                    raise
+                log.info(f"catalog: resourceVersion {resource_version} of {resource_api.kind} (namespace={namespace}) expired, re-listing")
+
+        items = []
+        list_resource_version = None
+        continue_token = None
+        while True:
+            page = resource_api.get(namespace=namespace, label_selector=label_selector, limit=DEFAULT_LIST_PAGE_SIZE, _continue=continue_token, serializer=lambda _, page: page)
+            metadata = page.get("metadata") or {}
+            list_resource_version = list_resource_version or metadata.get("resourceVersion")
+            items.extend(page.get("items") or [])
+            continue_token = metadata.get("continue")
+            if not continue_token:
+                return "list", list_resource_version, items
+
+    def sync(self, namespaces: list[str], oadp_namespace: str = None, max_workers: int = DEFAULT_CATALOG_SYNC_MAX_WORKERS) -> list[dict]:
+        """Brings the catalog up to date with the cluster
+
+        The changes of all collections are fetched in parallel and written one collection per transaction, so a
+        collection that fails to sync keeps its previous (consistent) content and resourceVersion.
+
+        Args:
+            namespaces: CPD operator namespaces whose Backups are catalogued
+            oadp_namespace: OADP namespace whose Velero tenant backups are catalogued (None to skip them)
+            max_workers: number of collections fetched in parallel
+
+        Returns:
+            List of {"kind", "namespace", "mode", "changes", "objects", "error"} per collection
+        """
+        kube = KubeClientContext.get()
+        collections = [(kind, resource, ns, None) for ns in namespaces for kind, resource in CATALOG_TP_KINDS.items()]
+        if oadp_namespace:
+            collections.append((CATALOG_KIND_VELERO_BACKUP, RESOURCE_VELERO_BACKUP, oadp_namespace, f"{LABEL_TENANT_BACKUP_VENDOR}=trident-protect"))
+        stored = {(kind, ns): rv for kind, ns, rv in self.db.execute("SELECT kind, namespace, resource_version FROM collections")}
+
+        def fetch(collection: tuple):
+            kind, resource, ns, label_selector = collection
+            try:
+                return self._fetch(kube.resource(resource), ns, label_selector, stored.get((kind, ns))), None
+            except Exception as e:
+                log.warning(f"catalog: error syncing {kind} (namespace={ns}): {e}")
+                return None, str(e)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(collections))) as executor:
+            for (kind, _, ns, _), (fetched, error) in zip(collections, executor.map(fetch, collections)):
+                result = {"kind": kind, "namespace": ns, "mode": None, "changes": 0, "objects": None, "error": error}
+                if fetched is not None:
+                    mode, resource_version, changes = fetched
+                    with self.db:
+                        if mode == "list":
+                            self._delete(kind, ns)
+                            for raw in changes:
+                                self._put(kind, ns, raw)
+                        else:
+                            for event_type, raw in changes:
+                                if event_type == "DELETED":
+                                    self._delete(kind, ns, raw["metadata"]["name"])
+                                else:
+                                    self._put(kind, ns, raw)
+                        self.db.execute("INSERT OR REPLACE INTO collections VALUES (?, ?, ?, ?)", (kind, ns, resource_version, time.time()))
+                    result.update(mode=mode, changes=len(changes))
+                result["objects"] = self.db.execute("SELECT COUNT(*) FROM objects WHERE kind = ? AND namespace = ?", (kind, ns)).fetchone()[0]
+                results.append(result)
+        return results
+
+    def synced_at(self, kind: str, namespace: str) -> float:
+        """Returns when a collection was last synced (epoch seconds), None if it never was"""
+        row = self.db.execute("SELECT synced_at FROM collections WHERE kind = ? AND namespace = ?", (kind, namespace)).fetchone()
+        return row[0] if row else None
+
+    def _require_synced(self, kind: str, namespace: str):
+        synced_at = self.synced_at(kind, namespace)
+        if synced_at is None:
+            option = "--oadp_namespace" if kind == CATALOG_KIND_VELERO_BACKUP else "--namespace"
+            raise Exception(f'{kind} objects of namespace "{namespace}" are not in the catalog {self.path}, run `{CMD_CATALOG} {CMD_CATALOG_SYNC} {option} {namespace}` first')
+        log.info(f"catalog: reading {kind} objects of namespace {namespace} synced {int(time.time() - synced_at)}s ago")
+
+    @staticmethod
+    def parse_label_selector(label_selector: str) -> list[tuple]:
+        """Parses an equality/existence label selector into (key, value or None) terms
+
+        Raises:
+            ValueError: If the selector uses set-based or inequality requirements
+        """
+        terms = []
+        for requirement in (label_selector or "").split(","):
+            requirement = requirement.strip()
+            if not requirement:
+                continue
+            key, sep, value = requirement.partition("=")
+            key, value = key.strip(), value.lstrip("=").strip()
+            if key.endswith("!") or re.search(r"[\s()!]", key) or (sep and not re.fullmatch(r"[\w./-]*", value)):
+                raise ValueError(f'label selector requirement "{requirement}" cannot be evaluated by the catalog, only key=value and key are supported')
+            terms.append((key, value if sep else None))
+        return terms
+
+    def objects(self, kind: str, namespace: str, label_selector: str = None) -> list[dict]:
+        """Returns the catalogued objects of a collection matching the label selector, oldest first
+
+        Raises:
+            Exception: If the collection was never synced
+        """
+        self._require_synced(kind, namespace)
+        query = "SELECT body FROM objects o WHERE kind = ? AND namespace = ?"
+        params = [kind, namespace]
+        for key, value in self.parse_label_selector(label_selector):
+            query += " AND EXISTS (SELECT 1 FROM labels l WHERE l.kind = o.kind AND l.namespace = o.namespace AND l.name = o.name AND l.key = ?"
+            params.append(key)
+            if value is not None:
+                query += " AND l.value = ?"
+                params.append(value)
+            query += ")"
+        return [json.loads(body) for body, in self.db.execute(query + " ORDER BY created, name", params)]
+
+    def get(self, kind: str, namespace: str, name: str) -> dict:
+        """Returns a catalogued object, None if it is not in the catalog (or its collection was never synced)"""
+        row = self.db.execute("SELECT body FROM objects WHERE kind = ? AND namespace = ? AND name = ?", (kind, namespace, name)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def tenant_backups(self, backup_name: str) -> list[dict]:
+        """Returns the catalogued Velero tenant backups of a Trident Protect backup"""
+        rows = self.db.execute("SELECT body FROM objects WHERE vendor_backup_name = ? ORDER BY created", (backup_name,))
+        return [json.loads(body) for body, in rows]
+
+    def has_tenant_backups(self) -> bool:
+        """Returns whether the Velero tenant backups of an OADP namespace were ever synced"""
+        return self.db.execute("SELECT 1 FROM collections WHERE kind = ?", (CATALOG_KIND_VELERO_BACKUP,)).fetchone() is not None
+
+    def print_backup_list(self, cr_namespace: str, label_selector: str, output: str = LIST_OUTPUT_TABLE, columns: str = None):
+        """Prints the catalogued Backups of a namespace like `backup list` (default or custom columns)
+
+        When the Velero tenant backups are catalogued too, the names and phases of the tenant backups of each Backup
+        are added as the CATALOG_TENANT_BACKUP_COLUMNS columns.
+        """
+        backups = self.objects(RESOURCE_TP_BACKUP[1], cr_namespace, label_selector)
+        if output == LIST_OUTPUT_NAME:
+            group = RESOURCE_TP_BACKUP[0].split("/")[0]
+            for backup in backups:
+                print(f"backup.{group}/{backup['metadata']['name']}")
+            return
+        jsonpaths = parse_list_columns(columns or DEFAULT_BACKUP_LIST_COLUMNS)
+        rows = [{name: jsonpath_lite(backup, path) for name, path in jsonpaths} for backup in backups]
+        headers = [name for name, _ in jsonpaths]
+        if self.has_tenant_backups():
+            headers.extend(CATALOG_TENANT_BACKUP_COLUMNS)
+            for backup, row in zip(backups, rows):
+                tenant_backups = self.tenant_backups(backup["metadata"]["name"])
+                row[CATALOG_TENANT_BACKUP_COLUMNS[0]] = ",".join(tb["metadata"]["name"] for tb in tenant_backups)
+                row[CATALOG_TENANT_BACKUP_COLUMNS[1]] = ",".join(tb.get("status", {}).get("phase", "") for tb in tenant_backups)
+        if output == LIST_OUTPUT_JSON:
+            print(json.dumps(rows, indent=2))
+            return
+        TridentProtectManager.print_table(headers, [[row[name] for name in headers] for row in rows], cr_namespace)
+
+    def print_backup_report(self, targets: dict, label_selector: str, output: str = LIST_OUTPUT_TABLE):
+        """Prints the `backup report` of the catalogued Backups (see TridentProtectManager.do_backup_report)"""
+        backups = {ns: [project_fields(raw, BACKUP_REPORT_FIELDS) for raw in self.objects(RESOURCE_TP_BACKUP[1], ns, label_selector)] for ns in targets}
+        TridentProtectManager.print_backup_report(targets, backups, output)
+
+
+class CommandDaemon:
+    """Executes subcommands received over a Unix domain socket in one long-lived process
+
+    The kubeconfig, API discovery, connection pool and the successful preflight checks of the process are reused by
+    every request, so a request only costs its own API calls. A request is a single JSON line {"argv": [...]}; the
+    reply is a JSON line {"output": "..."} per line the subcommand prints, followed by {"exit_code": n}.
+    Requests are executed concurrently, one thread each.
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = socket_path
+
+    @staticmethod
+    def default_socket_path() -> str:
+        return os.path.join(get_user_cache_dir(), DAEMON_SOCKET_NAME)
+
+    @staticmethod
+    def validate(args) -> str:
+        """Returns why the daemon cannot execute the parsed arguments, None if it can"""
+        requested = (args.command, getattr(args, "subcommand", None))
+        if requested not in DAEMON_COMMANDS:
+            supported = ", ".join(" ".join(command) for command in DAEMON_COMMANDS)
+            return f'"{" ".join(part for part in requested if part)}" is not supported by the daemon (supported: {supported})'
+        if getattr(args, "no_prompt", True) is False:
+            return "the daemon cannot prompt for confirmation, use --no_prompt"
+        if args.profile or args.profile_trace:
+            return "--profile and --profile_trace are not supported by the daemon"
+        return None
 
-        if getattr(backup, "status") is None:
-            raise AttributeError(f'".status" field not found in Trident Protect backup CR')
-        if getattr(backup.status, hook_results_field) is None:
-            raise AttributeError(f'".status.{hook_results_field}" not found in Trident Protect backup CR')
-        for result in backup.status[hook_results_field]:
-            if getattr(result, "failures") is not None:
-                raise Exception(f"detected {len(result.failures)} failures in {hook_results_field}: {str(result.failures)}")
+    @staticmethod
+    def strip_client_args(argv: list[str]) -> list[str]:
+        """Removes --daemon_socket (and its value) from the command line forwarded to the daemon"""
+        stripped = []
+        skip = False
+        for arg in argv:
+            if skip:
+                skip = False
+            elif arg == "--daemon_socket":
+                skip = True
+            elif not arg.startswith("--daemon_socket="):
+                stripped.append(arg)
+        return stripped
 
-    def check_for_hook_results_failures_in_exechooksrun(self, ehr: object):
-        """Checks for failures in a Trident Protect ExecHooksRun CR
-        Args:
-            ehr (object): Trident Protect ExecHooksRun CR Object to search against for hook results.
-            hook_results_field: Name of the hook results field to check.
+    @staticmethod
+    def send(socket_path: str, argv: list[str]) -> int:
+        """Executes argv in the daemon listening on socket_path, printing its output as it arrives
 
         Raises:
-            AttributeError: If the ehr does not contain the expected results field
-            Exception: If there are any failures in the hook results
+            Exception: If the daemon cannot be reached or closes the connection before replying with an exit code
 
         Returns:
-            None
+            The exit code of the subcommand
         """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            try:
+                conn.connect(socket_path)
+            except OSError as e:
+                raise Exception(f"failed to connect to the daemon at {socket_path} (is `serve` running?): {e}")
+            conn.sendall((json.dumps({"argv": argv}) + "\n").encode("utf-8"))
+            with conn.makefile("r", encoding="utf-8") as reader:
+                for line in reader:
+                    reply = json.loads(line)
+                    if "output" in reply:
+                        sys.stdout.write(reply["output"])
+                        sys.stdout.flush()
+                    if "exit_code" in reply:
+                        return int(reply["exit_code"])
+        raise Exception(f"the daemon at {socket_path} closed the connection before the subcommand completed")
+
+    class ReplyWriter:
+        """File-like object forwarding each printed line to the client as an {"output": ...} message"""
+
+        def __init__(self, wfile) -> None:
+            self.wfile = wfile
+            self.pending = ""
+            self.disconnected = False
+
+        def write(self, data: str) -> int:
+            self.pending += data
+            if "\n" in self.pending:
+                lines, _, self.pending = self.pending.rpartition("\n")
+                self.send({"output": lines + "\n"})
+            return len(data)
+
+        def flush(self):
+            pass
+
+        def send(self, message: dict):
+            # a client that went away must not abort the subcommand (e.g. halfway through creating a backup)
+            if self.disconnected:
+                return
+            try:
+                self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except OSError as e:
+                log.warning(f"daemon: client disconnected, the rest of the output is discarded: {e}")
+                self.disconnected = True
+
+        def close(self, exit_code: int):
+            if self.pending:
+                self.send({"output": self.pending})
+                self.pending = ""
+            self.send({"exit_code": exit_code})
+
+    def execute(self, argv: list[str], output: "CommandDaemon.ReplyWriter") -> int:
+        """Parses and runs argv like main() does, printing to output; returns the exit code"""
+        with ThreadOutputRouter.capture(output):
+            try:
+                args = build_parser().parse_args(argv)
+            except SystemExit as e:
+                return e.code if isinstance(e.code, int) else 2
+            error = self.validate(args) if args.command else "no subcommand was specified"
+            if error:
+                print(TextColor.red(f"Error: {error}"))
+                return 2
+            try:
+                return run_command(args)
+            except Exception as e:
+                print()
+                print(TextColor.red(f"Error: {e}"))
+                return 1
 
-        if getattr(ehr, "status") is None:
-            raise AttributeError(f'".status" field not found in Trident Protect ExecHooksRun CR')
-        if getattr(ehr.status, "matchingContainers") is None:
-            raise AttributeError(f'".status.matchingContainers" field not found in Trident Protect ExecHooksRun CR')
+    def handle(self, rfile, wfile):
+        output = CommandDaemon.ReplyWriter(wfile)
+        try:
+            request = json.loads(rfile.readline() or "{}")
+            argv = request.get("argv")
+            if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+                raise ValueError('expected a JSON object {"argv": [...]}')
+        except ValueError as e:
+            output.write(f"Error: invalid request: {e}\n")
+            output.close(2)
+            return
+        start = time.monotonic()
+        exit_code = self.execute(argv, output)
+        log.info(f"daemon: {argv} exited with {exit_code} in {time.monotonic() - start:.3f}s")
+        output.close(exit_code)
 
-        matchingContainersLen = len(ehr.status.matchingContainers)
-        if matchingContainersLen != 1:
-            raise AttributeError(f'expected ".status.matchingContainers" field of Trident Protect ExecHooksRun CR to be 1, received {matchingContainersLen}: {str(ehr.status.matchingContainers)}')
-        result = ehr.status.matchingContainers[0]
+    def serve(self):
+        """Listens on the socket until interrupted
+
+        Raises:
+            Exception: If another daemon is already listening on the socket
+        """
+        if os.path.exists(self.socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                if probe.connect_ex(self.socket_path) == 0:
+                    raise Exception(f"another daemon is already listening on {self.socket_path}")
+            os.unlink(self.socket_path)
+
+        # warm up once, so that the first request does not pay for them
+        Path.cache_successful_checks()
+        Path.check_oc_installed()
+        Path.check_tridentctl_installed()
+        Path.check_trident_protect_plugin_installed()
+        KubeClientContext.get()
+        ThreadOutputRouter.install("stdout")
+        ThreadOutputRouter.install("stderr")
+
+        daemon = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                daemon.handle(self.rfile, self.wfile)
+
+        # the socket is only accessible by the user running the daemon, who already holds its kubeconfig
+        umask = os.umask(0o077)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(self.socket_path, RequestHandler)
+        finally:
+            os.umask(umask)
+        server.daemon_threads = True
+        print(TextColor.green(f"Serving subcommands on {self.socket_path} (pid {os.getpid()})"))
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
 
-        if getattr(result, "failures") is not None:
-            raise Exception(f"detected {len(result.failures)} failures in ExecHooksRun result: {str(result.failures)}")
 
 def command_install(args):
     print()
@@ -2144,14 +5602,11 @@ def command_install(args):
     arg_exec_hook_timeout = int(args.exec_hook_timeout)
     arg_dry_run = bool(args.dry_run)
     args_label_main_crds = bool(args.label_main_crds)
-
-    print(TextColor.blue("** Checking for installation of OpenShift CLI (oc) in system PATH..."))
-    Path.check_oc_installed()
-    print(TextColor.green("Successfully detected OpenShift CLI (oc) is installed and accessible in the system PATH"))
+    arg_force_conflicts = bool(args.force_conflicts)
 
     try:
         tpm = TridentProtectManager(arg_trident_protect_operator_ns)
-        tpm.do_install(application_name=arg_application_name, cpd_operator_ns=arg_cpd_operator_ns, cpdbr_tenant_service_image_prefix=arg_cpdbr_tenant_service_image_prefix, exec_hook_timeout=arg_exec_hook_timeout, dry_run=arg_dry_run, label_main_crds=args_label_main_crds)
+        tpm.do_install(application_name=arg_application_name, cpd_operator_ns=arg_cpd_operator_ns, cpdbr_tenant_service_image_prefix=arg_cpdbr_tenant_service_image_prefix, exec_hook_timeout=arg_exec_hook_timeout, dry_run=arg_dry_run, label_main_crds=args_label_main_crds, force_conflicts=arg_force_conflicts)
     except Exception as e:
         raise Exception(f"Install failed with error: {e}")
 
@@ -2173,17 +5628,28 @@ def command_upgrade(args):
     
     arg_exec_hook_timeout = int(args.exec_hook_timeout)
     arg_dry_run = bool(args.dry_run)
-
-    print(TextColor.blue("** Checking for installation of OpenShift CLI (oc) in system PATH..."))
-    Path.check_oc_installed()
-    print(TextColor.green("Successfully detected OpenShift CLI (oc) is installed and accessible in the system PATH"))
+    arg_force_conflicts = bool(args.force_conflicts)
 
     try:
         tpm = TridentProtectManager(arg_trident_protect_operator_ns)
-        tpm.do_upgrade(application_name=arg_application_name, cpd_operator_ns=arg_cpd_operator_ns, cpdbr_tenant_service_image_prefix=arg_cpdbr_tenant_service_image_prefix, exec_hook_timeout=arg_exec_hook_timeout, dry_run=arg_dry_run)
+        tpm.do_upgrade(application_name=arg_application_name, cpd_operator_ns=arg_cpd_operator_ns, cpdbr_tenant_service_image_prefix=arg_cpdbr_tenant_service_image_prefix, exec_hook_timeout=arg_exec_hook_timeout, dry_run=arg_dry_run, force_conflicts=arg_force_conflicts)
     except Exception as e:
         raise Exception(f"Upgrade failed with error: {e}")
 
+def command_drift(args):
+    print()
+    print(TextColor.blue("** Checking for ExecHook drift of Cloud Pak for Data Backup & Restore integration with NetApp Trident Protect..."))
+    print()
+
+    arg_application_name = str(args.application_name or "")
+    arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
+    arg_cpd_operator_namespaces = list(args.cpd_operator_ns)
+    arg_cpdbr_tenant_service_image_prefix = str(args.cpdbr_tenant_service_image_prefix)
+    arg_exec_hook_timeout = int(args.exec_hook_timeout)
+
+    tpm = TridentProtectManager(arg_trident_protect_operator_ns)
+    tpm.do_drift(cpd_operator_namespaces=arg_cpd_operator_namespaces, application_name=arg_application_name, cpdbr_tenant_service_image_prefix=arg_cpdbr_tenant_service_image_prefix, exec_hook_timeout=arg_exec_hook_timeout)
+
 def command_uninstall(args):
     print()
     print(TextColor.blue("** Performing uninstallation for Cloud Pak for Data Backup & Restore integration with NetApp Trident Protect..."))
@@ -2235,54 +5701,27 @@ def command_backup_create(args):
     arg_snapshot_completion_timeout = str(args.snapshot_completion_timeout)
     arg_volume_snapshots_created_timeout = str(args.volume_snapshots_created_timeout)
     arg_volume_snapshots_ready_to_use_timeout = str(args.volume_snapshots_ready_to_use_timeout)
+    arg_cr_backend = str(args.cr_backend)
 
     print(TextColor.blue("** Checking for installation of OpenShift CLI (oc) in system PATH..."))
     Path.check_oc_installed()
     print(TextColor.green("Successfully detected OpenShift CLI (oc) is installed and accessible in the system PATH"))
     print()
-    print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
-    Path.check_tridentctl_installed()
-    print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
-    print()
-    print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
-    Path.check_trident_protect_plugin_installed()
-    print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
-    print()
+    if arg_cr_backend == CR_BACKEND_TRIDENTCTL:
+        print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
+        Path.check_tridentctl_installed()
+        print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
+        print()
+        print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
+        Path.check_trident_protect_plugin_installed()
+        print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
+        print()
 
     try:
         tpm = TridentProtectManager(tp_namespace=arg_trident_protect_operator_ns)
         cpdbr = CpdbrManager()
 
-        print()
-        print(TextColor.blue(f"** Checking health of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={arg_cr_namespace}) ..."))
-        cpdbr_tenant_service_deploy = cpdbr.verify_tenant_service_healthy(cpd_operator_ns=arg_cr_namespace)
-        print(TextColor.green(f"Successfully detected healthy {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment"))
-        print()
-
-        print()
-        print(TextColor.blue(f"** Verifying ExecHook CR label selector against {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={arg_cr_namespace}) ..."))
-        try:
-            cpdbr_tenant_service_deploy_image = str(cpdbr_tenant_service_deploy.spec.template.spec.containers[0].image)
-            if cpdbr_tenant_service_deploy_image == "":
-                raise Exception(f"expected .spec.template.spec.containers[0].image of {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} to be a non-empty string")
-        except Exception as ex:
-            raise RuntimeError(f"error getting {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment image: err={ex}")
-        try:
-            exechooks = tpm.get_exechooks(cr_namespace=arg_cr_namespace)
-            log.info(f"ExecHooks: \n\n{exechooks}\n")
-            if len(exechooks.items) == 0:
-                raise Exception("expected exechooks to be a non-empty list, please run cpd-trident-protect.py install command or check with 'oc get exechooks.protect.trident.netapp.io -n $PROJECT_CPD_INST_OPERATORS'")
-            for exechook in exechooks.items:
-                try:
-                    container_image_prefix = str(exechook.spec.matchingCriteria[0].value)
-                except:
-                    raise Exception(f'error parsing container_image_prefix for ExecHook CR "{exechook.metadata.name}"')
-                if not cpdbr_tenant_service_deploy_image.startswith(container_image_prefix):
-                    raise Exception(f'expected .spec.matchingCriteria[0] of ExecHook "{exechook.metadata.name}" to match {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment image "{cpdbr_tenant_service_deploy_image}", received {container_image_prefix} - please update the {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment image or reinstall the ExecHook CR(s) with the proper image prefix')
-        except Exception as ex:
-            raise RuntimeError(f"error verifying ExecHook CRs: {ex}")
-        print(TextColor.green(f"Successfully verified ExecHook CR label selector against {CPDBR_TENANT_SERVICE_DEPLOYMENT_NAME} deployment (namespace={arg_cr_namespace})"))
-        print()
+        tpm.verify_backup_preflight(cpdbr=cpdbr, cr_namespace=arg_cr_namespace)
 
         tpm.do_backup(
             app_vault=arg_appvault_name,
@@ -2298,12 +5737,78 @@ def command_backup_create(args):
             full_backup=arg_full_backup,
             snapshot_completion_timeout=arg_snapshot_completion_timeout,
             volume_snapshots_created_timeout=arg_volume_snapshots_created_timeout,
-            volume_snapshots_ready_to_use_timeout=arg_volume_snapshots_ready_to_use_timeout
+            volume_snapshots_ready_to_use_timeout=arg_volume_snapshots_ready_to_use_timeout,
+            cr_backend=arg_cr_backend
         )
     except Exception as e:
         raise Exception(f"An error occurred during the backup (app_vault={arg_appvault_name}, application={arg_application_name}, backup_name={arg_backup_name}): {e}")
 
 
+def command_backup_create_many(args):
+    print()
+    print(TextColor.blue("** Performing backups of multiple Cloud Pak for Data tenants with NetApp Trident Protect..."))
+    print()
+    print(TextColor.blue("** Received arguments:"))
+    for arg in vars(args):
+        print(f"{arg}: {getattr(args, arg)}")
+    print()
+
+    arg_inventory = str(args.inventory)
+    arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
+    arg_dry_run = bool(args.dry_run)
+    arg_max_workers = int(args.max_workers)
+    arg_max_concurrent_backups = int(args.max_concurrent_backups)
+    arg_cr_backend = str(args.cr_backend)
+    defaults = {key: getattr(args, key) for key in BACKUP_INVENTORY_OPTIONAL_KEYS if key != "backup_name"}
+
+    tenants = BackupOrchestrator.load_inventory(arg_inventory, defaults)
+    KubeClientContext.enable_stores()
+    print(TextColor.green(f"Successfully loaded {len(tenants)} tenant(s) from inventory {arg_inventory}"))
+    print()
+
+    print(TextColor.blue("** Checking for installation of OpenShift CLI (oc) in system PATH..."))
+    Path.check_oc_installed()
+    print(TextColor.green("Successfully detected OpenShift CLI (oc) is installed and accessible in the system PATH"))
+    print()
+    if arg_cr_backend == CR_BACKEND_TRIDENTCTL:
+        print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
+        Path.check_tridentctl_installed()
+        print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
+        print()
+        print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
+        Path.check_trident_protect_plugin_installed()
+        print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
+        print()
+
+    try:
+        orchestrator = BackupOrchestrator(
+            tp_namespace=arg_trident_protect_operator_ns,
+            max_workers=arg_max_workers,
+            max_concurrent_backups=arg_max_concurrent_backups,
+            dry_run=arg_dry_run,
+            cr_backend=arg_cr_backend
+        )
+        print(TextColor.blue(f"** Backing up {len(tenants)} tenant(s) (max_workers={arg_max_workers}, max_concurrent_backups={arg_max_concurrent_backups})..."))
+        print()
+        results = orchestrator.run(tenants)
+    except Exception as e:
+        raise Exception(f"An error occurred during the backups (inventory={arg_inventory}): {e}")
+
+    print(TextColor.blue("** Summary:"))
+    rows = [
+        [r["tenant"]["namespace"], r["tenant"]["application_name"], r["tenant"]["backup_name"], "Failed" if r["error"] else "Completed", f'{r["duration"]:.0f}s']
+        for r in results
+    ]
+    TridentProtectManager.print_table(["NAMESPACE", "APPLICATION", "BACKUP", "RESULT", "DURATION"], rows, "")
+    print()
+
+    failed = [r for r in results if r["error"]]
+    if failed:
+        details = "; ".join(f'{r["tenant"]["namespace"]}/{r["tenant"]["backup_name"]}: {r["error"]}' for r in failed)
+        raise Exception(f"{len(failed)} of {len(results)} tenant backup(s) failed: {details}")
+    print(TextColor.green(f"Successfully completed {len(results)} tenant backup(s)"))
+
+
 def command_restore_create(args):
     print()
     print(TextColor.blue("** Performing restore of Cloud Pak for Data Backup & Restore integration with NetApp Trident Protect..."))
@@ -2315,7 +5820,8 @@ def command_restore_create(args):
 
     arg_restore_name = str(args.restore_name)
     arg_appvault_name = str(args.appvault_name)
-    arg_path = str(args.path)
+    arg_path = str(args.path) if args.path else None
+    arg_backup_name = str(args.backup_name) if args.backup_name else None
     arg_cpd_operator_namespace = str(args.namespace)
     arg_namespace_mappings = str(args.namespace_mappings)
     arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
@@ -2324,26 +5830,33 @@ def command_restore_create(args):
     arg_data_mover_timeout_sec = int(args.data_mover_timeout_sec)
     arg_storageclass_mappings = str(args.storageclass_mappings)
     arg_pvc_bind_timeout_sec = str(args.pvc_bind_timeout_sec)
+    arg_cr_backend = str(args.cr_backend)
 
     print(TextColor.blue("** Checking for installation of OpenShift CLI (oc) in system PATH..."))
     Path.check_oc_installed()
     print(TextColor.green("Successfully detected OpenShift CLI (oc) is installed and accessible in the system PATH"))
     print()
-    print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
-    Path.check_tridentctl_installed()
-    print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
-    print()
-    print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
-    Path.check_trident_protect_plugin_installed()
-    print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
-    print()
+    if arg_cr_backend == CR_BACKEND_TRIDENTCTL:
+        print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
+        Path.check_tridentctl_installed()
+        print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
+        print()
+        print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
+        Path.check_trident_protect_plugin_installed()
+        print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
+        print()
 
     try:
         cpdbr = CpdbrManager()
         tpm = TridentProtectManager(tp_namespace=arg_trident_protect_operator_ns)
-        
+        if arg_backup_name:
+            print(TextColor.blue(f"** Resolving the AppVault path of Backup {arg_backup_name}..."))
+            arg_path = tpm.get_backup_app_archive_path(arg_backup_name, arg_cpd_operator_namespace, arg_appvault_name)
+            print(TextColor.green(f"Using path {arg_path}"))
+            print()
+
         cpdbr.refresh_cpdbr_trident_protect_namespace_mapping_cm(cm_name=DEFAULT_NAMESPACE_MAPPING_CM_NAME, namespace=arg_oadp_namespace,mapping_string=arg_namespace_mappings, dry_run=arg_dry_run)
-        tpm.do_restore_create(app_vault=arg_appvault_name, cr_namespace=arg_cpd_operator_namespace, namespace_mappings=arg_namespace_mappings, app_archive_path=arg_path, restore_name=arg_restore_name, dry_run=arg_dry_run, data_mover_timeout_sec=arg_data_mover_timeout_sec, storageclass_mappings=arg_storageclass_mappings, pvc_bind_timeout_sec=arg_pvc_bind_timeout_sec)
+        tpm.do_restore_create(app_vault=arg_appvault_name, cr_namespace=arg_cpd_operator_namespace, namespace_mappings=arg_namespace_mappings, app_archive_path=arg_path, restore_name=arg_restore_name, dry_run=arg_dry_run, data_mover_timeout_sec=arg_data_mover_timeout_sec, storageclass_mappings=arg_storageclass_mappings, pvc_bind_timeout_sec=arg_pvc_bind_timeout_sec, cr_backend=arg_cr_backend)
     except Exception as e:
         raise Exception(f"An error occurred during the restore (app_vault={arg_appvault_name}, path={arg_path}, restore_name={arg_restore_name}): {e}")
 
@@ -2355,8 +5868,9 @@ def command_backup_status(args):
         print(f"{arg}: {getattr(args, arg)}")
     print()
 
-    arg_backup_name = str(args.backup_name)
-    arg_cpd_operator_namespace = str(args.namespace)
+    arg_backup_names = list(args.backup_name or [])
+    arg_cpd_operator_namespaces = list(args.namespace)
+    arg_label_selector = str(args.selector or "")
     arg_wait = bool(args.wait)
     arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
 
@@ -2375,10 +5889,14 @@ def command_backup_status(args):
 
     try:
         tpm = TridentProtectManager(tp_namespace=arg_trident_protect_operator_ns)
-        tpm.do_backup_status(backup_name=arg_backup_name, cr_namespace=arg_cpd_operator_namespace, wait=arg_wait)
+        if len(arg_backup_names) == 1 and len(arg_cpd_operator_namespaces) == 1 and "/" not in arg_backup_names[0] and not arg_label_selector:
+            tpm.do_backup_status(backup_name=arg_backup_names[0], cr_namespace=arg_cpd_operator_namespaces[0], wait=arg_wait)
+        else:
+            targets = tpm.get_status_targets(arg_backup_names, arg_cpd_operator_namespaces)
+            tpm.do_status_many(kind="Backup", targets=targets, label_selector=arg_label_selector, wait=arg_wait)
 
     except Exception as e:
-        raise Exception(f"An error occurred during the backup status check (backup_name={arg_backup_name}, cr_namespace={arg_cpd_operator_namespace}, wait={arg_wait}): {e}")
+        raise Exception(f"An error occurred during the backup status check (backup_name={arg_backup_names}, cr_namespace={arg_cpd_operator_namespaces}, selector={arg_label_selector}, wait={arg_wait}): {e}")
 
 
 def command_backup_delete(args):
@@ -2393,36 +5911,198 @@ def command_backup_delete(args):
     arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
     arg_oadp_namespace = str(args.oadp_namespace)
     arg_no_prompt = bool(args.no_prompt)
+    arg_cr_backend = str(args.cr_backend)
+    arg_tenant_backup_delete_timeout = int(args.tenant_backup_delete_timeout) or None
 
     print(TextColor.blue("** Checking for installation of OpenShift CLI (oc) in system PATH..."))
     Path.check_oc_installed()
     print(TextColor.green("Successfully detected OpenShift CLI (oc) is installed and accessible in the system PATH"))
     print()
-    print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
-    Path.check_tridentctl_installed()
-    print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
-    print()
-    print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
-    Path.check_trident_protect_plugin_installed()
-    print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
-    print()
+    if arg_cr_backend == CR_BACKEND_TRIDENTCTL:
+        print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
+        Path.check_tridentctl_installed()
+        print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
+        print()
+        print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
+        Path.check_trident_protect_plugin_installed()
+        print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
+        print()
 
     try:
         tpm = TridentProtectManager(tp_namespace=arg_trident_protect_operator_ns)
-        tpm.do_backup_delete(arg_backup_name, arg_cpd_operator_namespace, arg_oadp_namespace, arg_no_prompt)
+        tpm.do_backup_delete(arg_backup_name, arg_cpd_operator_namespace, arg_oadp_namespace, arg_no_prompt, arg_cr_backend, arg_tenant_backup_delete_timeout)
     except Exception as e:
         raise Exception(f"An error occurred during the backup delete (backup_name={arg_backup_name}, cr_namespace={arg_cpd_operator_namespace}): {e}")
 
 
-def command_restore_status(args):
+def command_backup_list(args):
+    arg_cr_namespace = str(args.namespace)
+    arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
+    arg_label_selector = "" if args.all else str(args.selector or LABEL_GENERATED_BY_CPDBR)
+    arg_output = str(args.output)
+    arg_columns = str(args.columns) if args.columns else None
+    arg_catalog = bool(args.catalog)
+
+    try:
+        if arg_catalog:
+            with contextlib.closing(BackupCatalog.open()) as catalog:
+                catalog.print_backup_list(cr_namespace=arg_cr_namespace, label_selector=arg_label_selector, output=arg_output, columns=arg_columns)
+            return
+        tpm = TridentProtectManager(arg_trident_protect_operator_ns)
+        tpm.do_backup_list(cr_namespace=arg_cr_namespace, label_selector=arg_label_selector, output=arg_output, columns=arg_columns)
+    except Exception as e:
+        raise Exception(f"An error occurred while listing backups (cr_namespace={arg_cr_namespace}): {e}")
+
+
+def command_backup_report(args):
+    arg_backup_names = list(args.backup_name or [])
+    arg_cpd_operator_namespaces = list(args.namespace)
+    arg_label_selector = "" if args.all or arg_backup_names else str(args.selector or LABEL_GENERATED_BY_CPDBR)
+    arg_output = str(args.output)
+    arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
+    arg_catalog = bool(args.catalog)
+
+    try:
+        targets = TridentProtectManager.get_status_targets(arg_backup_names, arg_cpd_operator_namespaces)
+        if arg_catalog:
+            with contextlib.closing(BackupCatalog.open()) as catalog:
+                catalog.print_backup_report(targets=targets, label_selector=arg_label_selector, output=arg_output)
+            return
+        tpm = TridentProtectManager(arg_trident_protect_operator_ns)
+        tpm.do_backup_report(targets=targets, label_selector=arg_label_selector, output=arg_output)
+    except Exception as e:
+        raise Exception(f"An error occurred while reporting backups (backup_name={arg_backup_names}, cr_namespace={arg_cpd_operator_namespaces}): {e}")
+
+
+def command_backup_prune(args):
     print()
     print(TextColor.blue("** Received arguments:"))
     for arg in vars(args):
         print(f"{arg}: {getattr(args, arg)}")
     print()
 
-    arg_restore_name = str(args.restore_name)
     arg_cpd_operator_namespace = str(args.namespace)
+    arg_oadp_namespace = str(args.oadp_namespace)
+    arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
+    arg_label_selector = str(args.selector or LABEL_GENERATED_BY_CPDBR)
+    arg_keep_last = int(args.keep_last)
+    arg_keep_daily = int(args.keep_daily)
+    arg_keep_weekly = int(args.keep_weekly)
+    arg_older_than = str(args.older_than) if args.older_than else None
+    arg_max_workers = int(args.max_workers)
+    arg_dry_run = bool(args.dry_run)
+    arg_no_prompt = bool(args.no_prompt)
+    arg_cr_backend = str(args.cr_backend)
+    arg_tenant_backup_delete_timeout = int(args.tenant_backup_delete_timeout) or None
+
+    if arg_cr_backend == CR_BACKEND_TRIDENTCTL and not arg_dry_run:
+        print(TextColor.blue("** Checking for installation of Trident CLI (tridentctl-protect) in system PATH..."))
+        Path.check_tridentctl_installed()
+        print(TextColor.green("Successfully detected Trident CLI (tridentctl-protect) is installed and accessible in the system PATH"))
+        print()
+        print(TextColor.blue("** Checking for installation of Trident Protect CLI plugin ..."))
+        Path.check_trident_protect_plugin_installed()
+        print(TextColor.green("Successfully detected Trident Protect CLI plugin is installed"))
+        print()
+
+    try:
+        pruner = BackupPruner(
+            tp_namespace=arg_trident_protect_operator_ns,
+            cr_namespace=arg_cpd_operator_namespace,
+            oadp_namespace=arg_oadp_namespace,
+            keep_last=arg_keep_last,
+            keep_daily=arg_keep_daily,
+            keep_weekly=arg_keep_weekly,
+            older_than=arg_older_than,
+            label_selector=arg_label_selector,
+            max_workers=arg_max_workers,
+            cr_backend=arg_cr_backend,
+            tenant_backup_delete_timeout=arg_tenant_backup_delete_timeout
+        )
+        print(TextColor.blue("** Computing retention plan..."))
+        entries = pruner.plan()
+        pruner.print_plan(entries)
+        print()
+        pruned = [e for e in entries if e["prune"]]
+        if not pruned:
+            print(TextColor.green("Nothing to prune"))
+            return
+        tenant_backup_count = sum(len(e["tenant_backups"]) for e in pruned)
+        if arg_dry_run:
+            print(TextColor.green(f"Dry run: {len(pruned)} of {len(entries)} Backup CR(s) and {tenant_backup_count} tenant backup(s) would be deleted"))
+            return
+        if not arg_no_prompt:
+            print(TextColor.yellow(f"** WARNING: You are about to delete {len(pruned)} Trident Protect Backup CR(s) and {tenant_backup_count} CPD tenant backup(s) in namespace '{arg_cpd_operator_namespace}'"))
+            if not prompt_user_confirmation("Are you sure you want to prune these backups?"):
+                raise Exception('Operation aborted by user.')
+        results = pruner.apply(entries)
+    except Exception as e:
+        raise Exception(f"An error occurred while pruning backups (cr_namespace={arg_cpd_operator_namespace}): {e}")
+
+    failed = [r for r in results if r["error"]]
+    print(TextColor.blue("** Summary:"))
+    print(f"{len(results) - len(failed)} of {len(results)} backup(s) pruned")
+    if failed:
+        details = "; ".join(f'{r["name"]}: {r["error"]}' for r in failed)
+        raise Exception(f"{len(failed)} of {len(results)} backup(s) could not be pruned: {details}")
+
+
+def command_backup_reconcile(args):
+    arg_cpd_operator_namespaces = list(args.namespace)
+    arg_oadp_namespace = str(args.oadp_namespace)
+    arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
+    arg_output = str(args.output)
+    arg_cleanup = bool(args.cleanup)
+    arg_max_workers = int(args.max_workers)
+    arg_no_prompt = bool(args.no_prompt)
+    arg_cr_backend = str(args.cr_backend)
+    arg_tenant_backup_delete_timeout = int(args.tenant_backup_delete_timeout) or None
+
+    if arg_cleanup and arg_cr_backend == CR_BACKEND_TRIDENTCTL:
+        Path.check_tridentctl_installed()
+        Path.check_trident_protect_plugin_installed()
+
+    try:
+        reconciler = BackupReconciler(
+            tp_namespace=arg_trident_protect_operator_ns,
+            cr_namespaces=arg_cpd_operator_namespaces,
+            oadp_namespace=arg_oadp_namespace,
+            max_workers=arg_max_workers,
+            cr_backend=arg_cr_backend,
+            tenant_backup_delete_timeout=arg_tenant_backup_delete_timeout
+        )
+        entries = reconciler.join()
+        reconciler.print_report(entries, arg_output)
+        orphans = [e for e in entries if e["category"] in (RECONCILE_TP_ONLY, RECONCILE_VELERO_ONLY)]
+        if not arg_cleanup or not orphans:
+            return
+        print()
+        if not arg_no_prompt:
+            print(TextColor.yellow(f"** WARNING: You are about to delete {len(orphans)} orphaned Trident Protect Backup CR(s) and CPD tenant backup(s)"))
+            if not prompt_user_confirmation("Are you sure you want to delete the orphaned backups?"):
+                raise Exception('Operation aborted by user.')
+        results = reconciler.cleanup(entries)
+    except Exception as e:
+        raise Exception(f"An error occurred while reconciling backups (cr_namespace={arg_cpd_operator_namespaces}, oadp_namespace={arg_oadp_namespace}): {e}")
+
+    failed = [r for r in results if r["error"]]
+    print(TextColor.blue("** Summary:"))
+    print(f"{len(results) - len(failed)} of {len(results)} orphan(s) deleted")
+    if failed:
+        details = "; ".join(f'{r["namespace"]}/{r["backup"]} ({r["category"]}): {r["error"]}' for r in failed)
+        raise Exception(f"{len(failed)} of {len(results)} orphan(s) could not be deleted: {details}")
+
+
+def command_restore_status(args):
+    print()
+    print(TextColor.blue("** Received arguments:"))
+    for arg in vars(args):
+        print(f"{arg}: {getattr(args, arg)}")
+    print()
+
+    arg_restore_names = list(args.restore_name or [])
+    arg_cpd_operator_namespaces = list(args.namespace)
+    arg_label_selector = str(args.selector or "")
     arg_wait = bool(args.wait)
     arg_trident_protect_operator_ns = str(args.trident_protect_operator_ns)
 
@@ -2441,10 +6121,52 @@ def command_restore_status(args):
 
     try:
         tpm = TridentProtectManager(tp_namespace=arg_trident_protect_operator_ns)
-        tpm.do_restore_status(restore_name=arg_restore_name, cr_namespace=arg_cpd_operator_namespace, wait=arg_wait)
+        if len(arg_restore_names) == 1 and len(arg_cpd_operator_namespaces) == 1 and "/" not in arg_restore_names[0] and not arg_label_selector:
+            tpm.do_restore_status(restore_name=arg_restore_names[0], cr_namespace=arg_cpd_operator_namespaces[0], wait=arg_wait)
+        else:
+            targets = tpm.get_status_targets(arg_restore_names, arg_cpd_operator_namespaces)
+            tpm.do_status_many(kind="BackupRestore", targets=targets, label_selector=arg_label_selector, wait=arg_wait)
+
+    except Exception as e:
+        raise Exception(f"An error occurred during the restore status check (restore_name={arg_restore_names}, cr_namespace={arg_cpd_operator_namespaces}, selector={arg_label_selector}, wait={arg_wait}): {e}")
+
+
+def command_exporter(args):
+    arg_cpd_operator_namespaces = list(args.namespace)
+    arg_oadp_namespace = str(args.oadp_namespace or "")
+    arg_textfile = str(args.textfile or "")
+    arg_interval = int(args.interval)
+    arg_once = bool(args.once)
 
+    try:
+        exporter = MetricsExporter(arg_cpd_operator_namespaces, arg_oadp_namespace)
+        exporter.start()
+        if not arg_textfile:
+            exporter.serve_http(str(args.address), int(args.port))
+            return
+        print(TextColor.green(f"Writing metrics to {arg_textfile}" + ("" if arg_once else f" every {arg_interval}s")))
+        while True:
+            exporter.write_textfile(arg_textfile)
+            if arg_once:
+                break
+            time.sleep(arg_interval)
+        exporter.stop()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        raise Exception(f"An error occurred in the exporter (cr_namespace={arg_cpd_operator_namespaces}, oadp_namespace={arg_oadp_namespace}): {e}")
+
+
+def command_serve(args):
+    arg_socket = str(args.socket or CommandDaemon.default_socket_path())
+    KubeClientContext.enable_stores()
+
+    try:
+        CommandDaemon(arg_socket).serve()
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
-        raise Exception(f"An error occurred during the restore status check (restore_name={arg_restore_name}, cr_namespace={arg_cpd_operator_namespace}, wait={arg_wait}): {e}")
+        raise Exception(f"An error occurred in the daemon (socket={arg_socket}): {e}")
 
 
 def command_version():
@@ -2471,8 +6193,37 @@ def set_private_registry_location_and_cpdbr_tenant_service_image_prefix(args):
     args.private_registry_location = arg_private_registry_location
     args.cpdbr_tenant_service_image_prefix = arg_cpdbr_tenant_service_image_prefix
 
-def main():
+def command_catalog_sync(args):
+    print()
+    print(TextColor.blue("** Received arguments:"))
+    for arg in vars(args):
+        print(f"{arg}: {getattr(args, arg)}")
+    print()
+
+    arg_cpd_operator_namespaces = list(args.namespace)
+    arg_oadp_namespace = str(args.oadp_namespace) if args.oadp_namespace else None
+    arg_max_workers = int(args.max_workers)
+
+    try:
+        with contextlib.closing(BackupCatalog.open()) as catalog:
+            print(TextColor.blue(f"** Syncing backup catalog {catalog.path}..."))
+            results = catalog.sync(namespaces=arg_cpd_operator_namespaces, oadp_namespace=arg_oadp_namespace, max_workers=arg_max_workers)
+    except Exception as e:
+        raise Exception(f"An error occurred while syncing the backup catalog (cr_namespace={arg_cpd_operator_namespaces}, oadp_namespace={arg_oadp_namespace}): {e}")
+
+    rows = [[r["kind"], r["namespace"], r["mode"] or "-", r["changes"], r["objects"], r["error"] or ""] for r in results]
+    TridentProtectManager.print_table(["KIND", "NAMESPACE", "SYNC", "CHANGES", "OBJECTS", "ERROR"], rows, ", ".join(arg_cpd_operator_namespaces))
+    failed = [r for r in results if r["error"]]
+    if failed:
+        raise Exception(f"{len(failed)} of {len(results)} collection(s) could not be synced, their catalogued objects are left as of the previous sync")
+    print(TextColor.green(f"Successfully synced {len(results)} collection(s)"))
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="cpd-trident-protect", description="Utility script for Cloud Pak for Data Backup & Restore integration with NetApp Trident Protect")
+    parser.add_argument("--profile", action="store_true", help="Set to True to print a breakdown of the time spent in each phase, API call and subprocess when the command exits (default=False)", required=False)
+    parser.add_argument("--daemon_socket", type=str, default="", help="Unix domain socket of a running `serve` daemon to execute the subcommand in, instead of in this process", required=False)
+    parser.add_argument("--profile_trace", type=str, default="", help="file to write the profile to as Chrome trace JSON (chrome://tracing, ui.perfetto.dev); implies --profile", required=False)
     subparsers = parser.add_subparsers(dest="command", help="subcommand to execute")
 
     def non_empty_string(value):
@@ -2491,6 +6242,7 @@ def main():
     parser_install.add_argument("--exec_hook_timeout", type=int, default=DEFAULT_EXEC_HOOK_TIMEOUT, help="max time in minutes an execution hook will be allowed to run (default=60)", required=False)
     parser_install.add_argument("--dry_run", action="store_true", help="Set to True to preview the installation steps without automatically applying them (default=False)", required=False)
     parser_install.add_argument("--label_main_crds", action="store_true", help="Set to True to label main crds for Cloud Pak for Data with icpdsupport/cpdbr=true to be backed up together with trident protect volume backup (default=False)", required=False, default=False)
+    parser_install.add_argument("--force_conflicts", action="store_true", help="Set to True to take ownership of fields managed by other field managers when applying manifests (default=False)", required=False)
 
     parser_upgrade = subparsers.add_parser("upgrade", help="Perform upgrade operations for Cloud Pak for Data Backup & Restore integration with NetApp Trident Protect")
     parser_upgrade.add_argument("--application_name", type=non_empty_string, help="name of the Trident Protect Application CR (required)", required=True)
@@ -2500,6 +6252,15 @@ def main():
     parser_upgrade.add_argument("--cpdbr_tenant_service_image_prefix", type=str, help=f'image prefix of the cpdbr-tenant-service deployment installed in the CPD tenant operator namespace (default="{DEFAULT_CPDBR_TENANT_SERVICE_IMG_PREFIX}")', default=DEFAULT_CPDBR_TENANT_SERVICE_IMG_PREFIX, required=False)
     parser_upgrade.add_argument("--exec_hook_timeout", type=int, default=DEFAULT_EXEC_HOOK_TIMEOUT, help="max time in minutes an execution hook will be allowed to run (default=120)", required=False)
     parser_upgrade.add_argument("--dry_run", action="store_true", help="Set to True to preview the upgrade steps without automatically applying them (default=False)", required=False)
+    parser_upgrade.add_argument("--force_conflicts", action="store_true", help="Set to True to take ownership of fields managed by other field managers when applying manifests (default=False)", required=False)
+
+    parser_drift = subparsers.add_parser("drift", help="Report ExecHooks that are out-of-date with this version, without changing anything")
+    parser_drift.add_argument("--cpd_operator_ns", type=non_empty_string, nargs="+", help="one or more CPD operator namespaces to check (required)", required=True)
+    parser_drift.add_argument("--application_name", type=str, default="", help="name of the Trident Protect Application CR (default: the only Application in each namespace)", required=False)
+    parser_drift.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
+    parser_drift.add_argument("--private_registry_location", type=str, help=f'private registry location (default="{DEFAULT_PRIVATE_REGISTRY_LOCATION}")', default=DEFAULT_PRIVATE_REGISTRY_LOCATION, required=False)
+    parser_drift.add_argument("--cpdbr_tenant_service_image_prefix", type=str, help=f'image prefix of the cpdbr-tenant-service deployment installed in the CPD tenant operator namespace (default="{DEFAULT_CPDBR_TENANT_SERVICE_IMG_PREFIX}")', default=DEFAULT_CPDBR_TENANT_SERVICE_IMG_PREFIX, required=False)
+    parser_drift.add_argument("--exec_hook_timeout", type=int, default=DEFAULT_EXEC_HOOK_TIMEOUT, help=f"ExecHook timeout the hooks were installed with (default={DEFAULT_EXEC_HOOK_TIMEOUT})", required=False)
 
     parser_uninstall = subparsers.add_parser("uninstall", help="Perform installation of Cloud Pak for Data Backup & Restore integration with NetApp Trident Protect")
     parser_uninstall.add_argument("--application_name", type=non_empty_string, help="name of the Trident Protect Application CR to create (required)", required=True)
@@ -2526,10 +6287,30 @@ def main():
     parser_backup_create.add_argument("--snapshot_completion_timeout", type=str, default=DEFAULT_SNAPSHOT_COMPLETION_TIMEOUT, help=f"Timeout for snapshot completion (default={DEFAULT_SNAPSHOT_COMPLETION_TIMEOUT})", required=False)
     parser_backup_create.add_argument("--volume_snapshots_created_timeout", type=str, default=DEFAULT_VOLUME_SNAPSHOTS_CREATED_TIMEOUT, help=f"Timeout for volume snapshots to be created (default={DEFAULT_VOLUME_SNAPSHOTS_CREATED_TIMEOUT})", required=False)
     parser_backup_create.add_argument("--volume_snapshots_ready_to_use_timeout", type=str, default=DEFAULT_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT, help=f"Timeout for volume snapshots to be ready to use (default={DEFAULT_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT})", required=False)
+    parser_backup_create.add_argument("--cr_backend", type=str, choices=[CR_BACKEND_TRIDENTCTL, CR_BACKEND_NATIVE], default=CR_BACKEND_TRIDENTCTL, help=f'backend used to create/delete Trident Protect CRs: "{CR_BACKEND_TRIDENTCTL}" runs tridentctl-protect, "{CR_BACKEND_NATIVE}" submits the CRs directly through the Kubernetes API (default="{CR_BACKEND_TRIDENTCTL}")', required=False)
+
+    parser_backup_create_many = subparsers_backup.add_parser("create-many", help="Back up many CPD tenants in parallel from an inventory file")
+    parser_backup_create_many.add_argument("--inventory", type=non_empty_string, help="YAML or JSON file listing the tenants to back up: a list of mappings with namespace, application_name, appvault_name and optionally backup_name or any other backup create option, or a mapping with such a `tenants` list and `defaults` (required)", required=True)
+    parser_backup_create_many.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
+    parser_backup_create_many.add_argument("--max_workers", type=int, default=DEFAULT_CREATE_MANY_MAX_WORKERS, help=f"number of tenants processed in parallel (default={DEFAULT_CREATE_MANY_MAX_WORKERS})", required=False)
+    parser_backup_create_many.add_argument("--max_concurrent_backups", type=int, default=DEFAULT_CREATE_MANY_MAX_CONCURRENT_BACKUPS, help=f"max number of Backups running at once across all tenants (default={DEFAULT_CREATE_MANY_MAX_CONCURRENT_BACKUPS})", required=False)
+    parser_backup_create_many.add_argument("--dry_run", action="store_true", help="Set to True to preview the backup steps without automatically applying them (default=False)", required=False)
+    parser_backup_create_many.add_argument("--data_mover", type=str, default="", help="Data mover for the backups Kopia/Restic", required=False)
+    parser_backup_create_many.add_argument("--pvc_bind_timeout_sec", type=str, default="", help="timeout in seconds for PVC binding (negative values means a TP system default is used) (default -1)", required=False)
+    parser_backup_create_many.add_argument("--reclaim_policy", type=str, default="", help="Reclaim policy", required=False)
+    parser_backup_create_many.add_argument("--snapshot", type=str, default="", help="Snapshot to backup from", required=False)
+    parser_backup_create_many.add_argument("--data_mover_timeout_sec", type=int, default=3600, help="Data mover timeout for Trident Protect volume backups, in seconds (default=3600)", required=False)
+    parser_backup_create_many.add_argument("--full_backup", type=bool, default=False, help="Specify whether the backups should be non-incremental (default=False)", required=False)
+    parser_backup_create_many.add_argument("--snapshot_completion_timeout", type=str, default=DEFAULT_SNAPSHOT_COMPLETION_TIMEOUT, help=f"Timeout for snapshot completion (default={DEFAULT_SNAPSHOT_COMPLETION_TIMEOUT})", required=False)
+    parser_backup_create_many.add_argument("--volume_snapshots_created_timeout", type=str, default=DEFAULT_VOLUME_SNAPSHOTS_CREATED_TIMEOUT, help=f"Timeout for volume snapshots to be created (default={DEFAULT_VOLUME_SNAPSHOTS_CREATED_TIMEOUT})", required=False)
+    parser_backup_create_many.add_argument("--volume_snapshots_ready_to_use_timeout", type=str, default=DEFAULT_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT, help=f"Timeout for volume snapshots to be ready to use (default={DEFAULT_VOLUME_SNAPSHOTS_READY_TO_USE_TIMEOUT})", required=False)
+    parser_backup_create_many.add_argument("--cr_backend", type=str, choices=[CR_BACKEND_TRIDENTCTL, CR_BACKEND_NATIVE], default=CR_BACKEND_TRIDENTCTL, help=f'backend used to create/delete Trident Protect CRs: "{CR_BACKEND_TRIDENTCTL}" runs tridentctl-protect, "{CR_BACKEND_NATIVE}" submits the CRs directly through the Kubernetes API (default="{CR_BACKEND_TRIDENTCTL}")', required=False)
 
     parser_backup_status = subparsers_backup.add_parser("status", help="Check the status of a backup operation")
-    parser_backup_status.add_argument("--backup_name", type=non_empty_string, help="name of the Trident Protect Backup CR (required)", required=True)
-    parser_backup_status.add_argument("--namespace", type=non_empty_string, help="CPD tenant operator namespace (required)", required=True)
+    parser_backup_status_target = parser_backup_status.add_mutually_exclusive_group(required=True)
+    parser_backup_status_target.add_argument("--backup_name", type=non_empty_string, nargs="+", help="names of the Trident Protect Backup CRs, as <name> or <namespace>/<name> (one of --backup_name or --selector is required)")
+    parser_backup_status_target.add_argument("--selector", type=non_empty_string, help="label selector of the Backup CRs to check, e.g. icpdsupport/generated-by-cpdbr=true")
+    parser_backup_status.add_argument("--namespace", type=non_empty_string, nargs="+", help="one or more CPD tenant operator namespaces (required)", required=True)
     parser_backup_status.add_argument("--wait", action="store_true", help="Set to True to wait for the Backup CR to finish (default=False)", required=False)
     parser_backup_status.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
 
@@ -2539,6 +6320,52 @@ def main():
     parser_backup_delete.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
     parser_backup_delete.add_argument("--oadp_namespace", type=str, help="OADP operator namespace", required=True)
     parser_backup_delete.add_argument("--no-prompt", action="store_true", help="Skip confirmation prompts (defult=False)", required=False, default=False)
+    parser_backup_delete.add_argument("--cr_backend", type=str, choices=[CR_BACKEND_TRIDENTCTL, CR_BACKEND_NATIVE], default=CR_BACKEND_TRIDENTCTL, help=f'backend used to create/delete Trident Protect CRs: "{CR_BACKEND_TRIDENTCTL}" runs tridentctl-protect, "{CR_BACKEND_NATIVE}" submits the CRs directly through the Kubernetes API (default="{CR_BACKEND_TRIDENTCTL}")', required=False)
+    parser_backup_delete.add_argument("--tenant_backup_delete_timeout", type=int, default=DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC, help=f"max time in seconds the CPD tenant backup deletion may run in the cpdbr-tenant-service pod, 0 for no limit (default={DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC})", required=False)
+
+    parser_backup_list = subparsers_backup.add_parser("list", help="List backups")
+    parser_backup_list.add_argument("--namespace", type=non_empty_string, help="CPD tenant operator namespace (required)", required=True)
+    parser_backup_list.add_argument("--selector", type=str, default="", help=f'label selector of the Backup CRs to list (default="{LABEL_GENERATED_BY_CPDBR}")', required=False)
+    parser_backup_list.add_argument("--all", action="store_true", help="Set to True to list all Backup CRs, including ones not created by this tool (default=False)", required=False)
+    parser_backup_list.add_argument("--output", type=str, choices=[LIST_OUTPUT_TABLE, LIST_OUTPUT_WIDE, LIST_OUTPUT_NAME, LIST_OUTPUT_JSON], default=LIST_OUTPUT_TABLE, help=f'output format (default="{LIST_OUTPUT_TABLE}")', required=False)
+    parser_backup_list.add_argument("--columns", type=str, default="", help=f'custom columns as NAME=JSONPath pairs separated by commas, e.g. "{DEFAULT_BACKUP_LIST_COLUMNS}"', required=False)
+    parser_backup_list.add_argument("--catalog", action="store_true", help=f"Set to True to read the Backup CRs from the local backup catalog (see `{CMD_CATALOG} {CMD_CATALOG_SYNC}`) instead of the API server, with their tenant backups when the OADP namespace is catalogued (default=False)", required=False)
+    parser_backup_list.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
+
+    parser_backup_report = subparsers_backup.add_parser("report", help="Report the phase durations of backups and their percentiles")
+    parser_backup_report.add_argument("--namespace", type=non_empty_string, nargs="+", help="one or more CPD tenant operator namespaces (required)", required=True)
+    parser_backup_report.add_argument("--backup_name", type=non_empty_string, nargs="+", help="names of the Backup CRs to report, as <name> or <namespace>/<name> (default: all Backup CRs matching --selector)", required=False)
+    parser_backup_report.add_argument("--selector", type=str, default="", help=f'label selector of the Backup CRs to report (default="{LABEL_GENERATED_BY_CPDBR}")', required=False)
+    parser_backup_report.add_argument("--all", action="store_true", help="Set to True to report all Backup CRs, including ones not created by this tool (default=False)", required=False)
+    parser_backup_report.add_argument("--output", type=str, choices=[LIST_OUTPUT_TABLE, LIST_OUTPUT_JSON], default=LIST_OUTPUT_TABLE, help=f'output format (default="{LIST_OUTPUT_TABLE}")', required=False)
+    parser_backup_report.add_argument("--catalog", action="store_true", help=f"Set to True to read the Backup CRs from the local backup catalog (see `{CMD_CATALOG} {CMD_CATALOG_SYNC}`) instead of the API server (default=False)", required=False)
+    parser_backup_report.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
+
+    parser_backup_prune = subparsers_backup.add_parser("prune", help="Delete backups (and their tenant backups) according to a retention policy")
+    parser_backup_prune.add_argument("--namespace", type=non_empty_string, help="CPD tenant operator namespace (required)", required=True)
+    parser_backup_prune.add_argument("--oadp_namespace", type=non_empty_string, help="OADP operator namespace (required)", required=True)
+    parser_backup_prune.add_argument("--keep_last", type=int, default=0, help="keep the N most recent Completed backups (default=0)", required=False)
+    parser_backup_prune.add_argument("--keep_daily", type=int, default=0, help="keep the most recent Completed backup of each of the last N days that have one (default=0)", required=False)
+    parser_backup_prune.add_argument("--keep_weekly", type=int, default=0, help="keep the most recent Completed backup of each of the last N ISO weeks that have one (default=0)", required=False)
+    parser_backup_prune.add_argument("--older_than", type=str, default=None, help="only prune backups older than this age, e.g. 12h, 30d or 4w (default: no age limit)", required=False)
+    parser_backup_prune.add_argument("--selector", type=str, default="", help=f'label selector of the Backup CRs considered (default="{LABEL_GENERATED_BY_CPDBR}")', required=False)
+    parser_backup_prune.add_argument("--max_workers", type=int, default=DEFAULT_PRUNE_MAX_WORKERS, help=f"number of Backup CRs deleted in parallel (default={DEFAULT_PRUNE_MAX_WORKERS})", required=False)
+    parser_backup_prune.add_argument("--dry_run", action="store_true", help="Set to True to only print the retention plan (default=False)", required=False)
+    parser_backup_prune.add_argument("--no-prompt", action="store_true", help="Skip the confirmation prompt (default=False)", required=False, default=False)
+    parser_backup_prune.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
+    parser_backup_prune.add_argument("--cr_backend", type=str, choices=[CR_BACKEND_TRIDENTCTL, CR_BACKEND_NATIVE], default=CR_BACKEND_TRIDENTCTL, help=f'backend used to delete Trident Protect CRs: "{CR_BACKEND_TRIDENTCTL}" runs tridentctl-protect, "{CR_BACKEND_NATIVE}" deletes the CRs directly through the Kubernetes API (default="{CR_BACKEND_TRIDENTCTL}")', required=False)
+    parser_backup_prune.add_argument("--tenant_backup_delete_timeout", type=int, default=DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC, help=f"max time in seconds each CPD tenant backup deletion may run in the cpdbr-tenant-service pod, 0 for no limit (default={DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC})", required=False)
+
+    parser_backup_reconcile = subparsers_backup.add_parser("reconcile", help="Report (and optionally delete) backups whose Trident Protect Backup CR and CPD tenant backup are out of sync")
+    parser_backup_reconcile.add_argument("--namespace", type=non_empty_string, nargs="+", help=f"CPD tenant operator namespaces; tenant backups of unlisted tenants are reported as {RECONCILE_VELERO_UNKNOWN_TENANT} and never cleaned up (required)", required=True)
+    parser_backup_reconcile.add_argument("--oadp_namespace", type=non_empty_string, help="OADP operator namespace (required)", required=True)
+    parser_backup_reconcile.add_argument("--output", type=str, choices=[LIST_OUTPUT_TABLE, LIST_OUTPUT_JSON], default=LIST_OUTPUT_TABLE, help=f'output format (default="{LIST_OUTPUT_TABLE}")', required=False)
+    parser_backup_reconcile.add_argument("--cleanup", action="store_true", help=f"Set to True to delete the {RECONCILE_TP_ONLY} Backup CRs and {RECONCILE_VELERO_ONLY} tenant backups (default=False)", required=False)
+    parser_backup_reconcile.add_argument("--max_workers", type=int, default=DEFAULT_PRUNE_MAX_WORKERS, help=f"number of Backup CRs deleted in parallel (default={DEFAULT_PRUNE_MAX_WORKERS})", required=False)
+    parser_backup_reconcile.add_argument("--no-prompt", action="store_true", help="Skip the confirmation prompt (default=False)", required=False, default=False)
+    parser_backup_reconcile.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
+    parser_backup_reconcile.add_argument("--cr_backend", type=str, choices=[CR_BACKEND_TRIDENTCTL, CR_BACKEND_NATIVE], default=CR_BACKEND_TRIDENTCTL, help=f'backend used to delete Trident Protect CRs: "{CR_BACKEND_TRIDENTCTL}" runs tridentctl-protect, "{CR_BACKEND_NATIVE}" deletes the CRs directly through the Kubernetes API (default="{CR_BACKEND_TRIDENTCTL}")', required=False)
+    parser_backup_reconcile.add_argument("--tenant_backup_delete_timeout", type=int, default=DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC, help=f"max time in seconds each CPD tenant backup deletion may run in the cpdbr-tenant-service pod, 0 for no limit (default={DEFAULT_TENANT_BACKUP_DELETE_TIMEOUT_SEC})", required=False)
 
     parser_restore = subparsers.add_parser("restore", help="Perform restore of Cloud Pak for Data Backup & Restore via NetApp Trident Protect")
     subparsers_restore = parser_restore.add_subparsers(dest="subcommand", required=True)
@@ -2547,7 +6374,9 @@ def main():
     parser_restore_create.add_argument("--restore_name", type=non_empty_string, help="name to give the Trident Protect BackupRestore CR (required)", required=True)
     parser_restore_create.add_argument("--appvault_name", type=non_empty_string, help="name of the Trident Protect AppVault to use for the backup (required)", required=True)
     parser_restore_create.add_argument("--namespace_mappings", type=non_empty_string, help="namespace mappings to use for the Trident BackupRestore CR - to use the existing CPD namespaces from the backup without changing them, use <cpd-op-ns>:<cpd-op-ns>,<cpd-inst-ns>:<cpd-inst-ns> (required)", required=True)
-    parser_restore_create.add_argument("--path", type=non_empty_string, help="path inside AppVault where the backup contents are stored (required)", required=True)
+    parser_restore_create_source = parser_restore_create.add_mutually_exclusive_group(required=True)
+    parser_restore_create_source.add_argument("--path", type=non_empty_string, help="path inside AppVault where the backup contents are stored (one of --path or --backup_name is required)")
+    parser_restore_create_source.add_argument("--backup_name", type=non_empty_string, help="name of the Completed Backup CR in --namespace to restore, its path is read from the Backup CR")
     parser_restore_create.add_argument("--namespace", type=non_empty_string, help="CPD tenant operator namespace (required)", required=True)
     parser_restore_create.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
     parser_restore_create.add_argument("--oadp_namespace", type=str, help="OADP operator namespace", required=True)
@@ -2555,15 +6384,118 @@ def main():
     parser_restore_create.add_argument("--data_mover_timeout_sec", type=int, default=3600, help="Data mover timeout for Trident Protect volume restores, in seconds (default=3600)", required=False)
     parser_restore_create.add_argument("--storageclass_mappings", type=str, default="", help="storage class mappings to use for the Trident Protect BackupRestore CR", required=False)
     parser_restore_create.add_argument("--pvc_bind_timeout_sec", type=str, default="", help="timeout in seconds for PVC binding (negative values means a TP system default is used) (default -1)", required=False)
+    parser_restore_create.add_argument("--cr_backend", type=str, choices=[CR_BACKEND_TRIDENTCTL, CR_BACKEND_NATIVE], default=CR_BACKEND_TRIDENTCTL, help=f'backend used to create/delete Trident Protect CRs: "{CR_BACKEND_TRIDENTCTL}" runs tridentctl-protect, "{CR_BACKEND_NATIVE}" submits the CRs directly through the Kubernetes API (default="{CR_BACKEND_TRIDENTCTL}")', required=False)
 
     parser_restore_status = subparsers_restore.add_parser("status", help="Check the status of a restore operation")
-    parser_restore_status.add_argument("--restore_name", type=non_empty_string, help="name of the Trident Protect BackupRestore CR (required)", required=True)
-    parser_restore_status.add_argument("--namespace", type=non_empty_string, help="CPD tenant operator namespace (required)", required=True)
+    parser_restore_status_target = parser_restore_status.add_mutually_exclusive_group(required=True)
+    parser_restore_status_target.add_argument("--restore_name", type=non_empty_string, nargs="+", help="names of the Trident Protect BackupRestore CRs, as <name> or <namespace>/<name>; the post-restore ExecHooksRun is only validated for a single name (one of --restore_name or --selector is required)")
+    parser_restore_status_target.add_argument("--selector", type=non_empty_string, help="label selector of the BackupRestore CRs to check")
+    parser_restore_status.add_argument("--namespace", type=non_empty_string, nargs="+", help="one or more CPD tenant operator namespaces (required)", required=True)
     parser_restore_status.add_argument("--wait", action="store_true", help="Set to True to wait for the BackupRestore CR to finish (default=False)", required=False)
     parser_restore_status.add_argument("--trident_protect_operator_ns", type=str, default=DEFAULT_TRIDENT_PROTECT_NS, help="namespace of the Trident Protect operator", required=False)
 
+    parser_exporter = subparsers.add_parser("exporter", help="Export the backup and restore state of CPD tenants as OpenMetrics for Prometheus")
+    parser_exporter.add_argument("--namespace", type=non_empty_string, nargs="+", help="one or more CPD tenant operator namespaces (required)", required=True)
+    parser_exporter.add_argument("--oadp_namespace", type=str, default="", help="OADP operator namespace; set to also export whether the Velero tenant backup of the last successful backup is Completed", required=False)
+    parser_exporter.add_argument("--address", type=str, default="", help="address to serve the metrics on (default: all interfaces)", required=False)
+    parser_exporter.add_argument("--port", type=int, default=DEFAULT_EXPORTER_PORT, help=f"port to serve the metrics on at /metrics (default={DEFAULT_EXPORTER_PORT})", required=False)
+    parser_exporter.add_argument("--textfile", type=str, default="", help="write the metrics to this file (node-exporter textfile collector, *.prom) instead of serving them over HTTP", required=False)
+    parser_exporter.add_argument("--interval", type=int, default=DEFAULT_EXPORTER_TEXTFILE_INTERVAL_SEC, help=f"seconds between two writes of --textfile (default={DEFAULT_EXPORTER_TEXTFILE_INTERVAL_SEC})", required=False)
+    parser_exporter.add_argument("--once", action="store_true", help="Set to True to write --textfile once and exit (default=False)", required=False)
+
     parser_version = subparsers.add_parser("version", help="Show the version")
 
+    parser_catalog = subparsers.add_parser("catalog", help="Maintain the local backup catalog (SQLite, in the user cache directory) read by --catalog")
+    subparsers_catalog = parser_catalog.add_subparsers(dest="subcommand", required=True)
+
+    parser_catalog_sync = subparsers_catalog.add_parser("sync", help="Bring the catalog up to date incrementally with the Backups and tenant backups of the cluster (a collection unchanged for longer than the compaction window of the API server, minutes by default, is re-listed)")
+    parser_catalog_sync.add_argument("--namespace", type=non_empty_string, nargs="+", help="one or more CPD tenant operator namespaces (required)", required=True)
+    parser_catalog_sync.add_argument("--oadp_namespace", type=str, default="", help="OADP operator namespace whose CPD tenant backups are catalogued (default: none)", required=False)
+    parser_catalog_sync.add_argument("--max_workers", type=int, default=DEFAULT_CATALOG_SYNC_MAX_WORKERS, help=f"number of collections synced in parallel (default={DEFAULT_CATALOG_SYNC_MAX_WORKERS})", required=False)
+
+    parser_serve = subparsers.add_parser("serve", help="Run as a long-lived daemon executing subcommands received over a Unix domain socket (see --daemon_socket)")
+    parser_serve.add_argument("--socket", type=str, default="", help="path of the Unix domain socket to listen on (default: daemon.sock in the user cache directory)", required=False)
+
+    return parser
+
+
+def run_command(args) -> int:
+    """Executes the subcommand of parsed arguments
+
+    Raises:
+        Exception: If the subcommand fails
+
+    Returns:
+        The exit code of the subcommand
+    """
+    if args.command == CMD_INSTALL:
+        set_private_registry_location_and_cpdbr_tenant_service_image_prefix(args)
+        command_install(args)
+        return 0
+
+    elif args.command == CMD_UPGRADE:
+        set_private_registry_location_and_cpdbr_tenant_service_image_prefix(args)
+        command_upgrade(args)
+        return 0
+
+    elif args.command == CMD_DRIFT:
+        set_private_registry_location_and_cpdbr_tenant_service_image_prefix(args)
+        command_drift(args)
+        return 0
+
+    elif args.command == CMD_UNINSTALL:
+        command_uninstall(args)
+        return 0
+
+    elif args.command == CMD_BACKUP:
+        if args.subcommand == CMD_BACKUP_CREATE:
+            command_backup_create(args)
+        elif args.subcommand == CMD_BACKUP_CREATE_MANY:
+            command_backup_create_many(args)
+        elif args.subcommand == CMD_BACKUP_STATUS:
+            command_backup_status(args)
+        elif args.subcommand == CMD_BACKUP_DELETE:
+            command_backup_delete(args)
+        elif args.subcommand == CMD_BACKUP_LIST:
+            command_backup_list(args)
+        elif args.subcommand == CMD_BACKUP_REPORT:
+            command_backup_report(args)
+        elif args.subcommand == CMD_BACKUP_PRUNE:
+            command_backup_prune(args)
+        elif args.subcommand == CMD_BACKUP_RECONCILE:
+            command_backup_reconcile(args)
+        return 0
+
+    elif args.command == CMD_RESTORE:
+        if args.subcommand == CMD_RESTORE_CREATE:
+            command_restore_create(args)
+        elif args.subcommand == CMD_RESTORE_STATUS:
+            command_restore_status(args)
+        return 0
+
+    elif args.command == CMD_EXPORTER:
+        command_exporter(args)
+        return 0
+
+    elif args.command == CMD_CATALOG:
+        if args.subcommand == CMD_CATALOG_SYNC:
+            command_catalog_sync(args)
+        return 0
+
+    elif args.command == CMD_SERVE:
+        command_serve(args)
+        return 0
+
+    elif args.command == CMD_VERSION:
+        command_version()
+        return 0
+
+    return 0
+
+
+def main():
+    parser = build_parser()
+
     try:
         args = parser.parse_args()
 
@@ -2571,47 +6503,25 @@ def main():
             print(TextColor.red(f"Error: no subcommand was specified. Use --help for additional information."))
             sys.exit(1)
 
-        elif args.command == CMD_INSTALL:
-            set_private_registry_location_and_cpdbr_tenant_service_image_prefix(args)
-            command_install(args)
-            sys.exit(0)
-
-        elif args.command == CMD_UPGRADE:
-            set_private_registry_location_and_cpdbr_tenant_service_image_prefix(args)
-            command_upgrade(args)
-            sys.exit(0)
-
-        elif args.command == CMD_UNINSTALL:
-            command_uninstall(args)
-            sys.exit(0)
-
-        elif args.command == CMD_BACKUP:
-            if args.subcommand == CMD_BACKUP_CREATE:
-                command_backup_create(args)
-                sys.exit(0)
-            if args.subcommand == CMD_BACKUP_STATUS:
-                command_backup_status(args)
-                sys.exit(0)
-            if args.subcommand == CMD_BACKUP_DELETE:
-                command_backup_delete(args)
-                sys.exit(0)
-            sys.exit(0)
+        if args.daemon_socket:
+            error = CommandDaemon.validate(args)
+            if error:
+                raise Exception(error)
+            sys.exit(CommandDaemon.send(args.daemon_socket, CommandDaemon.strip_client_args(sys.argv[1:])))
 
-        elif args.command == CMD_RESTORE:
-            if args.subcommand == CMD_RESTORE_CREATE:
-                command_restore_create(args)
-                sys.exit(0)
-            if args.subcommand == CMD_RESTORE_STATUS:
-                command_restore_status(args)
-                sys.exit(0)
-            sys.exit(0)
+        if args.profile or args.profile_trace:
+            Profiler.enable()
+            command = " ".join(str(part) for part in (args.command, getattr(args, "subcommand", None)) if part)
+            atexit.register(Profiler.report, command, args.profile_trace)
 
-        elif args.command == CMD_VERSION:
+        if args.command == CMD_VERSION:
             command_version()
             sys.exit(0)
 
-        else:
-            parser.print_help()
+        _setup_logging()
+        _load_cluster_modules()
+
+        sys.exit(run_command(args))
 
     except Exception as e:
         print()
@@ -2619,8 +6529,6 @@ def main():
         print(TextColor.red(err_msg))
         sys.exit(1)
 
-    sys.exit(0)
-
 
 if __name__ == "__main__":
     main()